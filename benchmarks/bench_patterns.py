@@ -0,0 +1,72 @@
+"""
+Benchmark of the compiled pattern matcher against per-pattern fnmatch calls.
+
+Usage:
+    python benchmarks/bench_patterns.py [number_of_paths]
+"""
+
+import fnmatch
+import random
+import sys
+import time
+
+from py_zerobyte.patterns import PatternSet
+
+
+PATTERNS = [
+    "*.tmp", "*.log", "*.swp", "*~", ".cache", "node_modules", "__pycache__", ".git",
+    "/var/lib/docker", "/proc", "/sys", "/dev", "/tmp", "/home/*/.local/share/Trash",
+    "**/build/**/*.o", "/srv/media/**/*.part", "Thumbs.db", ".DS_Store", "*.iso",
+    "/data/backups/old", "lost+found", "/home/*/Downloads", "*.[oa]", "core.[0-9]*",
+]
+
+NAMES = ["src", "lib", "docs", "build", "media", "photos", "cache", "project", "data", "home"]
+FILES = ["main.py", "index.js", "report.pdf", "image.jpg", "notes.txt", "module.o", "debug.log"]
+
+
+def make_paths(count, seed=0):
+    rng = random.Random(seed)
+    paths = []
+    for _ in range(count):
+        depth = rng.randint(1, 8)
+        parts = [rng.choice(NAMES) + str(rng.randint(0, 20)) for _ in range(depth)]
+        paths.append("/" + "/".join(parts + [rng.choice(FILES)]))
+    return paths
+
+
+def naive_matches(patterns, path):
+    """Test each pattern against the path and every parent with fnmatch."""
+    components = path.split("/")
+    candidates = ["/".join(components[:i]) for i in range(2, len(components) + 1)]
+    for pattern in patterns:
+        for candidate in candidates:
+            if pattern.startswith("/"):
+                if fnmatch.fnmatchcase(candidate, pattern):
+                    return True
+            elif fnmatch.fnmatchcase(candidate, "*/" + pattern):
+                return True
+    return False
+
+
+def measure(label, func, paths):
+    start = time.perf_counter()
+    matched = sum(1 for path in paths if func(path))
+    elapsed = time.perf_counter() - start
+    print(f"{label:<12} {elapsed / len(paths) * 1e6:8.2f} us/path  ({matched} matched)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    paths = make_paths(count)
+    print(f"{len(PATTERNS)} patterns, {count} paths")
+    
+    start = time.perf_counter()
+    compiled = PatternSet(PATTERNS)
+    print(f"compile      {(time.perf_counter() - start) * 1e3:8.2f} ms")
+    
+    measure("PatternSet", compiled.matches, paths)
+    measure("fnmatch", lambda path: naive_matches(PATTERNS, path), paths)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,8 @@ def main():
         username="admin",
         password="your-password"
     )
+    # Fetch the repository list once; per-volume lookups use its indexes
+    client.repositories.use_registry()
     
     print("Backup System Status Report")
     print("="*80)
@@ -28,8 +30,9 @@ def main():
     print(f"Zerobyte Version: {system_info.get('version', 'Unknown')}")
     print()
     
-    # List all volumes
+    # List all volumes, and every backup schedule in one request
     volumes = client.volumes.list()
+    schedules = client.backup_schedules.list_all()
     print(f"Total Volumes: {len(volumes)}\n")
     
     for volume in volumes:
@@ -69,21 +72,18 @@ def main():
             except Exception as e:
                 print(f"      Snapshots: Unable to fetch ({e})")
             
-            # TODO: Backup schedules API needs updates
-            # # List backup schedules for this repository
-            # try:
-            #     schedules = client.backup_schedules.list_all()
-            #     # Filter for this volume
-            #     volume_schedules = [s for s in schedules if s.get('volumeId') == volume_id]
-            #     print(f"      Backup Schedules: {len(volume_schedules)}")
-            #     
-            #     for schedule in volume_schedules:
-            #         status_icon = "✓" if schedule.get('enabled') else "✗"
-            #         print(f"\n        {status_icon} {schedule['name']} (ID: {schedule['id']})")
-            #         print(f"          Schedule: {schedule.get('cronExpression', 'N/A')}")
-            #         print(f"          Enabled: {'Yes' if schedule.get('enabled') else 'No'}")
-            # except Exception as e:
-            #     print(f"      Schedules: Unable to fetch ({e})")
+            # Backup schedules of this repository, from the single fleet-wide listing
+            repo_schedules = [
+                s for s in schedules
+                if s.get('volumeId') == volume_id and s.get('repositoryId') == repo['id']
+            ]
+            print(f"      Backup Schedules: {len(repo_schedules)}")
+            
+            for schedule in repo_schedules:
+                status_icon = "✓" if schedule.get('enabled') else "✗"
+                print(f"\n        {status_icon} {schedule['name']} (ID: {schedule['id']})")
+                print(f"          Schedule: {schedule.get('cronExpression', 'N/A')}")
+                print(f"          Last Backup: {schedule.get('lastBackupStatus') or 'Never'}")
         
         print()
     
@@ -93,9 +93,7 @@ def main():
     print("="*80)
     
     total_repos = 0
-    total_schedules = 0
     total_snapshots = 0
-    enabled_schedules = 0
     
     for volume in volumes:
         volume_id = volume['id']
@@ -110,13 +108,9 @@ def main():
                 total_snapshots += len(snapshots)
             except:
                 pass
-            
-            try:
-                schedules = client.backup_schedules.list(volume_id, repo_id)
-                total_schedules += len(schedules)
-                enabled_schedules += sum(1 for s in schedules if s.get('enabled'))
-            except:
-                pass
+    
+    total_schedules = len(schedules)
+    enabled_schedules = sum(1 for s in schedules if s.get('enabled'))
     
     print(f"Total Volumes: {len(volumes)}")
     print(f"Total Repositories: {total_repos}")
@@ -8,6 +8,27 @@ from .exceptions import (
     NotFoundError,
     ValidationError,
 )
+from .path_index import BloomFilter, SnapshotPathIndex
+from .listing_file import ListingFile, ListingFileWriter, write_listing
+from .file_table import FileTable
+from .aggregators import (
+    DiskUsage,
+    ExtensionHistogram,
+    FileCounter,
+    SizeHistogram,
+    TopK,
+    aggregate,
+)
+from .snapshot_index import SnapshotIndex
+from .retention import RetentionSimulator, simulate_forget
+from .capacity import SnapshotSeries, capacity_report, collect_series
+from .restore import RestorePlanner, verify_restore
+from .mirror import MirrorVerifier
+from .patterns import PathFilter, PatternSet
+from .browser import FilesystemBrowser
+from .registry import RepositoryRegistry
+from .resolver import Resolver
+from .watcher import ScheduleWatcher
 
 __version__ = "1.1.0"
 __all__ = [
@@ -17,4 +38,31 @@ __all__ = [
     "APIError",
     "NotFoundError",
     "ValidationError",
+    "BloomFilter",
+    "SnapshotPathIndex",
+    "ListingFile",
+    "ListingFileWriter",
+    "write_listing",
+    "FileTable",
+    "DiskUsage",
+    "ExtensionHistogram",
+    "FileCounter",
+    "SizeHistogram",
+    "TopK",
+    "aggregate",
+    "SnapshotIndex",
+    "RetentionSimulator",
+    "simulate_forget",
+    "SnapshotSeries",
+    "capacity_report",
+    "collect_series",
+    "RestorePlanner",
+    "verify_restore",
+    "MirrorVerifier",
+    "PathFilter",
+    "PatternSet",
+    "FilesystemBrowser",
+    "RepositoryRegistry",
+    "Resolver",
+    "ScheduleWatcher",
 ]
@@ -0,0 +1,279 @@
+"""Streaming aggregations over snapshot and volume walks.
+
+Every aggregator consumes entries one at a time through ``add`` and keeps
+only a bounded amount of state, so any number of them can share a single
+pass over ``client.snapshots.walk(...)`` or ``client.volumes.walk(...)``
+without materializing the tree.
+
+Example:
+    >>> du, largest, sizes = aggregate(
+    ...     client.volumes.walk(1),
+    ...     DiskUsage(max_depth=2),
+    ...     TopK(20),
+    ...     SizeHistogram()
+    ... )
+"""
+
+import heapq
+import posixpath
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .files import is_directory, normalize_path
+
+
+def _is_file(entry: Dict[str, Any]) -> bool:
+    return entry.get("type") == "file"
+
+
+def _depth(path: str) -> int:
+    return 0 if path == "/" else path.count("/")
+
+
+def _is_within(path: str, directory: str) -> bool:
+    return directory == "/" or path == directory or path.startswith(directory + "/")
+
+
+class FileCounter:
+    """Count files, directories and other entries and total their bytes."""
+    
+    def __init__(self):
+        """Initialize FileCounter."""
+        self.files = 0
+        self.directories = 0
+        self.other = 0
+        self.bytes = 0
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Consume one entry."""
+        if _is_file(entry):
+            self.files += 1
+            self.bytes += entry.get("size") or 0
+        elif is_directory(entry):
+            self.directories += 1
+        else:
+            self.other += 1
+    
+    def result(self) -> Dict[str, int]:
+        """
+        Return the totals.
+        
+        Returns:
+            dict: files, directories, other and bytes
+        """
+        return {
+            "files": self.files,
+            "directories": self.directories,
+            "other": self.other,
+            "bytes": self.bytes,
+        }
+
+
+class DiskUsage:
+    """
+    Per-directory disk usage rollups, like ``du``.
+    
+    Relies on walker order (depth first, each subtree contiguous): only
+    the directories on the current branch are open at any time, and each
+    one is finalized, with its total rolled up into its parent, as soon as
+    the walk leaves it.
+    
+    Args:
+        max_depth: Only report directories at most this many levels deep
+            (``/`` is depth 0). Deeper usage still counts towards ancestors.
+        callback: Called with ``(directory, usage)`` as each directory is
+            finalized. When given, results are not retained, so memory
+            stays bounded by the tree depth.
+    """
+    
+    def __init__(
+        self,
+        max_depth: Optional[int] = None,
+        callback: Optional[Callable[[str, Dict[str, int]], None]] = None
+    ):
+        """Initialize DiskUsage."""
+        self.max_depth = max_depth
+        self.callback = callback
+        self._stack: List[List[Any]] = []
+        self._results: Dict[str, Dict[str, int]] = {}
+    
+    def _close(self) -> None:
+        directory, size, files = self._stack.pop()
+        if self._stack:
+            self._stack[-1][1] += size
+            self._stack[-1][2] += files
+        if self.max_depth is None or _depth(directory) <= self.max_depth:
+            usage = {"size": size, "files": files}
+            if self.callback:
+                self.callback(directory, usage)
+            else:
+                self._results[directory] = usage
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Consume one entry (entries must arrive in walker order)."""
+        parent = posixpath.dirname(normalize_path(entry["path"]))
+        while self._stack and not _is_within(parent, self._stack[-1][0]):
+            self._close()
+        if not self._stack:
+            self._stack.append([parent, 0, 0])
+        while self._stack[-1][0] != parent:
+            top = self._stack[-1][0]
+            remainder = parent[len(top):].lstrip("/")
+            child = posixpath.join(top, remainder.split("/", 1)[0])
+            self._stack.append([child, 0, 0])
+        
+        if _is_file(entry):
+            self._stack[-1][1] += entry.get("size") or 0
+            self._stack[-1][2] += 1
+    
+    def result(self) -> Dict[str, Dict[str, int]]:
+        """
+        Finalize the open directories and return the rollups.
+        
+        Returns:
+            dict: Directory to ``{"size": bytes, "files": count}``, including
+                everything below it (empty when a callback is used)
+        """
+        while self._stack:
+            self._close()
+        return self._results
+
+
+class TopK:
+    """
+    The K largest files, kept in a bounded min-heap.
+    
+    Args:
+        k: Number of files to keep
+    """
+    
+    def __init__(self, k: int = 10):
+        """Initialize TopK."""
+        self.k = k
+        self._heap: List[Tuple[int, str]] = []
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Consume one entry."""
+        if not _is_file(entry):
+            return
+        item = (entry.get("size") or 0, entry["path"])
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+    
+    def result(self) -> List[Dict[str, Any]]:
+        """
+        Return the largest files.
+        
+        Returns:
+            list: ``{"path": ..., "size": ...}`` dicts, largest first
+        """
+        return [
+            {"path": path, "size": size}
+            for size, path in sorted(self._heap, reverse=True)
+        ]
+
+
+class SizeHistogram:
+    """
+    Histogram of file sizes in power-of-two buckets.
+    
+    Bucket ``n`` holds files of size in ``[2 ** (n - 1), 2 ** n)``; bucket 0
+    holds empty files.
+    """
+    
+    def __init__(self):
+        """Initialize SizeHistogram."""
+        self._counts: Dict[int, int] = {}
+        self._bytes: Dict[int, int] = {}
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Consume one entry."""
+        if not _is_file(entry):
+            return
+        size = entry.get("size") or 0
+        bucket = int(size).bit_length()
+        self._counts[bucket] = self._counts.get(bucket, 0) + 1
+        self._bytes[bucket] = self._bytes.get(bucket, 0) + size
+    
+    def result(self) -> List[Dict[str, int]]:
+        """
+        Return the non-empty buckets.
+        
+        Returns:
+            list: ``{"min_size", "max_size", "files", "bytes"}`` dicts in
+                ascending size order (``max_size`` is exclusive)
+        """
+        return [
+            {
+                "min_size": 0 if bucket == 0 else 2 ** (bucket - 1),
+                "max_size": 1 if bucket == 0 else 2 ** bucket,
+                "files": self._counts[bucket],
+                "bytes": self._bytes[bucket],
+            }
+            for bucket in sorted(self._counts)
+        ]
+
+
+class ExtensionHistogram:
+    """
+    File counts and bytes per file extension.
+    
+    Memory grows with the number of distinct extensions, not files; pass
+    ``limit`` to count extensions first seen after that many have been
+    tracked under ``"(other)"``.
+    
+    Args:
+        limit: Maximum number of distinct extensions to track
+    """
+    
+    def __init__(self, limit: Optional[int] = None):
+        """Initialize ExtensionHistogram."""
+        self.limit = limit
+        self._stats: Dict[str, List[int]] = {}
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """Consume one entry."""
+        if not _is_file(entry):
+            return
+        extension = posixpath.splitext(entry.get("name") or entry["path"])[1].lower()
+        if extension not in self._stats and self.limit is not None and len(self._stats) >= self.limit:
+            extension = "(other)"
+        stats = self._stats.setdefault(extension, [0, 0])
+        stats[0] += 1
+        stats[1] += entry.get("size") or 0
+    
+    def result(self) -> List[Dict[str, Any]]:
+        """
+        Return per-extension totals.
+        
+        Returns:
+            list: ``{"extension", "files", "bytes"}`` dicts, largest first.
+                Files without an extension are reported under ``""``.
+        """
+        return sorted(
+            (
+                {"extension": extension, "files": files, "bytes": size}
+                for extension, (files, size) in self._stats.items()
+            ),
+            key=lambda item: item["bytes"],
+            reverse=True
+        )
+
+
+def aggregate(entries: Iterable[Dict[str, Any]], *aggregators: Any) -> Tuple[Any, ...]:
+    """
+    Feed one pass over ``entries`` to every aggregator.
+    
+    Args:
+        entries: Walker output, e.g. ``client.snapshots.walk(...)``
+        *aggregators: Objects with ``add(entry)`` and ``result()``
+    
+    Returns:
+        tuple: Each aggregator's result, in the order given
+    """
+    adders = [aggregator.add for aggregator in aggregators]
+    for entry in entries:
+        for add in adders:
+            add(entry)
+    return tuple(aggregator.result() for aggregator in aggregators)
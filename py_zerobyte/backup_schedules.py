@@ -1,6 +1,14 @@
 """Backup Schedules API methods."""
 
-from typing import Dict, Any, List, Optional
+import heapq
+import posixpath
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, List, Optional, Union
+
+from .exceptions import NotFoundError
+from .files import is_directory, normalize_path
+from .patterns import PathFilter
+from .resolver import invalidate, resolve_id
 
 
 class BackupSchedulesAPI:
@@ -10,13 +18,56 @@ class BackupSchedulesAPI:
         """Initialize BackupSchedulesAPI with client instance."""
         self.client = client
     
-    def list(self, volume_id: int, repository_id: int) -> List[Dict[str, Any]]:
+    def _path(
+        self,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Optional[Union[int, str]] = None,
+        fetch: bool = True
+    ) -> str:
+        """Build a schedule route from IDs or names."""
+        volume_id = resolve_id(self.client, "volumes", volume_id)
+        # Repository IDs and names are both strings, so unless a schedule name has to be
+        # matched within the repository, an unknown reference is sent as is (see _request)
+        schedule_name = schedule_id is not None and not str(schedule_id).isdigit()
+        repository_id = resolve_id(self.client, "repositories", repository_id, fetch=fetch or schedule_name)
+        path = f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules"
+        if schedule_id is not None:
+            # Schedule names are only unique within a volume and repository
+            scope = {"volumeId": volume_id, "repositoryId": repository_id}
+            path += f"/{resolve_id(self.client, 'schedules', schedule_id, scope=scope)}"
+        return path
+    
+    def _request(
+        self,
+        method: str,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Optional[Union[int, str]] = None,
+        suffix: str = "",
+        **kwargs: Any
+    ) -> Any:
+        """Send a request to a schedule route, resolving the repository only if the server answers 404."""
+        path = self._path(volume_id, repository_id, schedule_id, fetch=False)
+        try:
+            return self.client._make_request(method, path + suffix, **kwargs)
+        except NotFoundError:
+            retry = self._path(volume_id, repository_id, schedule_id)
+            if retry == path:
+                raise
+            return self.client._make_request(method, retry + suffix, **kwargs)
+    
+    def _flat_path(self, schedule_id: Union[int, str]) -> str:
+        """Build a flat ``/api/v1/backups`` route from a schedule ID or name."""
+        return f"/api/v1/backups/{resolve_id(self.client, 'schedules', schedule_id)}"
+    
+    def list(self, volume_id: Union[int, str], repository_id: Union[int, str]) -> List[Dict[str, Any]]:
         """
         List all backup schedules for a repository.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
         
         Returns:
             list: List of backup schedules
@@ -26,23 +77,24 @@ class BackupSchedulesAPI:
             >>> for schedule in schedules:
             ...     print(f"{schedule['name']}: {schedule['schedule']}")
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules"
+            volume_id,
+            repository_id
         )
     
     def create(
         self,
-        volume_id: int,
-        repository_id: int,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
         schedule_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Create a new backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
             schedule_data: Schedule configuration including:
                 - name (str): Schedule name
                 - schedule (str): Cron expression for schedule
@@ -74,25 +126,28 @@ class BackupSchedulesAPI:
             ...     }
             ... )
         """
-        return self.client._make_request(
+        response = self._request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules",
+            volume_id,
+            repository_id,
             data=schedule_data
         )
+        invalidate(self.client, "schedules")
+        return response
     
     def get(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Get a specific backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Backup schedule details
@@ -104,25 +159,27 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}"
+            volume_id,
+            repository_id,
+            schedule_id
         )
     
     def update(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str],
         schedule_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Update a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
             schedule_data: Updated schedule configuration
         
         Returns:
@@ -136,25 +193,29 @@ class BackupSchedulesAPI:
             ...     schedule_data={"enabled": False}
             ... )
         """
-        return self.client._make_request(
+        response = self._request(
             "PUT",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}",
+            volume_id,
+            repository_id,
+            schedule_id,
             data=schedule_data
         )
+        invalidate(self.client, "schedules")
+        return response
     
     def delete(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Delete a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Deletion response
@@ -166,17 +227,21 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        response = self._request(
             "DELETE",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}"
+            volume_id,
+            repository_id,
+            schedule_id
         )
+        invalidate(self.client, "schedules")
+        return response
     
-    def get_for_volume(self, volume_id: int) -> List[Dict[str, Any]]:
+    def get_for_volume(self, volume_id: Union[int, str]) -> List[Dict[str, Any]]:
         """
         Get all backup schedules for a volume across all repositories.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
         
         Returns:
             list: List of backup schedules for the volume
@@ -186,22 +251,22 @@ class BackupSchedulesAPI:
         """
         return self.client._make_request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/backup-schedules"
+            f"/api/v1/volumes/{resolve_id(self.client, 'volumes', volume_id)}/backup-schedules"
         )
     
     def run_now(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Run a backup schedule immediately.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Backup execution response
@@ -213,24 +278,27 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/run-now"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/run-now"
         )
     
     def stop_backup(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Stop a running backup.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Stop response
@@ -242,24 +310,27 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/stop"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/stop"
         )
     
     def run_forget(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Run the forget command to apply retention policy.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Forget command response
@@ -271,24 +342,27 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/forget"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/forget"
         )
     
     def get_notifications(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Get notification settings for a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Notification settings
@@ -300,25 +374,28 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/notifications"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/notifications"
         )
     
     def update_notifications(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str],
         notifications_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Update notification settings for a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
             notifications_data: Notification configuration
         
         Returns:
@@ -336,25 +413,28 @@ class BackupSchedulesAPI:
             ...     }
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "PUT",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/notifications",
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/notifications",
             data=notifications_data
         )
     
     def get_mirrors(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Get mirror settings for a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Mirror settings
@@ -366,25 +446,28 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/mirrors"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/mirrors"
         )
     
     def update_mirrors(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str],
         mirrors_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Update mirror settings for a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
             mirrors_data: Mirror configuration
         
         Returns:
@@ -401,25 +484,28 @@ class BackupSchedulesAPI:
             ...     }
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "PUT",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/mirrors",
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/mirrors",
             data=mirrors_data
         )
     
     def get_mirror_compatibility(
         self,
-        volume_id: int,
-        repository_id: int,
-        schedule_id: int
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
+        schedule_id: Union[int, str]
     ) -> Dict[str, Any]:
         """
         Check mirror compatibility for a backup schedule.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
-            schedule_id: Schedule ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
+            schedule_id: Schedule ID or name
         
         Returns:
             dict: Mirror compatibility information
@@ -431,23 +517,26 @@ class BackupSchedulesAPI:
             ...     schedule_id=1
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/{schedule_id}/mirror-compatibility"
+            volume_id,
+            repository_id,
+            schedule_id,
+            "/mirror-compatibility"
         )
     
     def reorder(
         self,
-        volume_id: int,
-        repository_id: int,
+        volume_id: Union[int, str],
+        repository_id: Union[int, str],
         order_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Reorder backup schedules.
         
         Args:
-            volume_id: Volume ID
-            repository_id: Repository ID
+            volume_id: Volume ID or name
+            repository_id: Repository ID or name
             order_data: New order configuration with schedule IDs
         
         Returns:
@@ -460,8 +549,435 @@ class BackupSchedulesAPI:
             ...     order_data={"scheduleIds": [3, 1, 2]}
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/repositories/{repository_id}/backup-schedules/reorder",
+            volume_id,
+            repository_id,
+            suffix="/reorder",
             data=order_data
         )
+    
+    def list_all(
+        self,
+        volume_id: Optional[Union[int, str]] = None,
+        repository_id: Optional[Union[int, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List every backup schedule in one request.
+        
+        Uses the flat ``/api/v1/backups`` route, which embeds each
+        schedule's volume and repository, so enumerating the fleet needs a
+        single call instead of one per volume and repository.
+        
+        Args:
+            volume_id: Only schedules of this volume, by ID or name (optional)
+            repository_id: Only schedules of this repository, by ID or name
+                (optional)
+        
+        Returns:
+            list: Backup schedules with embedded volume and repository
+        
+        Example:
+            >>> for schedule in client.backup_schedules.list_all():
+            ...     print(schedule['volume']['name'], schedule['name'], schedule['lastBackupStatus'])
+        """
+        schedules = self.client._make_request("GET", "/api/v1/backups") or []
+        
+        def matches(schedule: Dict[str, Any], field: str, reference: Union[int, str]) -> bool:
+            embedded = schedule.get(field) or {}
+            candidates = (schedule.get(field + "Id"), embedded.get("id"), embedded.get("name"), embedded.get("shortId"))
+            return str(reference) in {str(candidate) for candidate in candidates if candidate is not None}
+        
+        if volume_id is not None:
+            schedules = [schedule for schedule in schedules if matches(schedule, "volume", volume_id)]
+        if repository_id is not None:
+            schedules = [schedule for schedule in schedules if matches(schedule, "repository", repository_id)]
+        return schedules
+    
+    def create_schedule(self, schedule_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Create a backup schedule through the flat route.
+        
+        Args:
+            schedule_data: Schedule configuration including volumeId,
+                repositoryId, name, cronExpression and enabled
+        
+        Returns:
+            dict: Created backup schedule
+        
+        Example:
+            >>> schedule = client.backup_schedules.create_schedule({
+            ...     "volumeId": 1,
+            ...     "repositoryId": "my-backup-repo-id",
+            ...     "name": "nightly",
+            ...     "cronExpression": "0 2 * * *",
+            ...     "enabled": True
+            ... })
+        """
+        response = self.client._make_request("POST", "/api/v1/backups", data=schedule_data)
+        invalidate(self.client, "schedules")
+        return response
+    
+    def get_schedule(self, schedule_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Get a backup schedule by ID through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            dict: Backup schedule details
+        
+        Example:
+            >>> schedule = client.backup_schedules.get_schedule(3)
+        """
+        return self.client._make_request("GET", self._flat_path(schedule_id))
+    
+    def get_schedule_for_volume(self, volume_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Get the backup schedule of a volume through the flat route.
+        
+        Args:
+            volume_id: Volume ID or name
+        
+        Returns:
+            dict: Backup schedule of the volume
+        
+        Example:
+            >>> schedule = client.backup_schedules.get_schedule_for_volume(1)
+        """
+        return self.client._make_request(
+            "GET",
+            f"/api/v1/backups/volume/{resolve_id(self.client, 'volumes', volume_id)}"
+        )
+    
+    def update_schedule(self, schedule_id: Union[int, str], schedule_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Update a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+            schedule_data: Fields to change
+        
+        Returns:
+            dict: Updated backup schedule
+        
+        Example:
+            >>> schedule = client.backup_schedules.update_schedule(3, {"enabled": False})
+        """
+        response = self.client._make_request("PATCH", self._flat_path(schedule_id), data=schedule_data)
+        invalidate(self.client, "schedules")
+        return response
+    
+    def delete_schedule(self, schedule_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Delete a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            dict: Deletion response
+        
+        Example:
+            >>> response = client.backup_schedules.delete_schedule(3)
+        """
+        response = self.client._make_request("DELETE", self._flat_path(schedule_id))
+        invalidate(self.client, "schedules")
+        return response
+    
+    def run_schedule(self, schedule_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Trigger a backup immediately through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            dict: Backup execution response
+        
+        Example:
+            >>> response = client.backup_schedules.run_schedule(3)
+        """
+        return self.client._make_request("POST", f"{self._flat_path(schedule_id)}/run")
+    
+    def stop_schedule(self, schedule_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Stop a running backup through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            dict: Stop response
+        
+        Example:
+            >>> response = client.backup_schedules.stop_schedule(3)
+        """
+        return self.client._make_request("POST", f"{self._flat_path(schedule_id)}/stop")
+    
+    def forget_schedule(self, schedule_id: Union[int, str]) -> Dict[str, Any]:
+        """
+        Apply a schedule's retention policy through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            dict: Forget operation response
+        
+        Example:
+            >>> response = client.backup_schedules.forget_schedule(3)
+        """
+        return self.client._make_request("POST", f"{self._flat_path(schedule_id)}/forget")
+    
+    def get_schedule_notifications(self, schedule_id: Union[int, str]) -> List[Dict[str, Any]]:
+        """
+        Get the notification assignments of a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            list: Notification assignments, each with its destination
+        
+        Example:
+            >>> assignments = client.backup_schedules.get_schedule_notifications(3)
+        """
+        return self.client._make_request("GET", f"{self._flat_path(schedule_id)}/notifications")
+    
+    def update_schedule_notifications(
+        self,
+        schedule_id: Union[int, str],
+        notifications_data: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Replace the notification assignments of a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+            notifications_data: Dict with ``assignments``, each with
+                destinationId, notifyOnStart, notifyOnSuccess,
+                notifyOnWarning and notifyOnFailure
+        
+        Returns:
+            list: Updated notification assignments
+        
+        Example:
+            >>> assignments = client.backup_schedules.update_schedule_notifications(3, {
+            ...     "assignments": [{
+            ...         "destinationId": 1,
+            ...         "notifyOnStart": False,
+            ...         "notifyOnSuccess": False,
+            ...         "notifyOnWarning": True,
+            ...         "notifyOnFailure": True
+            ...     }]
+            ... })
+        """
+        return self.client._make_request(
+            "PUT",
+            f"{self._flat_path(schedule_id)}/notifications",
+            data=notifications_data
+        )
+    
+    def get_schedule_mirrors(self, schedule_id: Union[int, str]) -> List[Dict[str, Any]]:
+        """
+        Get the mirror repository assignments of a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            list: Mirror assignments with their last copy status
+        
+        Example:
+            >>> mirrors = client.backup_schedules.get_schedule_mirrors(3)
+        """
+        return self.client._make_request("GET", f"{self._flat_path(schedule_id)}/mirrors")
+    
+    def update_schedule_mirrors(self, schedule_id: Union[int, str], mirrors_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Replace the mirror repository assignments of a backup schedule through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+            mirrors_data: Dict with ``mirrors``, each with repositoryId and enabled
+        
+        Returns:
+            list: Updated mirror assignments
+        
+        Example:
+            >>> mirrors = client.backup_schedules.update_schedule_mirrors(3, {
+            ...     "mirrors": [{"repositoryId": "mirror-repo-id", "enabled": True}]
+            ... })
+        """
+        return self.client._make_request(
+            "PUT",
+            f"{self._flat_path(schedule_id)}/mirrors",
+            data=mirrors_data
+        )
+    
+    def get_schedule_mirror_compatibility(self, schedule_id: Union[int, str]) -> List[Dict[str, Any]]:
+        """
+        Check which repositories can mirror a schedule's primary repository, through the flat route.
+        
+        Args:
+            schedule_id: Schedule ID or name
+        
+        Returns:
+            list: Dicts with repositoryId, compatible and reason
+        
+        Example:
+            >>> compatible = [
+            ...     entry['repositoryId']
+            ...     for entry in client.backup_schedules.get_schedule_mirror_compatibility(3)
+            ...     if entry['compatible']
+            ... ]
+        """
+        return self.client._make_request("GET", f"{self._flat_path(schedule_id)}/mirrors/compatibility")
+    
+    def reorder_schedules(self, schedule_ids: List[Union[int, str]]) -> Dict[str, Any]:
+        """
+        Reorder backup schedules through the flat route.
+        
+        Args:
+            schedule_ids: Schedule IDs or names in the desired order
+        
+        Returns:
+            dict: Reorder response
+        
+        Example:
+            >>> response = client.backup_schedules.reorder_schedules([3, 1, 2])
+        """
+        return self.client._make_request(
+            "POST",
+            "/api/v1/backups/reorder",
+            data={"scheduleIds": [resolve_id(self.client, "schedules", schedule_id) for schedule_id in schedule_ids]}
+        )
+    
+    def preview(
+        self,
+        schedule: Dict[str, Any],
+        volume: Optional[Any] = None,
+        path: str = "/",
+        max_workers: int = 8,
+        max_depth: int = 3,
+        top: int = 10,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate what a backup schedule would pick up, without running it.
+        
+        The source volume is walked with ``volumes.list_files``, listing up
+        to ``max_workers`` directories at once. The schedule's
+        includePatterns, excludePatterns and excludeIfPresent are applied
+        client-side to paths relative to the volume root: excluded
+        directories are not listed at all, and directories whose listing
+        holds an excludeIfPresent marker file are counted as excluded and
+        not descended into.
+        
+        Args:
+            schedule: Schedule dict (as returned by :meth:`get`) with the
+                patterns and volume or volumeId
+            volume: Volume to walk (optional, defaults to the schedule's volume)
+            path: Directory of the volume to start from
+            max_workers: Maximum number of concurrent listing requests
+            max_depth: Deepest directory level reported in largest_directories
+            top: Number of largest directories to report
+            progress: Called with the running totals (files, bytes,
+                directories, excluded_files, excluded_bytes,
+                excluded_directories, pending) after each directory listing
+        
+        Returns:
+            dict: The final totals plus:
+                - largest_directories (list): ``(path, bytes)`` pairs,
+                    largest first, for directories up to ``max_depth``
+                - errors (list): ``{"path", "error"}`` dicts for directories
+                    that could not be listed
+        
+        Example:
+            >>> schedule = client.backup_schedules.get(1, 1, 1)
+            >>> totals = client.backup_schedules.preview(schedule, max_workers=16)
+            >>> print(totals['files'], totals['bytes'], totals['largest_directories'][:3])
+        """
+        if volume is None:
+            volume = (schedule.get("volume") or {}).get("name") or schedule.get("volumeId")
+        selection = PathFilter.from_schedule(schedule)
+        totals: Dict[str, Any] = {
+            "files": 0,
+            "bytes": 0,
+            "directories": 0,
+            "excluded_files": 0,
+            "excluded_bytes": 0,
+            "excluded_directories": 0,
+            "pending": 0,
+        }
+        directory_bytes: Dict[str, int] = {}
+        errors: List[Dict[str, Any]] = []
+        
+        def add_file(file_path: str, size: int) -> None:
+            directory = posixpath.dirname(file_path)
+            while True:
+                if directory.count("/") <= max_depth or directory == "/":
+                    directory_bytes[directory] = directory_bytes.get(directory, 0) + size
+                if directory == "/":
+                    break
+                directory = posixpath.dirname(directory)
+        
+        def list_directory(directory: str) -> Dict[str, Any]:
+            return self.client.volumes.list_files(volume, path=directory)
+        
+        def visit(directory: str, listing: Optional[Dict[str, Any]]) -> List[str]:
+            """Count a directory's entries and return the subdirectories to list."""
+            entries = [
+                entry for entry in (listing or {}).get("files", [])
+                if normalize_path(entry.get("path", "")) != directory
+            ]
+            if selection.has_marker(entry.get("name") for entry in entries):
+                totals["excluded_directories"] += 1
+                return []
+            # Counted here rather than in the parent's listing, once it is known to hold no marker
+            if directory != root and selection.selects(directory):
+                totals["directories"] += 1
+            subdirectories = []
+            for entry in entries:
+                entry_path = normalize_path(entry.get("path", ""))
+                if is_directory(entry):
+                    if selection.should_descend(entry_path):
+                        subdirectories.append(entry_path)
+                    else:
+                        totals["excluded_directories"] += 1
+                elif selection.selects(entry_path):
+                    size = entry.get("size") or 0
+                    totals["files"] += 1
+                    totals["bytes"] += size
+                    add_file(entry_path, size)
+                else:
+                    totals["excluded_files"] += 1
+                    totals["excluded_bytes"] += entry.get("size") or 0
+            return subdirectories
+        
+        root = normalize_path(path)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            running = {executor.submit(list_directory, root): root}
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory = running.pop(future)
+                    try:
+                        subdirectories = visit(directory, future.result())
+                    except Exception as e:
+                        errors.append({"path": directory, "error": e})
+                        subdirectories = []
+                    for subdirectory in subdirectories:
+                        running[executor.submit(list_directory, subdirectory)] = subdirectory
+                    totals["pending"] = len(running)
+                    if progress:
+                        progress(dict(totals))
+        
+        result = dict(totals)
+        result["largest_directories"] = heapq.nlargest(
+            top, directory_bytes.items(), key=lambda item: item[1]
+        )
+        result["errors"] = errors
+        return result
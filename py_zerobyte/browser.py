@@ -0,0 +1,225 @@
+"""Cached host filesystem browsing for path pickers and autocompletion."""
+
+import posixpath
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .exceptions import NotFoundError
+from .files import is_directory, normalize_path
+
+
+class _Node:
+    """One directory of the prefix tree."""
+    
+    __slots__ = ("children", "entries", "fetched_at", "pending")
+    
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.entries: Optional[List[Dict[str, Any]]] = None
+        self.fetched_at = 0.0
+        self.pending: Optional[Future] = None
+
+
+def _components(path: str) -> List[str]:
+    return [part for part in normalize_path(path).split("/") if part]
+
+
+class FilesystemBrowser:
+    """
+    Cache of ``volumes.browse_filesystem`` listings for interactive path pickers.
+    
+    Listings are stored in a prefix tree of path components and reused
+    for ``ttl`` seconds. Concurrent requests for a directory that is not
+    cached share a single API call. When a completion narrows down to a
+    few directories, their listings are fetched in the background so the
+    next keystroke is answered from the cache.
+    
+    Args:
+        client: ZerobyteClient instance
+        ttl: Seconds a listing stays valid
+        prefetch: Prefetch the listings of the matching directories when a
+            completion matches at most this many (0 disables prefetching)
+        max_workers: Maximum number of concurrent prefetch requests
+    
+    Example:
+        >>> with FilesystemBrowser(client, ttl=60) as browser:
+        ...     for entry in browser.complete("/mnt/ba"):
+        ...         print(entry['path'])
+    """
+    
+    def __init__(self, client, ttl: float = 30.0, prefetch: int = 4, max_workers: int = 4):
+        """Initialize FilesystemBrowser with client instance."""
+        self.client = client
+        self.ttl = ttl
+        self.prefetch_limit = prefetch
+        self.max_workers = max_workers
+        self.requests = 0
+        self.hits = 0
+        self._root = _Node()
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    def __enter__(self) -> "FilesystemBrowser":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+    
+    def close(self, wait: bool = False) -> None:
+        """
+        Stop the background prefetch threads.
+        
+        Args:
+            wait: Wait for running prefetches to finish
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def _node(self, path: str) -> _Node:
+        node = self._root
+        for component in _components(path):
+            node = node.children.setdefault(component, _Node())
+        return node
+    
+    def _fresh(self, node: _Node) -> bool:
+        return node.entries is not None and time.monotonic() - node.fetched_at < self.ttl
+    
+    def _fetch(self, path: str) -> List[Dict[str, Any]]:
+        listing = self.client.volumes.browse_filesystem(path=path)
+        entries = []
+        for entry in (listing or {}).get("directories", []):
+            entry = dict(entry)
+            entry["path"] = normalize_path(entry.get("path") or posixpath.join(path, entry.get("name", "")))
+            entry.setdefault("name", posixpath.basename(entry["path"]))
+            entries.append(entry)
+        entries.sort(key=lambda entry: entry["name"])
+        return entries
+    
+    def _store(self, node: _Node, entries: List[Dict[str, Any]]) -> None:
+        """Record a listing, keeping the cached subtrees of directories that still exist."""
+        names = {entry["name"] for entry in entries if is_directory(entry)}
+        node.children = {name: node.children.get(name) or _Node() for name in names}
+        node.entries = entries
+        node.fetched_at = time.monotonic()
+    
+    def list(self, path: str = "/") -> List[Dict[str, Any]]:
+        """
+        List a directory, from the cache when possible.
+        
+        Args:
+            path: Absolute directory path
+        
+        Returns:
+            list: Copies of the entries of the directory sorted by name,
+                each with name, path and type
+        """
+        path = normalize_path(path)
+        with self._lock:
+            node = self._node(path)
+            if self._fresh(node):
+                self.hits += 1
+                return [dict(entry) for entry in node.entries]
+            future = node.pending
+            owner = future is None
+            if owner:
+                future = node.pending = Future()
+                self.requests += 1
+            else:
+                self.hits += 1
+        if owner:
+            try:
+                entries = self._fetch(path)
+            except BaseException as e:
+                with self._lock:
+                    node.pending = None
+                future.set_exception(e)
+                raise
+            with self._lock:
+                self._store(node, entries)
+                node.pending = None
+            future.set_result(entries)
+        # Copies, so callers cannot change the cached listing
+        return [dict(entry) for entry in future.result()]
+    
+    def complete(self, partial: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Complete a partially typed path.
+        
+        "/mnt/ba" lists the entries of "/mnt" whose names start with "ba";
+        "/mnt/" lists every entry of "/mnt".
+        
+        Args:
+            partial: Partially typed absolute path
+            limit: Maximum number of entries to return (optional)
+        
+        Returns:
+            list: Matching entries sorted by name; empty if the parent
+                directory does not exist
+        """
+        if not partial or partial.endswith("/"):
+            directory, prefix = normalize_path(partial), ""
+        else:
+            directory, prefix = posixpath.split(normalize_path(partial))
+        try:
+            entries = self.list(directory)
+        except NotFoundError:
+            return []
+        matches = [entry for entry in entries if entry["name"].startswith(prefix)]
+        directories = [entry["path"] for entry in matches if is_directory(entry)]
+        if directories and len(directories) <= self.prefetch_limit:
+            self.prefetch(directories)
+        return matches[:limit] if limit is not None else matches
+    
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Fetch the listings of directories in the background.
+        
+        Directories that are cached or already being fetched are skipped,
+        and errors are ignored.
+        
+        Args:
+            paths: Absolute directory paths
+        """
+        with self._lock:
+            missing = []
+            for path in paths:
+                node = self._node(path)
+                if not self._fresh(node) and node.pending is None:
+                    missing.append(normalize_path(path))
+            if not missing:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+            executor = self._executor
+        for path in missing:
+            executor.submit(self._prefetch_one, path)
+    
+    def _prefetch_one(self, path: str) -> None:
+        try:
+            self.list(path)
+        except Exception:
+            pass
+    
+    def invalidate(self, path: str = "/") -> None:
+        """
+        Drop the cached listings of a directory and everything below it.
+        
+        Args:
+            path: Absolute directory path
+        """
+        components = _components(path)
+        with self._lock:
+            if not components:
+                self._root = _Node()
+                return
+            node = self._root
+            for component in components[:-1]:
+                node = node.children.get(component)
+                if node is None:
+                    return
+            if components[-1] in node.children:
+                node.children[components[-1]] = _Node()
@@ -0,0 +1,242 @@
+"""Capacity analytics and growth forecasting from snapshot history.
+
+Requires the optional ``numpy`` dependency (``pip install py-zerobyte[analytics]``).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .files import parse_time
+
+
+_DAY = 86400.0
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "Capacity analytics require numpy. Install it with: pip install py-zerobyte[analytics]"
+        )
+
+
+def _linear_fit(x: Any, y: Any) -> Optional[Tuple[float, float]]:
+    """Least-squares slope and intercept, or None with fewer than two distinct x values."""
+    if len(x) < 2:
+        return None
+    x_mean = x.mean()
+    dx = x - x_mean
+    variance = float((dx * dx).sum())
+    if variance == 0:
+        return None
+    slope = float((dx * (y - y.mean())).sum()) / variance
+    return slope, float(y.mean()) - slope * float(x_mean)
+
+
+class SnapshotSeries:
+    """
+    Time series of one repository's snapshot ``time``, ``size`` and ``duration``.
+    
+    Values are NumPy arrays sorted by time (epoch seconds), so every
+    statistic is a vectorized computation over the whole history.
+    
+    Args:
+        times: Snapshot times in epoch seconds
+        sizes: Snapshot sizes in bytes
+        durations: Backup durations in seconds
+    
+    Example:
+        >>> series = SnapshotSeries.from_snapshots(client.snapshots.list("my-backup-repo"))
+        >>> print(series.growth_rate(days=90))
+        >>> print(series.forecast(threshold=2 * 10 ** 12))
+    """
+    
+    def __init__(self, times: Any, sizes: Any, durations: Any):
+        """Initialize SnapshotSeries from aligned arrays."""
+        _require_numpy()
+        order = np.argsort(times, kind="stable")
+        self.times = np.asarray(times, dtype=np.float64)[order]
+        self.sizes = np.asarray(sizes, dtype=np.float64)[order]
+        self.durations = np.asarray(durations, dtype=np.float64)[order]
+    
+    @classmethod
+    def from_snapshots(cls, snapshots: Iterable[Dict[str, Any]]) -> "SnapshotSeries":
+        """
+        Build a series from a ``snapshots.list`` result.
+        
+        Args:
+            snapshots: Snapshots with time, size and duration
+        
+        Returns:
+            SnapshotSeries: Time-sorted series
+        """
+        _require_numpy()
+        times, sizes, durations = [], [], []
+        for snapshot in snapshots:
+            seconds = parse_time(snapshot.get("time"))
+            if seconds is None:
+                continue
+            times.append(seconds)
+            sizes.append(snapshot.get("size") or 0)
+            durations.append(snapshot.get("duration") or 0)
+        return cls(np.array(times), np.array(sizes), np.array(durations))
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def _window(self, days: Optional[float]) -> Any:
+        if days is None or not len(self.times):
+            return np.ones(len(self.times), dtype=bool)
+        return self.times >= self.times[-1] - days * _DAY
+    
+    def growth_rate(self, days: Optional[float] = None) -> Optional[float]:
+        """
+        Size growth in bytes per day from a least-squares fit.
+        
+        Args:
+            days: Only fit the most recent ``days`` of history (optional)
+        
+        Returns:
+            float: Bytes per day, or None with fewer than two snapshots
+        """
+        mask = self._window(days)
+        fit = _linear_fit(self.times[mask] / _DAY, self.sizes[mask])
+        return fit[0] if fit else None
+    
+    def duration_trend(self, days: Optional[float] = None) -> Optional[float]:
+        """
+        Change in backup duration, in seconds per day, from a least-squares fit.
+        
+        Args:
+            days: Only fit the most recent ``days`` of history (optional)
+        
+        Returns:
+            float: Seconds of backup duration gained per day, or None with
+                fewer than two snapshots
+        """
+        mask = self._window(days)
+        fit = _linear_fit(self.times[mask] / _DAY, self.durations[mask])
+        return fit[0] if fit else None
+    
+    def moving_average(self, column: str = "size", window: int = 7) -> Any:
+        """
+        Trailing moving average over the last ``window`` snapshots.
+        
+        Args:
+            column: "size" or "duration"
+            window: Number of snapshots to average
+        
+        Returns:
+            ndarray: One value per snapshot; the first ``window - 1`` values
+                average over the snapshots available so far
+        """
+        values = self.sizes if column == "size" else self.durations
+        if not len(values):
+            return values.copy()
+        window = max(1, int(window))
+        sums = np.cumsum(np.concatenate(([0.0], values)))
+        ends = np.arange(1, len(values) + 1)
+        starts = np.maximum(ends - window, 0)
+        return (sums[ends] - sums[starts]) / (ends - starts)
+    
+    def forecast(self, threshold: float, days: Optional[float] = None) -> Optional[float]:
+        """
+        Estimate when the size reaches a threshold, extrapolating the linear trend.
+        
+        Args:
+            threshold: Size in bytes
+            days: Only fit the most recent ``days`` of history (optional)
+        
+        Returns:
+            float: Epoch seconds at which the trend reaches ``threshold`` (the
+                latest snapshot time if it already has), or None if there is
+                too little history or the size is not growing
+        """
+        if len(self.sizes) and self.sizes[-1] >= threshold:
+            return float(self.times[-1])
+        mask = self._window(days)
+        fit = _linear_fit(self.times[mask] / _DAY, self.sizes[mask])
+        if not fit or fit[0] <= 0:
+            return None
+        slope, intercept = fit
+        return max((threshold - intercept) / slope * _DAY, float(self.times[-1]))
+    
+    def summary(self, threshold: Optional[float] = None, days: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Summarize the series.
+        
+        Args:
+            threshold: Size in bytes to forecast (optional)
+            days: Only fit the most recent ``days`` of history (optional)
+        
+        Returns:
+            dict: snapshots, first_time, last_time, latest_size,
+                growth_per_day, duration_trend_per_day, average_duration
+                and, when a threshold is given, threshold_time
+        """
+        summary = {
+            "snapshots": len(self),
+            "first_time": float(self.times[0]) if len(self) else None,
+            "last_time": float(self.times[-1]) if len(self) else None,
+            "latest_size": float(self.sizes[-1]) if len(self) else None,
+            "growth_per_day": self.growth_rate(days),
+            "duration_trend_per_day": self.duration_trend(days),
+            "average_duration": float(self.durations[self._window(days)].mean()) if len(self) else None,
+        }
+        if threshold is not None:
+            summary["threshold_time"] = self.forecast(threshold, days)
+        return summary
+
+
+def collect_series(client, repository_names: Optional[Iterable[str]] = None) -> Dict[str, SnapshotSeries]:
+    """
+    Load the snapshot history of several repositories.
+    
+    Args:
+        client: ZerobyteClient instance
+        repository_names: Repositories to load (optional, defaults to all)
+    
+    Returns:
+        dict: Repository name to SnapshotSeries
+    """
+    if repository_names is None:
+        repository_names = [repo["name"] for repo in client.repositories.list() or []]
+    return {
+        name: SnapshotSeries.from_snapshots(client.snapshots.list(name) or [])
+        for name in repository_names
+    }
+
+
+def capacity_report(
+    client,
+    threshold: Optional[float] = None,
+    days: Optional[float] = None,
+    repository_names: Optional[Iterable[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Summarize growth for every repository.
+    
+    Args:
+        client: ZerobyteClient instance
+        threshold: Size in bytes to forecast for each repository (optional)
+        days: Only fit the most recent ``days`` of history (optional)
+        repository_names: Repositories to include (optional, defaults to all)
+    
+    Returns:
+        list: One :meth:`SnapshotSeries.summary` per repository with an
+            added ``repository`` key, fastest growing first
+    
+    Example:
+        >>> for row in capacity_report(client, threshold=10 ** 12, days=90):
+        ...     print(row['repository'], row['growth_per_day'], row['threshold_time'])
+    """
+    rows = []
+    for name, series in collect_series(client, repository_names).items():
+        row = {"repository": name}
+        row.update(series.summary(threshold=threshold, days=days))
+        rows.append(row)
+    rows.sort(key=lambda row: row["growth_per_day"] or 0.0, reverse=True)
+    return rows
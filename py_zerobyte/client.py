@@ -16,6 +16,7 @@ from .snapshots import SnapshotsAPI
 from .backup_schedules import BackupSchedulesAPI
 from .notifications import NotificationsAPI
 from .system import SystemAPI
+from .resolver import Resolver
 
 
 class ZerobyteClient:
@@ -59,6 +60,9 @@ class ZerobyteClient:
         self.notifications = NotificationsAPI(self)
         self.system = SystemAPI(self)
         
+        # Name/ID translation shared by the API modules
+        self.resolver = Resolver(self)
+        
         # Auto-login if requested
         if auto_login:
             self.login()
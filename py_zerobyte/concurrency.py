@@ -0,0 +1,98 @@
+"""Bounded thread-pool helpers shared by the bulk and fleet operations."""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+Outcome = Tuple[Any, Any, Optional[BaseException]]
+
+_DONE = object()
+
+
+def imap_grouped(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    key: Callable[[Any], Hashable],
+    max_workers: int = 4
+) -> Iterator[Outcome]:
+    """
+    Run ``func`` over items, serially within a group and concurrently across groups.
+    
+    Outcomes are yielded in the caller's thread as each item completes, so
+    progress callbacks need no locking. Closing the iterator early stops
+    workers from starting further items.
+    
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        key: Returns the group of an item; items of one group never overlap
+        max_workers: Maximum number of groups processed at once
+    
+    Yields:
+        tuple: ``(item, result, error)`` where ``error`` is the exception
+            raised by ``func`` (``result`` is then None)
+    """
+    groups: Dict[Hashable, List[Any]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+    if not groups:
+        return
+    
+    outcomes: "queue.Queue[Any]" = queue.Queue()
+    stop = threading.Event()
+    
+    def run_group(members: List[Any]) -> None:
+        try:
+            for item in members:
+                if stop.is_set():
+                    break
+                try:
+                    outcomes.put((item, func(item), None))
+                except Exception as e:
+                    outcomes.put((item, None, e))
+        finally:
+            outcomes.put(_DONE)
+    
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    try:
+        for members in groups.values():
+            executor.submit(run_group, members)
+        remaining = len(groups)
+        while remaining:
+            outcome = outcomes.get()
+            if outcome is _DONE:
+                remaining -= 1
+                continue
+            yield outcome
+    finally:
+        stop.set()
+        executor.shutdown(wait=True)
+
+
+def imap_unordered(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    max_workers: int = 8
+) -> Iterator[Outcome]:
+    """
+    Run ``func`` over items concurrently, yielding outcomes as they complete.
+    
+    Args:
+        func: Callable applied to each item
+        items: Items to process
+        max_workers: Maximum number of concurrent calls
+    
+    Yields:
+        tuple: ``(item, result, error)`` where ``error`` is the exception
+            raised by ``func`` (``result`` is then None)
+    """
+    indexed = list(enumerate(items))
+    for (_, item), result, error in imap_grouped(
+        lambda pair: func(pair[1]),
+        indexed,
+        key=lambda pair: pair[0],
+        max_workers=max_workers
+    ):
+        yield item, result, error
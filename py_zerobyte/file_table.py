@@ -0,0 +1,304 @@
+"""Columnar, NumPy-backed file listings with vectorized filtering.
+
+Requires the optional ``numpy`` dependency (``pip install py-zerobyte[analytics]``);
+:meth:`FileTable.to_pandas` additionally requires ``pandas``.
+"""
+
+import posixpath
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .files import TYPE_CODES, TYPE_NAMES, entry_mtime, normalize_path, parse_time
+
+
+_NUMERIC_COLUMNS = ("size", "mtime", "atime", "ctime", "mode", "uid", "gid", "type")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "FileTable requires numpy. Install it with: pip install py-zerobyte[analytics]"
+        )
+
+
+class FileTable:
+    """
+    Column-oriented table of file listing entries.
+    
+    Every attribute is stored as a NumPy array (``size``, ``mtime``,
+    ``atime``, ``ctime``, ``mode``, ``uid``, ``gid``, ``type``) so filters
+    are expressed as vectorized boolean masks instead of Python loops.
+    Times are seconds since the epoch (NaN when unknown). Paths are
+    interned: each row stores an index into the table of distinct parent
+    directories plus its own name.
+    
+    Args:
+        columns: Mapping of column name to NumPy array
+        directories: Distinct parent directories
+        dir_index: Row to directory index (int32 array)
+        names: Entry names, one per row
+    
+    Example:
+        >>> table = FileTable.from_entries(client.snapshots.walk("my-backup-repo", "abc123"))
+        >>> week_ago = time.time() - 7 * 86400
+        >>> big = table[(table.size > 2 ** 30) & (table.mtime > week_ago)]
+        >>> for path in big.sort("size", descending=True).paths():
+        ...     print(path)
+    """
+    
+    def __init__(
+        self,
+        columns: Dict[str, Any],
+        directories: List[str],
+        dir_index: Any,
+        names: Any
+    ):
+        """Initialize a FileTable from prebuilt columns."""
+        _require_numpy()
+        self.columns = columns
+        self.directories = directories
+        self.dir_index = dir_index
+        self.names = names
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[Dict[str, Any]]) -> "FileTable":
+        """
+        Build a table from listing entries.
+        
+        Args:
+            entries: Entries from ``walk`` or the ``files`` of a ``list_files`` result
+        
+        Returns:
+            FileTable: Table with one row per entry
+        """
+        _require_numpy()
+        values: Dict[str, List[Any]] = {name: [] for name in _NUMERIC_COLUMNS}
+        directory_ids: Dict[str, int] = {}
+        dir_index = []
+        names = []
+        nan = float("nan")
+        
+        for entry in entries:
+            path = normalize_path(entry.get("path"))
+            directory, name = posixpath.split(path)
+            dir_index.append(directory_ids.setdefault(directory, len(directory_ids)))
+            names.append(entry.get("name") or name)
+            
+            mtime = entry_mtime(entry)
+            atime = parse_time(entry.get("atime"))
+            ctime = parse_time(entry.get("ctime"))
+            values["size"].append(entry.get("size") or 0)
+            values["mtime"].append(nan if mtime is None else mtime)
+            values["atime"].append(nan if atime is None else atime)
+            values["ctime"].append(nan if ctime is None else ctime)
+            values["mode"].append(entry.get("mode") or 0)
+            values["uid"].append(entry.get("uid") or 0)
+            values["gid"].append(entry.get("gid") or 0)
+            values["type"].append(TYPE_CODES.get(entry.get("type"), 0))
+        
+        columns = {
+            "size": np.array(values["size"], dtype=np.int64),
+            "mtime": np.array(values["mtime"], dtype=np.float64),
+            "atime": np.array(values["atime"], dtype=np.float64),
+            "ctime": np.array(values["ctime"], dtype=np.float64),
+            "mode": np.array(values["mode"], dtype=np.uint32),
+            "uid": np.array(values["uid"], dtype=np.uint32),
+            "gid": np.array(values["gid"], dtype=np.uint32),
+            "type": np.array(values["type"], dtype=np.uint8),
+        }
+        return cls(
+            columns,
+            list(directory_ids),
+            np.array(dir_index, dtype=np.int32),
+            np.array(names, dtype=object)
+        )
+    
+    @classmethod
+    def from_listing(cls, listing: Optional[Dict[str, Any]]) -> "FileTable":
+        """
+        Build a table from one ``snapshots.list_files`` or ``volumes.list_files`` result.
+        
+        Args:
+            listing: Listing response containing a ``files`` array
+        
+        Returns:
+            FileTable: Table with one row per file
+        """
+        return cls.from_entries((listing or {}).get("files", []))
+    
+    @classmethod
+    def from_listing_file(cls, listing: Any) -> "FileTable":
+        """
+        Build a table from an open :class:`~py_zerobyte.listing_file.ListingFile`.
+        
+        The fixed-width columns are copied straight from the mapped file;
+        only the paths are decoded. ``atime`` and ``ctime`` are not stored
+        in listing files and are NaN.
+        
+        Args:
+            listing: Open ListingFile
+        
+        Returns:
+            FileTable: Table with one row per entry
+        """
+        _require_numpy()
+        columns = {}
+        for name in ("size", "mtime", "mode", "uid", "gid", "type"):
+            view = listing.column(name)
+            columns[name] = np.array(view, copy=True)
+            view.release()
+        columns["size"] = columns["size"].astype(np.int64, copy=False)
+        columns["atime"] = np.full(len(listing), np.nan)
+        columns["ctime"] = np.full(len(listing), np.nan)
+        
+        directory_ids: Dict[str, int] = {}
+        dir_index = np.empty(len(listing), dtype=np.int32)
+        names = np.empty(len(listing), dtype=object)
+        for row, path in enumerate(listing.paths()):
+            directory, name = posixpath.split(path)
+            dir_index[row] = directory_ids.setdefault(directory, len(directory_ids))
+            names[row] = name
+        return cls(columns, list(directory_ids), dir_index, names)
+    
+    def __len__(self) -> int:
+        return len(self.names)
+    
+    def __getattr__(self, name: str) -> Any:
+        columns = self.__dict__.get("columns", {})
+        if name in columns:
+            return columns[name]
+        raise AttributeError(name)
+    
+    def __getitem__(self, selector: Any) -> "FileTable":
+        """Select rows with a boolean mask, index array or slice."""
+        return FileTable(
+            {name: column[selector] for name, column in self.columns.items()},
+            self.directories,
+            self.dir_index[selector],
+            self.names[selector]
+        )
+    
+    def filter(self, mask: Any) -> "FileTable":
+        """
+        Select the rows where a boolean mask is True.
+        
+        Args:
+            mask: Boolean array, e.g. ``table.size > 2 ** 30``
+        
+        Returns:
+            FileTable: Matching rows
+        """
+        return self[np.asarray(mask, dtype=bool)]
+    
+    @property
+    def is_file(self) -> Any:
+        """Boolean mask of regular files."""
+        return self.columns["type"] == TYPE_CODES["file"]
+    
+    @property
+    def is_dir(self) -> Any:
+        """Boolean mask of directories."""
+        return self.columns["type"] == TYPE_CODES["dir"]
+    
+    def sort(self, by: str, descending: bool = False) -> "FileTable":
+        """
+        Sort rows by a column (stable, with NaN values last).
+        
+        Args:
+            by: Column name, or "path"
+            descending: Sort largest first
+        
+        Returns:
+            FileTable: Sorted table
+        """
+        if by == "path":
+            keys = np.array(self.paths(), dtype=object)
+        else:
+            keys = self.columns[by]
+        missing = np.isnan(keys) if keys.dtype.kind == "f" else np.zeros(len(keys), dtype=bool)
+        if descending:
+            # Sort on the negated rank; reversing an ascending sort would reverse ties
+            _, rank = np.unique(keys, return_inverse=True)
+            keys = -rank.ravel()
+        order = np.argsort(keys, kind="stable")
+        # Unknown values (NaN) go last in both directions
+        order = order[np.argsort(missing[order], kind="stable")]
+        return self[order]
+    
+    def directory_of(self) -> Any:
+        """Return the parent directory of every row as an object array."""
+        return np.array(self.directories, dtype=object)[self.dir_index]
+    
+    def paths(self) -> List[str]:
+        """Return the full path of every row."""
+        directories = self.directories
+        return [
+            posixpath.join(directories[index], name)
+            for index, name in zip(self.dir_index.tolist(), self.names.tolist())
+        ]
+    
+    def group_by_directory(self) -> Dict[str, Any]:
+        """
+        Aggregate rows by parent directory.
+        
+        Returns:
+            dict: Arrays aligned by directory:
+                - directory (list): Directory path
+                - count (ndarray): Number of entries directly inside it
+                - size (ndarray): Total size of those entries
+                - mtime (ndarray): Latest modification time among them
+        """
+        used, inverse = np.unique(self.dir_index, return_inverse=True)
+        groups = len(used)
+        sizes = np.zeros(groups, dtype=np.int64)
+        np.add.at(sizes, inverse, self.columns["size"])
+        latest = np.full(groups, -np.inf)
+        mtimes = self.columns["mtime"]
+        known = ~np.isnan(mtimes)
+        np.maximum.at(latest, inverse[known], mtimes[known])
+        latest[np.isinf(latest)] = np.nan
+        return {
+            "directory": [self.directories[index] for index in used.tolist()],
+            "count": np.bincount(inverse, minlength=groups),
+            "size": sizes,
+            "mtime": latest,
+        }
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert back to a list of entry dictionaries."""
+        columns = {name: column.tolist() for name, column in self.columns.items()}
+        records = []
+        for row, path in enumerate(self.paths()):
+            record = {"path": path}
+            for name in _NUMERIC_COLUMNS:
+                record[name] = columns[name][row]
+            record["type"] = TYPE_NAMES.get(record["type"])
+            records.append(record)
+        return records
+    
+    def to_pandas(self) -> Any:
+        """
+        Convert to a pandas DataFrame.
+        
+        Returns:
+            pandas.DataFrame: One row per entry with a ``path`` column
+        
+        Raises:
+            ImportError: If pandas is not installed
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "to_pandas requires pandas. Install it with: pip install py-zerobyte[analytics]"
+            )
+        data = {"path": self.paths()}
+        for name in _NUMERIC_COLUMNS:
+            data[name] = self.columns[name]
+        frame = pd.DataFrame(data)
+        frame["type"] = frame["type"].map(TYPE_NAMES)
+        return frame
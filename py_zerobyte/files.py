@@ -0,0 +1,191 @@
+"""Helpers for the file listing entries returned by the snapshot and volume APIs."""
+
+import posixpath
+import re
+from concurrent.futures import Executor, Future
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+
+_ISO_TIME = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+
+# Compact codes for entry types, shared by the columnar listing formats
+TYPE_CODES = {"file": 1, "dir": 2, "directory": 2, "symlink": 3}
+TYPE_NAMES = {1: "file", 2: "dir", 3: "symlink"}
+
+# Numeric timestamps above this are taken to be milliseconds (year 5138 in seconds)
+_MILLISECONDS_THRESHOLD = 1e11
+
+
+def normalize_path(path: Optional[str]) -> str:
+    """Return an absolute, normalized POSIX path."""
+    return posixpath.normpath("/" + (path or "").lstrip("/"))
+
+
+def is_directory(entry: Dict[str, Any]) -> bool:
+    """Return True if a file listing entry describes a directory."""
+    return entry.get("type") in ("dir", "directory")
+
+
+def parse_time(value: Any) -> Optional[float]:
+    """
+    Convert an API timestamp to seconds since the epoch.
+    
+    Snapshot listings report RFC 3339 strings (with up to nanosecond
+    precision) while volume listings report numbers, which may be in
+    seconds or milliseconds.
+    
+    Args:
+        value: Timestamp string or number
+    
+    Returns:
+        float: Seconds since the epoch, or None if the value is missing or invalid
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        value = float(value)
+        return value / 1000.0 if abs(value) >= _MILLISECONDS_THRESHOLD else value
+    
+    match = _ISO_TIME.match(str(value).strip())
+    if not match:
+        return None
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tz = timezone.utc
+    if offset and offset != "Z":
+        sign = -1 if offset[0] == "-" else 1
+        digits = offset[1:].replace(":", "")
+        tz = timezone(sign * timedelta(hours=int(digits[:2]), minutes=int(digits[2:])))
+    moment = datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second), tzinfo=tz
+    )
+    seconds = moment.timestamp()
+    if fraction:
+        seconds += int(fraction) / 10 ** len(fraction)
+    return seconds
+
+
+def entry_mtime(entry: Dict[str, Any]) -> Optional[float]:
+    """Return the modification time of a listing entry in seconds since the epoch."""
+    mtime = parse_time(entry.get("mtime"))
+    if mtime is None:
+        mtime = parse_time(entry.get("modifiedAt"))
+    return mtime
+
+
+def path_sort_key(path: str) -> bytes:
+    """
+    Return the key that orders paths the way :func:`walk_listing` yields them.
+    
+    Paths compare component by component, which is the byte order of the
+    UTF-8 path with every separator replaced by a byte lower than any
+    other. Everything below a directory is therefore contiguous.
+    """
+    return path.encode("utf-8").replace(b"/", b"\x00")
+
+
+def walk_listing(
+    list_directory: Callable[[str], Optional[Dict[str, Any]]],
+    path: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    prefetch: int = 16
+) -> Iterator[Dict[str, Any]]:
+    """
+    Recursively iterate over a directory tree exposed by a listing endpoint.
+    
+    With an ``executor``, the listings of subdirectories are requested in
+    the background as soon as their parent has been listed, up to
+    ``prefetch`` at a time, so the walk is not limited by one request
+    round trip per directory. Entries are yielded in the same order.
+    
+    Args:
+        list_directory: Callable returning the listing (``{"files": [...]}``) of a directory
+        path: Directory to start from (optional, defaults to the root)
+        executor: Executor used to fetch listings ahead of the walk (optional)
+        prefetch: Maximum number of listings fetched ahead
+    
+    Yields:
+        dict: Entries below ``path``, depth first with children in name order
+    """
+    pending: Dict[str, "Future[Any]"] = {}
+    
+    def children(directory: str) -> Iterator[Dict[str, Any]]:
+        future = pending.pop(directory, None)
+        listing = future.result() if future is not None else list_directory(directory)
+        entries = [
+            entry for entry in (listing or {}).get("files", [])
+            if normalize_path(entry.get("path", "")) != directory
+        ]
+        entries.sort(key=lambda entry: entry.get("name", ""))
+        if executor is not None:
+            for entry in entries:
+                if len(pending) >= prefetch:
+                    break
+                if is_directory(entry):
+                    subdirectory = normalize_path(entry["path"])
+                    if subdirectory not in pending:
+                        pending[subdirectory] = executor.submit(list_directory, subdirectory)
+        return iter(entries)
+    
+    try:
+        stack = [children(normalize_path(path or "/"))]
+        while stack:
+            entry = next(stack[-1], None)
+            if entry is None:
+                stack.pop()
+                continue
+            yield entry
+            if is_directory(entry):
+                stack.append(children(normalize_path(entry["path"])))
+    finally:
+        for future in pending.values():
+            future.cancel()
+
+
+def merge_walks(
+    source: Iterable[Dict[str, Any]],
+    target: Iterable[Dict[str, Any]],
+    source_root: str = "/",
+    target_root: str = "/"
+) -> Iterator[Tuple[str, Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """
+    Pair up the entries of two walks of equivalent trees.
+    
+    Both inputs must be in :func:`walk_listing` order. Entries are matched
+    by their path relative to their root in a single streaming pass, so
+    memory use does not grow with the size of the trees.
+    
+    Args:
+        source: Entries of the first tree
+        target: Entries of the second tree
+        source_root: Directory the source walk started from
+        target_root: Directory the target walk started from
+    
+    Yields:
+        tuple: ``(relative_path, source_entry, target_entry)`` where the
+            entry missing from one side is None
+    """
+    def keyed(entries: Iterable[Dict[str, Any]], root: str) -> Iterator[Tuple[bytes, str, Dict[str, Any]]]:
+        root = normalize_path(root)
+        for entry in entries:
+            relative = posixpath.relpath(normalize_path(entry.get("path", "")), root)
+            yield path_sort_key(relative), relative, entry
+    
+    sources = keyed(source, source_root)
+    targets = keyed(target, target_root)
+    left = next(sources, None)
+    right = next(targets, None)
+    while left is not None or right is not None:
+        if right is None or (left is not None and left[0] < right[0]):
+            yield left[1], left[2], None
+            left = next(sources, None)
+        elif left is None or right[0] < left[0]:
+            yield right[1], None, right[2]
+            right = next(targets, None)
+        else:
+            yield left[1], left[2], right[2]
+            left = next(sources, None)
+            right = next(targets, None)
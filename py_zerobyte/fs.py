@@ -0,0 +1,209 @@
+"""Read-only fsspec filesystems over snapshot and volume listings.
+
+Requires the optional ``fsspec`` dependency (``pip install py-zerobyte[fsspec]``).
+Once installed, the ``zerobyte://`` and ``zerobyte-volume://`` protocols are
+registered with fsspec:
+
+    >>> import fsspec
+    >>> fs = fsspec.filesystem("zerobyte", url="http://localhost:4096", username="admin", password="secret")
+    >>> fs.ls("my-backup-repo/abc123/data")
+    >>> fs.du("my-backup-repo/abc123/data")
+"""
+
+from typing import Any, Dict, List, Optional
+
+from fsspec import AbstractFileSystem
+
+from .client import ZerobyteClient
+from .concurrency import imap_unordered
+from .exceptions import NotFoundError
+from .files import is_directory, normalize_path
+from .snapshots import _snapshot_id
+
+
+def _directory(name: str, **extra: Any) -> Dict[str, Any]:
+    info = {"name": name, "size": 0, "type": "directory"}
+    info.update(extra)
+    return info
+
+
+def _file_info(prefix: str, entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an API listing entry to an fsspec info dict below ``prefix``."""
+    info = {key: value for key, value in entry.items() if key not in ("name", "path", "type", "size")}
+    info["name"] = prefix + normalize_path(entry.get("path", "")).rstrip("/")
+    if is_directory(entry):
+        info["type"] = "directory"
+        info["size"] = 0
+    else:
+        info["type"] = "file" if entry.get("type", "file") == "file" else "other"
+        info["size"] = entry.get("size") or 0
+    return info
+
+
+class _ListingFileSystem(AbstractFileSystem):
+    """
+    Base class for filesystems backed by a directory listing endpoint.
+    
+    Listings are kept in fsspec's directory cache (see the
+    ``use_listings_cache``, ``listings_expiry_time`` and ``max_paths``
+    options). :meth:`find`, and therefore ``walk``, ``glob`` and ``du``,
+    lists each level of the tree concurrently.
+    
+    Args:
+        client: ZerobyteClient instance (optional if url, username and
+            password are given)
+        url: Base URL of the Zerobyte API
+        username: Username for authentication
+        password: Password for authentication
+        max_workers: Maximum number of concurrent listing requests
+        **storage_options: Options passed to ``AbstractFileSystem``
+    """
+    
+    root_marker = ""
+    
+    def __init__(
+        self,
+        client: Optional[ZerobyteClient] = None,
+        url: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        max_workers: int = 8,
+        **storage_options: Any
+    ):
+        """Initialize the filesystem with a client instance or credentials."""
+        super().__init__(**storage_options)
+        if client is None:
+            client = ZerobyteClient(url, username, password)
+        self.client = client
+        self.max_workers = max_workers
+    
+    def _fetch(self, path: str) -> List[Dict[str, Any]]:
+        """Return the info dicts of the entries directly inside ``path``."""
+        raise NotImplementedError
+    
+    def _listing(self, path: str) -> List[Dict[str, Any]]:
+        try:
+            return self._fetch(path)
+        except NotFoundError:
+            raise FileNotFoundError(path) from None
+    
+    def ls(self, path: str, detail: bool = True, **kwargs: Any) -> List[Any]:
+        path = self._strip_protocol(path)
+        if kwargs.get("refresh"):
+            self.dircache.pop(path, None)
+        try:
+            entries = self.dircache[path]
+        except KeyError:
+            entries = self._listing(path)
+            self.dircache[path] = entries
+        if detail:
+            return entries
+        return [entry["name"] for entry in entries]
+    
+    def _prefetch(self, path: str, maxdepth: Optional[int]) -> None:
+        """Fill the listing cache below ``path`` one level at a time, concurrently."""
+        if not self.dircache.use_listings_cache:
+            return
+        level = [path]
+        depth = 0
+        while level and (maxdepth is None or depth < maxdepth):
+            listings = {}
+            missing = []
+            for directory in level:
+                try:
+                    listings[directory] = self.dircache[directory]
+                except KeyError:
+                    missing.append(directory)
+            for directory, entries, error in imap_unordered(
+                self._listing, missing, max_workers=self.max_workers
+            ):
+                if error is None:
+                    self.dircache[directory] = entries
+                    listings[directory] = entries
+            level = [
+                entry["name"]
+                for entries in listings.values()
+                for entry in entries
+                if entry["type"] == "directory"
+            ]
+            depth += 1
+    
+    def find(
+        self,
+        path: str,
+        maxdepth: Optional[int] = None,
+        withdirs: bool = False,
+        detail: bool = False,
+        **kwargs: Any
+    ) -> Any:
+        self._prefetch(self._strip_protocol(path), maxdepth)
+        return super().find(path, maxdepth=maxdepth, withdirs=withdirs, detail=detail, **kwargs)
+    
+    def _open(self, path: str, mode: str = "rb", **kwargs: Any) -> Any:
+        raise NotImplementedError(
+            "The Zerobyte API exposes listings only; use snapshots.restore to retrieve file contents"
+        )
+
+
+class ZerobyteFileSystem(_ListingFileSystem):
+    """
+    Read-only view of every repository's snapshots.
+    
+    Paths have the form ``zerobyte://<repository>/<snapshot>/<path>``: the
+    root lists repositories, a repository lists its snapshots and a
+    snapshot lists the files it contains.
+    
+    Example:
+        >>> fs = ZerobyteFileSystem(client)
+        >>> fs.glob("my-backup-repo/abc123/data/**/*.pdf")
+        >>> fs.du("my-backup-repo/abc123/data")
+    """
+    
+    protocol = "zerobyte"
+    
+    def _fetch(self, path: str) -> List[Dict[str, Any]]:
+        parts = path.split("/", 2) if path else []
+        if not parts:
+            return [_directory(repo["name"]) for repo in self.client.repositories.list() or []]
+        if len(parts) == 1:
+            repository_name = parts[0]
+            return [
+                _directory(f"{repository_name}/{_snapshot_id(snapshot)}", snapshot=snapshot)
+                for snapshot in self.client.snapshots.list(repository_name) or []
+            ]
+        repository_name, snapshot_id = parts[0], parts[1]
+        directory = normalize_path(parts[2] if len(parts) > 2 else "/")
+        listing = self.client.snapshots.list_files(repository_name, snapshot_id, path=directory)
+        return [
+            _file_info(f"{repository_name}/{snapshot_id}", entry)
+            for entry in (listing or {}).get("files", [])
+            if normalize_path(entry.get("path", "")) != directory
+        ]
+
+
+class ZerobyteVolumeFileSystem(_ListingFileSystem):
+    """
+    Read-only view of the files on every volume.
+    
+    Paths have the form ``zerobyte-volume://<volume>/<path>``: the root
+    lists volumes by name and a volume lists its files.
+    
+    Example:
+        >>> fs = ZerobyteVolumeFileSystem(client)
+        >>> fs.find("my-volume/backups", maxdepth=2)
+    """
+    
+    protocol = "zerobyte-volume"
+    
+    def _fetch(self, path: str) -> List[Dict[str, Any]]:
+        parts = path.split("/", 1) if path else []
+        if not parts:
+            return [_directory(volume["name"]) for volume in self.client.volumes.list() or []]
+        volume_name = parts[0]
+        directory = normalize_path(parts[1] if len(parts) > 1 else "/")
+        listing = self.client.volumes.list_files(volume_name, path=directory)
+        return [
+            _file_info(volume_name, entry)
+            for entry in (listing or {}).get("files", [])
+            if normalize_path(entry.get("path", "")) != directory
+        ]
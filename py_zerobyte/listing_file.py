@@ -0,0 +1,415 @@
+"""Compact memory-mapped on-disk format for very large file listings.
+
+Layout (all integers little endian)::
+
+    header      magic, version, entry count, block size and section offsets
+    paths       blocks of front-coded UTF-8 paths; the first path of each
+                block is stored whole, the others as (shared prefix length,
+                suffix length, suffix) relative to the previous path
+    block index one uint64 file offset per block
+    columns     one fixed-width array per field: size (int64), mtime
+                (float64, NaN if unknown), mode, uid, gid (uint32) and
+                type (uint8)
+
+Entries are stored in :func:`~py_zerobyte.files.path_sort_key` order, the
+order in which the snapshot and volume walkers yield them, so a listing
+can be written while it is being walked and everything below a directory
+is one contiguous range.
+"""
+
+import math
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .files import TYPE_CODES, TYPE_NAMES, entry_mtime, normalize_path, path_sort_key
+
+
+_MAGIC = b"ZBLF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBxxxQIxxxxQQQ")
+_COLUMNS = (
+    ("size", "q"),
+    ("mtime", "d"),
+    ("mode", "I"),
+    ("uid", "I"),
+    ("gid", "I"),
+    ("type", "B"),
+)
+
+
+def _encode_varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(buffer, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = buffer[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _common_prefix_length(a: bytes, b: bytes) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _column_sections(count: int, start: int) -> Tuple[Dict[str, Tuple[int, str]], int]:
+    """Return the (offset, format) of every column and the end offset."""
+    sections = {}
+    offset = start
+    for name, fmt in _COLUMNS:
+        offset = (offset + 7) & ~7
+        sections[name] = (offset, fmt)
+        offset += struct.calcsize(fmt) * count
+    return sections, offset
+
+
+class ListingFileWriter:
+    """
+    Stream listing entries into a listing file.
+    
+    Entries must be added in walker order (see
+    :func:`~py_zerobyte.files.path_sort_key`); columns are spooled to
+    temporary files so memory use does not grow with the listing.
+    
+    Args:
+        path: Output file path
+        block_size: Number of paths per front-coded block
+    
+    Example:
+        >>> with ListingFileWriter("snapshot.zbl") as writer:
+        ...     for entry in client.snapshots.walk("my-backup-repo", "abc123"):
+        ...         writer.add(entry)
+    """
+    
+    def __init__(self, path: str, block_size: int = 64):
+        """Initialize ListingFileWriter and open the output file."""
+        if block_size < 1:
+            raise ValueError("block_size must be at least 1")
+        self.path = path
+        self.block_size = block_size
+        self.count = 0
+        self._tmp_path = path + ".tmp"
+        self._out = open(self._tmp_path, "wb")
+        self._out.write(b"\x00" * _HEADER.size)
+        self._spool_dir = tempfile.mkdtemp(prefix="zbl-", dir=os.path.dirname(os.path.abspath(path)))
+        self._blocks = open(os.path.join(self._spool_dir, "blocks"), "w+b")
+        self._columns = {
+            name: (open(os.path.join(self._spool_dir, name), "w+b"), struct.Struct("<" + fmt))
+            for name, fmt in _COLUMNS
+        }
+        self._previous_path = b""
+        self._previous_key = None
+    
+    def add(self, entry: Dict[str, Any]) -> None:
+        """
+        Append one listing entry.
+        
+        Raises:
+            ValueError: If the entry is not after the previous one in walker order
+        """
+        path = normalize_path(entry["path"])
+        key = path_sort_key(path)
+        if self._previous_key is not None and key <= self._previous_key:
+            raise ValueError(f"Entries must be added in walker order: {path!r}")
+        
+        encoded = path.encode("utf-8")
+        if self.count % self.block_size == 0:
+            self._blocks.write(struct.pack("<Q", self._out.tell()))
+            self._out.write(_encode_varint(len(encoded)))
+            self._out.write(encoded)
+        else:
+            shared = _common_prefix_length(self._previous_path, encoded)
+            suffix = encoded[shared:]
+            self._out.write(_encode_varint(shared))
+            self._out.write(_encode_varint(len(suffix)))
+            self._out.write(suffix)
+        
+        mtime = entry_mtime(entry)
+        values = {
+            "size": int(entry.get("size") or 0),
+            "mtime": math.nan if mtime is None else mtime,
+            "mode": int(entry.get("mode") or 0) & 0xFFFFFFFF,
+            "uid": int(entry.get("uid") or 0) & 0xFFFFFFFF,
+            "gid": int(entry.get("gid") or 0) & 0xFFFFFFFF,
+            "type": TYPE_CODES.get(entry.get("type"), 0),
+        }
+        for name, (spool, packer) in self._columns.items():
+            spool.write(packer.pack(values[name]))
+        
+        self._previous_path = encoded
+        self._previous_key = key
+        self.count += 1
+    
+    def add_all(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Append every entry of an iterable and return the total entry count."""
+        for entry in entries:
+            self.add(entry)
+        return self.count
+    
+    def close(self) -> None:
+        """Write the block index and columns and move the file into place."""
+        if self._out.closed:
+            return
+        try:
+            out = self._out
+            block_index_offset = out.tell()
+            self._blocks.seek(0)
+            shutil.copyfileobj(self._blocks, out)
+            
+            sections, _ = _column_sections(self.count, out.tell())
+            for name, (offset, _) in sections.items():
+                out.write(b"\x00" * (offset - out.tell()))
+                spool = self._columns[name][0]
+                spool.seek(0)
+                shutil.copyfileobj(spool, out)
+            
+            out.seek(0)
+            out.write(_HEADER.pack(
+                _MAGIC,
+                _VERSION,
+                self.count,
+                self.block_size,
+                (self.count + self.block_size - 1) // self.block_size,
+                block_index_offset,
+                sections["size"][0]
+            ))
+            out.close()
+            os.replace(self._tmp_path, self.path)
+        finally:
+            self._discard_spool()
+    
+    def abort(self) -> None:
+        """Discard the partially written file."""
+        if not self._out.closed:
+            self._out.close()
+        self._discard_spool()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+    
+    def _discard_spool(self) -> None:
+        self._blocks.close()
+        for spool, _ in self._columns.values():
+            spool.close()
+        shutil.rmtree(self._spool_dir, ignore_errors=True)
+    
+    def __enter__(self) -> "ListingFileWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_listing(path: str, entries: Iterable[Dict[str, Any]], block_size: int = 64) -> int:
+    """
+    Write a listing file from walker output.
+    
+    Args:
+        path: Output file path
+        entries: Entries in walker order, e.g. from ``client.snapshots.walk(...)``
+        block_size: Number of paths per front-coded block
+    
+    Returns:
+        int: Number of entries written
+    
+    Example:
+        >>> write_listing("snapshot.zbl", client.snapshots.walk("my-backup-repo", "abc123"))
+    """
+    with ListingFileWriter(path, block_size=block_size) as writer:
+        return writer.add_all(entries)
+
+
+class ListingFile:
+    """
+    Read-only, memory-mapped view of a listing file.
+    
+    Only the pages touched by a lookup are read, so resident memory stays
+    near zero regardless of the listing size.
+    
+    Args:
+        path: Listing file path
+    
+    Example:
+        >>> with ListingFile("snapshot.zbl") as listing:
+        ...     entry = listing.get("/data/report.pdf")
+        ...     for entry in listing.scan("/data/logs"):
+        ...         print(entry['path'], entry['size'])
+    """
+    
+    def __init__(self, path: str):
+        """Open and memory-map a listing file."""
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a listing file: {path}")
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a listing file: {path}")
+        (magic, version, self.count, self.block_size, self.num_blocks,
+         self._block_index_offset, columns_offset) = _HEADER.unpack_from(self._map)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"Not a listing file: {path}")
+        self._sections, _ = _column_sections(self.count, columns_offset)
+    
+    def close(self) -> None:
+        """Unmap and close the file."""
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+    
+    def __enter__(self) -> "ListingFile":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def column(self, name: str) -> memoryview:
+        """
+        Return a zero-copy view of one fixed-width column.
+        
+        Args:
+            name: One of size, mtime, mode, uid, gid, type
+        
+        Returns:
+            memoryview: Typed view over the mapped column. Release it
+                before calling :meth:`close`.
+        """
+        offset, fmt = self._sections[name]
+        length = struct.calcsize(fmt) * self.count
+        return memoryview(self._map)[offset:offset + length].cast(fmt)
+    
+    def _block_offset(self, block: int) -> int:
+        return struct.unpack_from("<Q", self._map, self._block_index_offset + 8 * block)[0]
+    
+    def _first_path(self, block: int) -> bytes:
+        length, offset = _decode_varint(self._map, self._block_offset(block))
+        return self._map[offset:offset + length]
+    
+    def _iter_paths(self, block: int) -> Iterator[Tuple[int, bytes]]:
+        """Yield (index, path) pairs from the start of a block to the end of the listing."""
+        buffer = self._map
+        index = block * self.block_size
+        previous = b""
+        while index < self.count:
+            offset = self._block_offset(index // self.block_size)
+            length, offset = _decode_varint(buffer, offset)
+            previous = buffer[offset:offset + length]
+            offset += length
+            yield index, previous
+            index += 1
+            for _ in range(1, self.block_size):
+                if index >= self.count:
+                    return
+                shared, offset = _decode_varint(buffer, offset)
+                length, offset = _decode_varint(buffer, offset)
+                previous = previous[:shared] + buffer[offset:offset + length]
+                offset += length
+                yield index, previous
+                index += 1
+    
+    def _find_block(self, key: bytes) -> int:
+        """Return the last block whose first key is <= key (0 if none)."""
+        lo, hi = 0, self.num_blocks - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if path_sort_key(self._first_path(mid).decode("utf-8")) <= key:
+                lo = mid
+            else:
+                hi = mid - 1
+        return max(lo, 0)
+    
+    def _entry(self, index: int, path: bytes) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"path": path.decode("utf-8")}
+        for name, (offset, fmt) in self._sections.items():
+            size = struct.calcsize(fmt)
+            entry[name] = struct.unpack_from("<" + fmt, self._map, offset + size * index)[0]
+        entry["type"] = TYPE_NAMES.get(entry["type"])
+        if math.isnan(entry["mtime"]):
+            entry["mtime"] = None
+        return entry
+    
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up one entry by binary search.
+        
+        Args:
+            path: Absolute path
+        
+        Returns:
+            dict: Entry with path, type, size, mtime (epoch seconds), mode,
+                uid and gid, or None if the path is not in the listing
+        """
+        if not self.count:
+            return None
+        target = normalize_path(path).encode("utf-8")
+        key = path_sort_key(target.decode("utf-8"))
+        for index, candidate in self._iter_paths(self._find_block(key)):
+            if candidate == target:
+                return self._entry(index, candidate)
+            if path_sort_key(candidate.decode("utf-8")) > key:
+                return None
+        return None
+    
+    def scan(self, prefix: str = "/", recursive: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the entries at and below a directory.
+        
+        Args:
+            prefix: Directory path; "/" scans the whole listing
+            recursive: Whether to include entries below direct children
+        
+        Yields:
+            dict: Entries in walker order
+        """
+        if not self.count:
+            return
+        directory = normalize_path(prefix)
+        if directory == "/":
+            start, base = b"", b"/"
+        else:
+            start = path_sort_key(directory)
+            base = directory.encode("utf-8") + b"/"
+        exact = directory.encode("utf-8")
+        for index, candidate in self._iter_paths(self._find_block(start)):
+            key = path_sort_key(candidate.decode("utf-8"))
+            if key < start:
+                continue
+            if candidate != exact and not candidate.startswith(base):
+                return
+            if not recursive and b"/" in candidate[len(base):]:
+                continue
+            yield self._entry(index, candidate)
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.scan("/")
+    
+    def paths(self) -> List[str]:
+        """Return every path in the listing."""
+        return [path.decode("utf-8") for _, path in self._iter_paths(0)]
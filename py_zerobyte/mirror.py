@@ -0,0 +1,319 @@
+"""Mirror consistency checks based on Merkle hashes of snapshot listings."""
+
+import hashlib
+import json
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+from .files import is_directory, normalize_path
+from .snapshots import _snapshot_id
+
+
+_VERSION = 1
+_TREE_SUFFIX = ".merkle.json"
+
+# Directory path to {child name: hex digest of the child}
+Tree = Dict[str, Dict[str, str]]
+
+
+def _entry_digest(entry: Dict[str, Any], subtree: Optional[str] = None) -> str:
+    """Hash the attributes of one entry, plus the digest of its contents for directories."""
+    record = [
+        "dir" if is_directory(entry) else entry.get("type"),
+        None if is_directory(entry) else entry.get("size"),
+        entry.get("mtime"),
+        entry.get("mode"),
+        subtree,
+    ]
+    data = json.dumps(record, separators=(",", ":"), sort_keys=True).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def directory_digest(children: Dict[str, str]) -> str:
+    """Hash a directory from the digests of its children."""
+    hasher = hashlib.blake2b(digest_size=16)
+    for name in sorted(children):
+        hasher.update(name.encode("utf-8") + b"\x00" + children[name].encode("ascii") + b"\x00")
+    return hasher.hexdigest()
+
+
+def build_tree(entries, root: str = "/") -> Tree:
+    """
+    Compute the Merkle tree of a listing walk.
+    
+    Args:
+        entries: Entries in :func:`~py_zerobyte.files.walk_listing` order
+        root: Directory the walk started from
+    
+    Returns:
+        dict: Directory path to the digests of its children. A directory's
+            digest covers the path, type, size, mtime and mode of
+            everything below it.
+    """
+    tree: Tree = {}
+    # (directory path, child digests, directory entry)
+    stack: List[Tuple[str, Dict[str, str], Optional[Dict[str, Any]]]] = [
+        (normalize_path(root), {}, None)
+    ]
+    
+    def close_directory() -> None:
+        directory, children, entry = stack.pop()
+        tree[directory] = children
+        stack[-1][1][posixpath.basename(directory)] = _entry_digest(entry, directory_digest(children))
+    
+    for entry in entries:
+        path = normalize_path(entry.get("path", ""))
+        parent = posixpath.dirname(path)
+        while len(stack) > 1 and stack[-1][0] != parent:
+            close_directory()
+        if is_directory(entry):
+            stack.append((path, {}, entry))
+        else:
+            stack[-1][1][posixpath.basename(path)] = _entry_digest(entry)
+    while len(stack) > 1:
+        close_directory()
+    tree[stack[0][0]] = stack[0][1]
+    return tree
+
+
+def compare_trees(
+    primary: Tree,
+    mirror: Tree,
+    primary_root: str = "/",
+    mirror_root: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """
+    Find the differences between two Merkle trees, top-down.
+    
+    Only directories whose digests differ are descended into.
+    
+    Args:
+        primary: Tree of the primary snapshot
+        mirror: Tree of the mirror snapshot
+        primary_root: Root directory of the primary tree
+        mirror_root: Root directory of the mirror tree (optional, defaults
+            to ``primary_root``)
+    
+    Returns:
+        list: ``{"path", "reason"}`` dicts, relative to the roots, with reason
+            "missing" (only in the primary), "extra" (only in the mirror) or
+            "changed"
+    """
+    primary_root = normalize_path(primary_root)
+    mirror_root = normalize_path(mirror_root) if mirror_root is not None else primary_root
+    differences = []
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        left = primary.get(posixpath.join(primary_root, relative).rstrip("/") or "/", {})
+        right = mirror.get(posixpath.join(mirror_root, relative).rstrip("/") or "/", {})
+        if directory_digest(left) == directory_digest(right):
+            continue
+        for name in sorted(set(left) | set(right), reverse=True):
+            child = posixpath.join(relative, name)
+            if name not in right:
+                differences.append({"path": child, "reason": "missing"})
+            elif name not in left:
+                differences.append({"path": child, "reason": "extra"})
+            elif left[name] != right[name]:
+                if (posixpath.join(primary_root, child) in primary
+                        and posixpath.join(mirror_root, child) in mirror):
+                    pending.append(child)
+                else:
+                    differences.append({"path": child, "reason": "changed"})
+    differences.sort(key=lambda difference: difference["path"].split("/"))
+    return differences
+
+
+def _snapshot_key(snapshot: Dict[str, Any]) -> Tuple[Any, Tuple[str, ...]]:
+    """Key identifying a snapshot and its copies, which keep the time and paths."""
+    return snapshot.get("time"), tuple(sorted(snapshot.get("paths") or []))
+
+
+class MirrorVerifier:
+    """
+    Verify that mirror repositories hold the same data as their primary.
+    
+    Snapshots are paired by time and backed-up paths, which ``restic copy``
+    preserves while assigning new IDs. For each pair, a Merkle tree of
+    the snapshot listings is built (path, size, mtime and mode of every
+    entry) and the trees are compared top-down, descending only into
+    directories whose digests differ.
+    
+    The API exposes no content hashes, so building a tree needs one full
+    listing walk. Snapshots are immutable, so trees are built once and,
+    with a ``cache_dir``, persisted under
+    ``cache_dir/<repository>/<snapshot>.merkle.json``; later verifications
+    only list snapshots created since.
+    
+    Args:
+        client: ZerobyteClient instance
+        cache_dir: Directory holding persisted trees (optional)
+        max_workers: Maximum number of concurrent listing requests per walk
+    
+    Example:
+        >>> verifier = MirrorVerifier(client, cache_dir="~/.cache/zerobyte")
+        >>> report = verifier.verify("my-backup-repo", "offsite-mirror", limit=5)
+        >>> print(report['ok'], len(report['missing']))
+    """
+    
+    def __init__(self, client, cache_dir: Optional[str] = None, max_workers: int = 8):
+        """Initialize MirrorVerifier with client instance."""
+        self.client = client
+        self.cache_dir = os.path.expanduser(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self._trees: Dict[Tuple[str, str], Tree] = {}
+    
+    def _tree_path(self, repository_name: str, snapshot_id: str) -> str:
+        return os.path.join(
+            self.cache_dir,
+            quote(repository_name, safe=""),
+            quote(snapshot_id, safe="") + _TREE_SUFFIX
+        )
+    
+    def _load(self, repository_name: str, snapshot_id: str) -> Optional[Tree]:
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self._tree_path(repository_name, snapshot_id)) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data.get("tree") if data.get("version") == _VERSION else None
+    
+    def _save(self, repository_name: str, snapshot_id: str, tree: Tree) -> None:
+        if self.cache_dir is None:
+            return
+        target = self._tree_path(repository_name, snapshot_id)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target + ".tmp", "w") as f:
+            json.dump({"version": _VERSION, "tree": tree}, f)
+        os.replace(target + ".tmp", target)
+    
+    def tree(self, repository_name: str, snapshot_id: str) -> Tree:
+        """
+        Build (or load) the Merkle tree of one snapshot.
+        
+        Args:
+            repository_name: Repository name
+            snapshot_id: Snapshot ID
+        
+        Returns:
+            dict: See :func:`build_tree`
+        """
+        key = (repository_name, snapshot_id)
+        if key not in self._trees:
+            tree = self._load(repository_name, snapshot_id)
+            if tree is None:
+                with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                    tree = build_tree(
+                        self.client.snapshots.walk(repository_name, snapshot_id, executor=executor)
+                    )
+                self._save(repository_name, snapshot_id, tree)
+            self._trees[key] = tree
+        return self._trees[key]
+    
+    def compare_snapshots(
+        self,
+        primary_repository: str,
+        primary_snapshot_id: str,
+        mirror_repository: str,
+        mirror_snapshot_id: str
+    ) -> List[Dict[str, str]]:
+        """
+        Compare one snapshot with its copy.
+        
+        Args:
+            primary_repository: Primary repository name
+            primary_snapshot_id: Snapshot ID in the primary repository
+            mirror_repository: Mirror repository name
+            mirror_snapshot_id: Snapshot ID in the mirror repository
+        
+        Returns:
+            list: Differences (see :func:`compare_trees`), empty if identical
+        """
+        return compare_trees(
+            self.tree(primary_repository, primary_snapshot_id),
+            self.tree(mirror_repository, mirror_snapshot_id)
+        )
+    
+    def verify(
+        self,
+        primary_repository: str,
+        mirror_repository: str,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Verify a mirror repository against its primary.
+        
+        Args:
+            primary_repository: Primary repository name
+            mirror_repository: Mirror repository name
+            limit: Only check the ``limit`` most recent primary snapshots (optional)
+        
+        Returns:
+            dict: Verification result containing:
+                - ok (bool): True if every checked snapshot has an identical copy
+                - matched (int): Number of snapshot pairs compared
+                - missing (list): Primary snapshots without a copy in the mirror
+                - differences (list): ``{"primary", "mirror", "changes"}`` dicts
+                    for pairs whose contents differ
+        """
+        primary = sorted(
+            self.client.snapshots.list(primary_repository) or [],
+            key=lambda snapshot: snapshot.get("time") or 0
+        )
+        if limit is not None:
+            primary = primary[-limit:] if limit > 0 else []
+        copies = {
+            _snapshot_key(snapshot): snapshot
+            for snapshot in self.client.snapshots.list(mirror_repository) or []
+        }
+        
+        result: Dict[str, Any] = {"ok": True, "matched": 0, "missing": [], "differences": []}
+        for snapshot in primary:
+            copy = copies.get(_snapshot_key(snapshot))
+            if copy is None:
+                result["missing"].append(snapshot)
+                continue
+            result["matched"] += 1
+            changes = self.compare_snapshots(
+                primary_repository, _snapshot_id(snapshot), mirror_repository, _snapshot_id(copy)
+            )
+            if changes:
+                result["differences"].append({"primary": snapshot, "mirror": copy, "changes": changes})
+        result["ok"] = not result["missing"] and not result["differences"]
+        return result
+    
+    def verify_schedule(
+        self,
+        volume_id: int,
+        repository_id: int,
+        schedule_id: int,
+        repository_name: str,
+        limit: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify every enabled mirror of a backup schedule.
+        
+        Args:
+            volume_id: Volume ID
+            repository_id: Repository ID
+            schedule_id: Schedule ID
+            repository_name: Name of the schedule's primary repository
+            limit: Only check the ``limit`` most recent snapshots (optional)
+        
+        Returns:
+            dict: Mirror repository name to :meth:`verify` result
+        """
+        mirrors = self.client.backup_schedules.get_mirrors(volume_id, repository_id, schedule_id) or []
+        results = {}
+        for mirror in mirrors:
+            if mirror.get("enabled") is False:
+                continue
+            name = (mirror.get("repository") or {}).get("name") or mirror.get("repositoryId")
+            results[name] = self.verify(repository_name, name, limit=limit)
+        return results
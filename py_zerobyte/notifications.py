@@ -1,6 +1,8 @@
 """Notifications API methods."""
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
+
+from .resolver import invalidate, resolve_id
 
 
 class NotificationsAPI:
@@ -10,6 +12,10 @@ class NotificationsAPI:
         """Initialize NotificationsAPI with client instance."""
         self.client = client
     
+    def _ref(self, destination_id: Union[int, str]) -> Union[int, str]:
+        """Return the ID a destination is addressed by."""
+        return resolve_id(self.client, "destinations", destination_id)
+    
     def list_destinations(self) -> List[Dict[str, Any]]:
         """
         List all notification destinations.
@@ -51,18 +57,20 @@ class NotificationsAPI:
             ...     }
             ... })
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "POST",
             "/api/v1/notification-destinations",
             data=destination_data
         )
+        invalidate(self.client, "destinations")
+        return response
     
-    def get_destination(self, destination_id: int) -> Dict[str, Any]:
+    def get_destination(self, destination_id: Union[int, str]) -> Dict[str, Any]:
         """
         Get a specific notification destination.
         
         Args:
-            destination_id: Destination ID
+            destination_id: Destination ID or name
         
         Returns:
             dict: Notification destination details
@@ -73,19 +81,19 @@ class NotificationsAPI:
         """
         return self.client._make_request(
             "GET",
-            f"/api/v1/notification-destinations/{destination_id}"
+            f"/api/v1/notification-destinations/{self._ref(destination_id)}"
         )
     
     def update_destination(
         self,
-        destination_id: int,
+        destination_id: Union[int, str],
         destination_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         """
         Update a notification destination.
         
         Args:
-            destination_id: Destination ID
+            destination_id: Destination ID or name
             destination_data: Updated destination configuration
         
         Returns:
@@ -97,18 +105,20 @@ class NotificationsAPI:
             ...     {"name": "Updated Email Alerts"}
             ... )
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "PUT",
-            f"/api/v1/notification-destinations/{destination_id}",
+            f"/api/v1/notification-destinations/{self._ref(destination_id)}",
             data=destination_data
         )
+        invalidate(self.client, "destinations")
+        return response
     
-    def delete_destination(self, destination_id: int) -> Dict[str, Any]:
+    def delete_destination(self, destination_id: Union[int, str]) -> Dict[str, Any]:
         """
         Delete a notification destination.
         
         Args:
-            destination_id: Destination ID
+            destination_id: Destination ID or name
         
         Returns:
             dict: Deletion response
@@ -116,17 +126,19 @@ class NotificationsAPI:
         Example:
             >>> response = client.notifications.delete_destination(1)
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "DELETE",
-            f"/api/v1/notification-destinations/{destination_id}"
+            f"/api/v1/notification-destinations/{self._ref(destination_id)}"
         )
+        invalidate(self.client, "destinations")
+        return response
     
-    def test_destination(self, destination_id: int) -> Dict[str, Any]:
+    def test_destination(self, destination_id: Union[int, str]) -> Dict[str, Any]:
         """
         Test a notification destination.
         
         Args:
-            destination_id: Destination ID
+            destination_id: Destination ID or name
         
         Returns:
             dict: Test result
@@ -138,5 +150,5 @@ class NotificationsAPI:
         """
         return self.client._make_request(
             "POST",
-            f"/api/v1/notification-destinations/{destination_id}/test"
+            f"/api/v1/notification-destinations/{self._ref(destination_id)}/test"
         )
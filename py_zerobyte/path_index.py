@@ -0,0 +1,305 @@
+"""Per-snapshot Bloom filter indexes for fast path existence queries."""
+
+import hashlib
+import math
+import os
+import struct
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from .files import normalize_path
+from .snapshots import _snapshot_id
+
+
+_MAGIC = b"ZBBF"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBQQ")
+_FILTER_SUFFIX = ".bloom"
+
+
+def _path_hashes(path: str) -> Tuple[int, int]:
+    """Return the two base hashes used to derive a path's bit positions."""
+    digest = hashlib.blake2b(path.encode("utf-8"), digest_size=16).digest()
+    h1, h2 = struct.unpack("<QQ", digest)
+    # An even step would only visit half of the bits of an even-sized filter
+    return h1, h2 | 1
+
+
+class BloomFilter:
+    """
+    Compact probabilistic set of paths.
+    
+    Membership tests never return false negatives; false positives occur
+    at roughly the rate the filter was sized for.
+    
+    Args:
+        num_bits: Size of the bit array
+        num_hashes: Number of bit positions set per item
+    
+    Example:
+        >>> bloom = BloomFilter.for_capacity(1000, false_positive_rate=0.01)
+        >>> bloom.add("/data/report.pdf")
+        >>> "/data/report.pdf" in bloom
+        True
+    """
+    
+    def __init__(self, num_bits: int, num_hashes: int):
+        """Initialize an empty BloomFilter."""
+        self.num_bits = max(8, num_bits)
+        self.num_hashes = max(1, num_hashes)
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    @classmethod
+    def for_capacity(cls, capacity: int, false_positive_rate: float = 0.01) -> "BloomFilter":
+        """
+        Create a filter sized for an expected number of items.
+        
+        Args:
+            capacity: Expected number of items
+            false_positive_rate: Target false positive probability
+        
+        Returns:
+            BloomFilter: Empty filter
+        """
+        capacity = max(1, capacity)
+        num_bits = int(math.ceil(-capacity * math.log(false_positive_rate) / (math.log(2) ** 2)))
+        num_hashes = int(round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes)
+    
+    def _positions(self, hashes: Tuple[int, int]) -> Iterable[int]:
+        h1, h2 = hashes
+        num_bits = self.num_bits
+        return ((h1 + i * h2) % num_bits for i in range(self.num_hashes))
+    
+    def add(self, path: str) -> None:
+        """Add a path to the filter."""
+        bits = self._bits
+        for position in self._positions(_path_hashes(path)):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def contains_hashes(self, hashes: Tuple[int, int]) -> bool:
+        """
+        Test membership using precomputed hashes.
+        
+        Lets callers hash a path once and test it against many filters.
+        
+        Args:
+            hashes: Base hashes of the path, as computed by the index
+        
+        Returns:
+            bool: False if the path is definitely absent
+        """
+        bits = self._bits
+        for position in self._positions(hashes):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+    
+    def __contains__(self, path: str) -> bool:
+        return self.contains_hashes(_path_hashes(path))
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def to_bytes(self) -> bytes:
+        """Serialize the filter."""
+        header = _HEADER.pack(_MAGIC, _VERSION, self.num_hashes, self.num_bits, self.count)
+        return header + bytes(self._bits)
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Deserialize a filter produced by :meth:`to_bytes`.
+        
+        Raises:
+            ValueError: If the data is not a serialized filter
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Truncated Bloom filter data")
+        magic, version, num_hashes, num_bits, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unsupported Bloom filter format")
+        bloom = cls(num_bits, num_hashes)
+        bits = data[_HEADER.size:]
+        if len(bits) != len(bloom._bits):
+            raise ValueError("Truncated Bloom filter data")
+        bloom._bits[:] = bits
+        bloom.count = count
+        return bloom
+
+
+class SnapshotPathIndex:
+    """
+    Bloom filter index answering "which snapshots contain this path".
+    
+    A filter is built once per snapshot from a full walk of its listing and
+    persisted under ``cache_dir/<repository>/<snapshot>.bloom``. Snapshots
+    are immutable, so filters never go stale. Queries test every persisted
+    filter locally and only verify probable hits with the API.
+    
+    Args:
+        client: ZerobyteClient instance
+        cache_dir: Directory holding the persisted filters
+        false_positive_rate: Target false positive rate of new filters
+    
+    Example:
+        >>> index = SnapshotPathIndex(client, "~/.cache/zerobyte")
+        >>> index.build_repository("my-backup-repo")
+        >>> hits = index.find(["/etc/passwd", "/data/report.pdf"])
+    """
+    
+    def __init__(self, client, cache_dir: str, false_positive_rate: float = 0.01):
+        """Initialize SnapshotPathIndex with client instance."""
+        self.client = client
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.false_positive_rate = false_positive_rate
+        self._filters: Dict[Tuple[str, str], BloomFilter] = {}
+    
+    def _filter_path(self, repository_name: str, snapshot_id: str) -> str:
+        return os.path.join(
+            self.cache_dir,
+            quote(repository_name, safe=""),
+            quote(snapshot_id, safe="") + _FILTER_SUFFIX
+        )
+    
+    def _load(self, repository_name: str, snapshot_id: str) -> Optional[BloomFilter]:
+        key = (repository_name, snapshot_id)
+        if key not in self._filters:
+            try:
+                with open(self._filter_path(repository_name, snapshot_id), "rb") as f:
+                    self._filters[key] = BloomFilter.from_bytes(f.read())
+            except (OSError, ValueError):
+                return None
+        return self._filters[key]
+    
+    def build(self, repository_name: str, snapshot_id: str) -> BloomFilter:
+        """
+        Build (or load) the filter for one snapshot.
+        
+        Args:
+            repository_name: Repository name
+            snapshot_id: Snapshot ID
+        
+        Returns:
+            BloomFilter: Filter of every path in the snapshot
+        """
+        bloom = self._load(repository_name, snapshot_id)
+        if bloom is not None:
+            return bloom
+        
+        paths = [
+            normalize_path(entry["path"])
+            for entry in self.client.snapshots.walk(repository_name, snapshot_id)
+        ]
+        bloom = BloomFilter.for_capacity(len(paths), self.false_positive_rate)
+        for path in paths:
+            bloom.add(path)
+        
+        target = self._filter_path(repository_name, snapshot_id)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open(target + ".tmp", "wb") as f:
+            f.write(bloom.to_bytes())
+        os.replace(target + ".tmp", target)
+        
+        self._filters[(repository_name, snapshot_id)] = bloom
+        return bloom
+    
+    def build_repository(self, repository_name: str) -> int:
+        """
+        Build filters for every snapshot of a repository that lacks one.
+        
+        Args:
+            repository_name: Repository name
+        
+        Returns:
+            int: Number of filters built
+        """
+        built = 0
+        for snapshot in self.client.snapshots.list(repository_name) or []:
+            snapshot_id = _snapshot_id(snapshot)
+            if self._load(repository_name, snapshot_id) is None:
+                self.build(repository_name, snapshot_id)
+                built += 1
+        return built
+    
+    def indexed_snapshots(self) -> List[Tuple[str, str]]:
+        """
+        List the snapshots that have a persisted filter.
+        
+        Returns:
+            list: (repository_name, snapshot_id) pairs
+        """
+        snapshots = []
+        if not os.path.isdir(self.cache_dir):
+            return snapshots
+        for repository_dir in sorted(os.listdir(self.cache_dir)):
+            directory = os.path.join(self.cache_dir, repository_dir)
+            if not os.path.isdir(directory):
+                continue
+            for filename in sorted(os.listdir(directory)):
+                if filename.endswith(_FILTER_SUFFIX):
+                    snapshots.append((
+                        unquote(repository_dir),
+                        unquote(filename[:-len(_FILTER_SUFFIX)])
+                    ))
+        return snapshots
+    
+    def candidates(self, paths: Iterable[str]) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Find the snapshots that probably contain each path, without API calls.
+        
+        Args:
+            paths: Absolute paths to look for
+        
+        Returns:
+            dict: Path to list of (repository_name, snapshot_id) pairs whose
+                filter matches. Paths without any match map to an empty list.
+        """
+        hashed = {}
+        for path in paths:
+            normalized = normalize_path(path)
+            hashed[normalized] = _path_hashes(normalized)
+        
+        matches: Dict[str, List[Tuple[str, str]]] = {path: [] for path in hashed}
+        for key in self.indexed_snapshots():
+            bloom = self._load(*key)
+            if bloom is None:
+                continue
+            for path, hashes in hashed.items():
+                if bloom.contains_hashes(hashes):
+                    matches[path].append(key)
+        return matches
+    
+    def find(self, paths: Iterable[str], verify: bool = True) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the snapshots that contain each path.
+        
+        Negative answers come from the local filters alone; probable hits
+        are confirmed with :meth:`SnapshotsAPI.find_entry` unless
+        ``verify`` is False.
+        
+        Args:
+            paths: Absolute paths to look for
+            verify: Whether to confirm probable hits against the API
+        
+        Returns:
+            dict: Path to list of matches, each with ``repository``,
+                ``snapshot_id`` and ``entry`` (None when not verified)
+        """
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for path, keys in self.candidates(paths).items():
+            results[path] = []
+            for repository_name, snapshot_id in keys:
+                entry = None
+                if verify:
+                    entry = self.client.snapshots.find_entry(repository_name, snapshot_id, path)
+                    if entry is None:
+                        continue
+                results[path].append({
+                    "repository": repository_name,
+                    "snapshot_id": snapshot_id,
+                    "entry": entry
+                })
+        return results
@@ -0,0 +1,322 @@
+"""Compiled restic-style include/exclude patterns."""
+
+import posixpath
+import re
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern, Set, Tuple
+
+from .files import is_directory, normalize_path
+
+
+def _translate_component(component: str) -> str:
+    """Translate one Go ``filepath.Match`` component to a regex that never crosses '/'."""
+    parts = []
+    i = 0
+    while i < len(component):
+        char = component[i]
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "\\" and i + 1 < len(component):
+            i += 1
+            parts.append(re.escape(component[i]))
+        elif char == "[":
+            end = component.find("]", i + 2 if component[i + 1:i + 2] in ("^", "]") else i + 1)
+            if end == -1:
+                parts.append(re.escape(char))
+            else:
+                body = component[i + 1:end]
+                negate = body.startswith("^")
+                if negate:
+                    body = body[1:]
+                body = body.replace("[", "\\[")
+                parts.append(f"[^/{body}]" if negate else f"(?!/)[{body}]")
+                i = end
+        else:
+            parts.append(re.escape(char))
+        i += 1
+    return "".join(parts)
+
+
+def _is_literal(component: str) -> bool:
+    return not any(char in component for char in "*?[\\")
+
+
+def _split_pattern(pattern: str) -> Tuple[bool, List[str]]:
+    """Return whether a pattern is anchored at the root, and its components."""
+    anchored = pattern.startswith("/")
+    cleaned = posixpath.normpath(pattern) if pattern else ""
+    components = [part for part in cleaned.split("/") if part and part != "."]
+    return anchored, components
+
+
+def _pattern_regex(anchored: bool, components: List[str]) -> str:
+    body = "".join(
+        "(?:/[^/]*)*" if component == "**" else "/" + _translate_component(component)
+        for component in components
+    )
+    return ("^" if anchored else "") + body + "(?=/|$)"
+
+
+class PatternSet:
+    """
+    A list of restic patterns compiled for matching many paths.
+    
+    Matching follows restic's ``filter`` package: a pattern starting with
+    "/" is anchored at the root, any other pattern may match at any depth;
+    a pattern matches a path if it matches the path or one of its parent
+    directories; ``*``, ``?`` and ``[...]`` never match "/", and a ``**``
+    component matches any number of directories. Patterns starting with
+    "!" re-include what earlier patterns matched (the last matching
+    pattern wins).
+    
+    Rather than testing the patterns one by one, the set is compiled once:
+    literal root-anchored patterns go into a trie of path components,
+    literal single names into a hash set, and every other pattern into one
+    combined regular expression.
+    
+    Args:
+        patterns: Pattern strings
+        case_sensitive: Whether matching is case sensitive
+    
+    Example:
+        >>> excludes = PatternSet(["*.tmp", "/data/cache", "node_modules"])
+        >>> excludes.matches("/data/project/node_modules/left-pad/index.js")
+        True
+    """
+    
+    def __init__(self, patterns: Iterable[str], case_sensitive: bool = True):
+        """Compile the patterns."""
+        self.patterns = [pattern for pattern in patterns if pattern and pattern.strip()]
+        self.case_sensitive = case_sensitive
+        self._flags = 0 if case_sensitive else re.IGNORECASE
+        self._has_negation = any(pattern.startswith("!") for pattern in self.patterns)
+        # (negated, anchored, components, compiled regex) per pattern, in order
+        self._compiled: List[Tuple[bool, bool, List[str], Pattern[str]]] = []
+        
+        self._trie: Dict[str, Any] = {}
+        self._names: Set[str] = set()
+        regexes = []
+        for pattern in self.patterns:
+            negated = pattern.startswith("!")
+            anchored, components = _split_pattern(pattern[1:] if negated else pattern)
+            if not components:
+                continue
+            regex = _pattern_regex(anchored, components)
+            self._compiled.append((negated, anchored, components, re.compile(regex, self._flags)))
+            if negated:
+                continue
+            if all(_is_literal(component) for component in components):
+                components = [self._fold(component) for component in components]
+                if anchored:
+                    node = self._trie
+                    for component in components:
+                        node = node.setdefault(component, {})
+                    node[None] = True
+                    continue
+                if len(components) == 1:
+                    self._names.add(components[0])
+                    continue
+            regexes.append(f"(?:{regex})")
+        self._regex = re.compile("|".join(regexes), self._flags) if regexes else None
+    
+    def __len__(self) -> int:
+        return len(self._compiled)
+    
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+    
+    def _any_positive(self, path: str) -> bool:
+        components = self._fold(path).split("/")[1:]
+        if self._names and not self._names.isdisjoint(components):
+            return True
+        node = self._trie
+        for component in components:
+            node = node.get(component)
+            if node is None:
+                break
+            if None in node:
+                return True
+        return self._regex is not None and self._regex.search(path) is not None
+    
+    def matches(self, path: str) -> bool:
+        """
+        Test whether the pattern set matches a path.
+        
+        Args:
+            path: Absolute path
+        
+        Returns:
+            bool: True if the last pattern matching the path is not negated
+        """
+        path = normalize_path(path)
+        if path == "/":
+            return False
+        if not self._has_negation:
+            return self._any_positive(path)
+        if not self._any_positive(path):
+            return False
+        for negated, _, _, regex in reversed(self._compiled):
+            if regex.search(path):
+                return not negated
+        return False
+    
+    def may_match_below(self, directory: str) -> bool:
+        """
+        Test whether some path below a directory could match (restic's ``ChildMatch``).
+        
+        Used to prune walks for include patterns: a directory for which
+        this returns False, and which does not match itself, contains no
+        matching path.
+        
+        Args:
+            directory: Absolute directory path
+        
+        Returns:
+            bool: False only if no path below the directory can match
+        """
+        components = [self._fold(part) for part in normalize_path(directory).split("/")[1:] if part]
+        for negated, anchored, pattern_components, _ in self._compiled:
+            if negated:
+                continue
+            if not anchored or "**" in pattern_components[:len(components) + 1]:
+                return True
+            prefix = pattern_components[:len(components)]
+            if all(
+                re.fullmatch(_translate_component(part), component, self._flags)
+                for part, component in zip(prefix, components)
+            ):
+                return True
+        return False
+
+
+def _marker_name(marker: str) -> str:
+    """Strip the optional ``:header`` suffix of an ``excludeIfPresent`` entry."""
+    return marker.split(":", 1)[0]
+
+
+class PathFilter:
+    """
+    The path selection of a backup schedule, evaluated client-side.
+    
+    Args:
+        include_patterns: Schedule ``includePatterns``; when given, only
+            matching paths (and the contents of matching directories) are
+            selected
+        exclude_patterns: Schedule ``excludePatterns``
+        exclude_if_present: Schedule ``excludeIfPresent`` file names; a
+            directory containing one of them is excluded. Contents after an
+            optional ":" (a required file header) cannot be checked through
+            the API and are ignored.
+        case_sensitive: Whether patterns are matched case sensitively
+    
+    Example:
+        >>> schedule = client.backup_schedules.get(1, 1, 1)
+        >>> selection = PathFilter.from_schedule(schedule)
+        >>> for entry in selection.filter(client.volumes.walk(1)):
+        ...     print(entry['path'])
+    """
+    
+    def __init__(
+        self,
+        include_patterns: Optional[Iterable[str]] = None,
+        exclude_patterns: Optional[Iterable[str]] = None,
+        exclude_if_present: Optional[Iterable[str]] = None,
+        case_sensitive: bool = True
+    ):
+        """Compile the schedule's patterns."""
+        self.include = PatternSet(include_patterns or [], case_sensitive=case_sensitive)
+        self.exclude = PatternSet(exclude_patterns or [], case_sensitive=case_sensitive)
+        self.markers = {_marker_name(marker) for marker in exclude_if_present or [] if marker}
+    
+    @classmethod
+    def from_schedule(cls, schedule: Dict[str, Any], case_sensitive: bool = True) -> "PathFilter":
+        """
+        Build the filter of a backup schedule.
+        
+        Args:
+            schedule: Schedule with includePatterns, excludePatterns and
+                excludeIfPresent (missing or null values select everything)
+            case_sensitive: Whether patterns are matched case sensitively
+        
+        Returns:
+            PathFilter: Compiled filter
+        """
+        return cls(
+            schedule.get("includePatterns"),
+            schedule.get("excludePatterns"),
+            schedule.get("excludeIfPresent"),
+            case_sensitive=case_sensitive
+        )
+    
+    def selects(self, path: str) -> bool:
+        """
+        Test whether a path is selected by the patterns (ignoring markers).
+        
+        Args:
+            path: Absolute path
+        
+        Returns:
+            bool: True if the path is included and not excluded
+        """
+        if self.exclude.matches(path):
+            return False
+        return not len(self.include) or self.include.matches(path)
+    
+    def should_descend(self, directory: str) -> bool:
+        """
+        Test whether a walk needs to enter a directory.
+        
+        Args:
+            directory: Absolute directory path
+        
+        Returns:
+            bool: False if nothing below the directory can be selected
+        """
+        if self.exclude.matches(directory):
+            return False
+        return (
+            not len(self.include)
+            or self.include.matches(directory)
+            or self.include.may_match_below(directory)
+        )
+    
+    def has_marker(self, names: Iterable[str]) -> bool:
+        """
+        Test whether a directory listing contains an ``excludeIfPresent`` marker.
+        
+        Args:
+            names: Names of the entries in the directory
+        
+        Returns:
+            bool: True if the directory is excluded by a marker file
+        """
+        return bool(self.markers) and not self.markers.isdisjoint(names)
+    
+    def filter(self, entries: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Select the entries of a walk.
+        
+        Entries below a directory that cannot contain selected paths are
+        skipped without testing them. ``excludeIfPresent`` markers need a
+        directory's listing before its entries are selected, which a
+        streaming walk does not provide; use a walk that checks
+        :meth:`has_marker` (such as ``backup_schedules.preview``) for them.
+        
+        Args:
+            entries: Entries in :func:`~py_zerobyte.files.walk_listing` order
+        
+        Yields:
+            dict: Selected entries
+        """
+        pruned: Optional[str] = None
+        for entry in entries:
+            path = normalize_path(entry.get("path", ""))
+            if pruned is not None and (path == pruned or path.startswith(pruned + "/")):
+                continue
+            pruned = None
+            if is_directory(entry) and not self.should_descend(path):
+                pruned = path
+                continue
+            if self.selects(path):
+                yield entry
@@ -0,0 +1,236 @@
+"""Indexed, self-refreshing cache of the repository list."""
+
+import threading
+import time
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+def _backend(repository: Dict[str, Any]) -> Optional[str]:
+    return repository.get("type") or (repository.get("config") or {}).get("backend")
+
+
+def _key(repository: Dict[str, Any]) -> Hashable:
+    return repository.get("id") or repository.get("name")
+
+
+class RepositoryRegistry:
+    """
+    Repository list fetched once and indexed by name, ID, backend and volume.
+    
+    Lookups are answered from the indexes and return copies of the cached
+    repositories. Once ``ttl`` seconds have passed, the next lookup
+    re-lists repositories and applies only the repositories that were
+    added, changed or removed. A registry attached
+    with ``client.repositories.use_registry()`` is also updated in place
+    when ``create``, ``update`` and ``delete`` succeed, and serves
+    ``client.repositories.list``.
+    
+    Args:
+        client: ZerobyteClient instance
+        ttl: Seconds before the list is fetched again (None never expires)
+    
+    Example:
+        >>> registry = client.repositories.use_registry(ttl=300)
+        >>> for volume in client.volumes.list():
+        ...     print(volume['name'], len(registry.by_volume(volume['id'])))
+        >>> s3 = registry.by_backend("s3")
+    """
+    
+    def __init__(self, client, ttl: Optional[float] = 300.0):
+        """Initialize RepositoryRegistry with client instance."""
+        self.client = client
+        self.ttl = ttl
+        self.fetched_at: Optional[float] = None
+        self._lock = threading.RLock()
+        self._repositories: Dict[Hashable, Dict[str, Any]] = {}
+        self._names: Dict[str, Hashable] = {}
+        self._ids: Dict[Any, Hashable] = {}
+        # Dicts used as insertion-ordered sets of keys
+        self._backends: Dict[Optional[str], Dict[Hashable, None]] = {}
+        self._volumes: Dict[Any, Dict[Hashable, None]] = {}
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_fresh()
+            return len(self._repositories)
+    
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+    
+    def _add(self, key: Hashable, repository: Dict[str, Any]) -> None:
+        self._repositories[key] = repository
+        if repository.get("name") is not None:
+            self._names[repository["name"]] = key
+        for identifier in (repository.get("id"), repository.get("shortId")):
+            if identifier is not None:
+                self._ids[identifier] = key
+        self._backends.setdefault(_backend(repository), {})[key] = None
+        self._volumes.setdefault(repository.get("volumeId"), {})[key] = None
+    
+    def _remove(self, key: Hashable) -> None:
+        repository = self._repositories.pop(key)
+        if self._names.get(repository.get("name")) == key:
+            del self._names[repository["name"]]
+        for identifier in (repository.get("id"), repository.get("shortId")):
+            if self._ids.get(identifier) == key:
+                del self._ids[identifier]
+        for index, value in ((self._backends, _backend(repository)), (self._volumes, repository.get("volumeId"))):
+            keys = index.get(value)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del index[value]
+    
+    def _stale(self) -> bool:
+        if self.fetched_at is None:
+            return True
+        return self.ttl is not None and time.monotonic() - self.fetched_at >= self.ttl
+    
+    def _ensure_fresh(self) -> None:
+        if self._stale():
+            self.refresh(force=True)
+    
+    def refresh(self, force: bool = False) -> Tuple[int, int, int]:
+        """
+        Re-list repositories and update the indexes.
+        
+        Only the differences are applied to the indexes.
+        
+        Args:
+            force: Refresh even if the TTL has not expired
+        
+        Returns:
+            tuple: (added, changed, removed) repository counts
+        """
+        with self._lock:
+            if not force and not self._stale():
+                return 0, 0, 0
+            current = {_key(repository): repository for repository in self.client.repositories._fetch_all() or []}
+            removed = [key for key in self._repositories if key not in current]
+            for key in removed:
+                self._remove(key)
+            added = changed = 0
+            for key, repository in current.items():
+                known = self._repositories.get(key)
+                if known is None:
+                    added += 1
+                elif known != repository:
+                    self._remove(key)
+                    changed += 1
+                else:
+                    continue
+                self._add(key, repository)
+            self.fetched_at = time.monotonic()
+            return added, changed, len(removed)
+    
+    def invalidate(self) -> None:
+        """Force the next lookup to re-list repositories."""
+        with self._lock:
+            self.fetched_at = None
+    
+    def upsert(self, repository: Dict[str, Any]) -> None:
+        """
+        Add or replace one repository without an API call.
+        
+        Args:
+            repository: Repository, as returned by ``repositories.get``
+        """
+        with self._lock:
+            key = _key(repository)
+            previous = self._names.get(repository.get("name"))
+            if previous is not None and previous != key:
+                self._remove(previous)
+            if key in self._repositories:
+                repository = dict(self._repositories[key], **repository)
+                self._remove(key)
+            self._add(key, repository)
+    
+    def discard(self, name: str) -> None:
+        """
+        Remove one repository without an API call.
+        
+        Args:
+            name: Repository name
+        """
+        with self._lock:
+            key = self._names.get(name)
+            if key is not None:
+                self._remove(key)
+    
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a repository by name.
+        
+        Args:
+            name: Repository name
+        
+        Returns:
+            dict: Repository, or None if unknown
+        """
+        with self._lock:
+            self._ensure_fresh()
+            key = self._names.get(name)
+            return dict(self._repositories[key]) if key is not None else None
+    
+    def get_by_id(self, repository_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up a repository by ID or short ID.
+        
+        Args:
+            repository_id: Repository ID or short ID
+        
+        Returns:
+            dict: Repository, or None if unknown
+        """
+        with self._lock:
+            self._ensure_fresh()
+            key = self._ids.get(repository_id)
+            return dict(self._repositories[key]) if key is not None else None
+    
+    def by_backend(self, backend: str) -> List[Dict[str, Any]]:
+        """
+        List the repositories of one backend type.
+        
+        Args:
+            backend: Backend type (e.g. 'local', 's3', 'sftp')
+        
+        Returns:
+            list: Matching repositories
+        """
+        return self.list(backend=backend)
+    
+    def by_volume(self, volume_id: Any) -> List[Dict[str, Any]]:
+        """
+        List the repositories of one volume.
+        
+        Args:
+            volume_id: Volume ID, matched against the ``volumeId`` field
+        
+        Returns:
+            list: Matching repositories
+        """
+        return self.list(volume_id=volume_id)
+    
+    def list(self, volume_id: Any = None, backend: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List repositories, optionally filtered by volume and backend.
+        
+        Args:
+            volume_id: Only repositories with this ``volumeId`` (optional)
+            backend: Only repositories of this backend type (optional)
+        
+        Returns:
+            list: Matching repositories
+        """
+        with self._lock:
+            self._ensure_fresh()
+            keys: Optional[Dict[Hashable, None]] = None
+            if volume_id is not None:
+                keys = self._volumes.get(volume_id, {})
+            if backend is not None:
+                by_backend = self._backends.get(backend, {})
+                keys = by_backend if keys is None else {key: None for key in keys if key in by_backend}
+            if keys is None:
+                keys = self._repositories
+            # Copies, so callers cannot change the dicts the indexes are built from
+            return [dict(self._repositories[key]) for key in keys]
@@ -1,6 +1,48 @@
 """Repositories API methods."""
 
-from typing import Dict, Any, List, Optional
+import json
+import os
+import time
+from typing import Callable, Dict, Any, Hashable, Iterable, List, Optional, Union
+from urllib.parse import urlsplit
+
+from .concurrency import imap_grouped
+from .registry import RepositoryRegistry
+from .resolver import invalidate, request_by_name, resolve_name
+
+
+# Config fields identifying the storage a repository lives on, per backend
+_TARGET_FIELDS = {
+    "s3": ("endpoint", "bucket"),
+    "r2": ("endpoint", "bucket"),
+    "gcs": ("projectId", "bucket"),
+    "azure": ("accountName", "container"),
+    "sftp": ("host",),
+    "rclone": ("remote",),
+}
+
+
+def storage_target(repository: Dict[str, Any]) -> str:
+    """
+    Return a key identifying the storage a repository lives on.
+    
+    Repositories in one S3/R2/GCS bucket, Azure container, SFTP host or
+    rclone remote share a key, as do all local repositories (which share
+    the server's disks) and REST servers by host.
+    
+    Args:
+        repository: Repository with ``config``
+    
+    Returns:
+        str: Storage key such as "s3:https://s3.example.com:backups"
+    """
+    config = repository.get("config") or {}
+    backend = config.get("backend") or repository.get("type") or "unknown"
+    if backend == "rest":
+        parts = [urlsplit(config.get("url") or "").netloc]
+    else:
+        parts = [config.get(field) for field in _TARGET_FIELDS.get(backend, ())]
+    return ":".join([backend] + [str(part) for part in parts if part])
 
 
 class RepositoriesAPI:
@@ -9,6 +51,47 @@ class RepositoriesAPI:
     def __init__(self, client):
         """Initialize RepositoriesAPI with client instance."""
         self.client = client
+        self.registry: Optional[RepositoryRegistry] = None
+    
+    def use_registry(self, ttl: Optional[float] = 300.0) -> RepositoryRegistry:
+        """
+        Serve repository lookups from an indexed registry.
+        
+        Once enabled, :meth:`list` is answered from the registry (the
+        repository list is fetched at most once per ``ttl``), and the
+        registry is updated in place by :meth:`create`, :meth:`update` and
+        :meth:`delete`.
+        
+        Args:
+            ttl: Seconds before the list is fetched again (None never expires)
+        
+        Returns:
+            RepositoryRegistry: The attached registry
+        
+        Example:
+            >>> registry = client.repositories.use_registry(ttl=300)
+            >>> for volume in client.volumes.list():
+            ...     repositories = client.repositories.list(volume_id=volume['id'])
+        """
+        self.registry = RepositoryRegistry(self.client, ttl=ttl)
+        self.client.resolver.registry = self.registry
+        return self.registry
+    
+    def _ref(self, name: str) -> str:
+        """Return the name a repository is addressed by, from cached lookups only."""
+        return resolve_name(self.client, "repositories", name, fetch=False)
+    
+    def _request(self, method: str, name: str, suffix: str = "", **kwargs: Any) -> Any:
+        """Send a request to a repository route, retrying with the resolved name on 404."""
+        return request_by_name(
+            self.client,
+            "repositories",
+            name,
+            lambda ref: self.client._make_request(method, f"/api/v1/repositories/{ref}{suffix}", **kwargs)
+        )
+    
+    def _fetch_all(self) -> List[Dict[str, Any]]:
+        return self.client._make_request("GET", "/api/v1/repositories")
     
     def list(self, volume_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -28,7 +111,10 @@ class RepositoriesAPI:
             >>> for repo in repositories:
             ...     print(repo['name'])
         """
-        repos = self.client._make_request("GET", "/api/v1/repositories")
+        if self.registry is not None:
+            return self.registry.list(volume_id=volume_id)
+        
+        repos = self._fetch_all()
         
         # Client-side filtering by volume_id if provided
         if volume_id is not None:
@@ -66,18 +152,26 @@ class RepositoriesAPI:
             ...     }
             ... )
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "POST",
             "/api/v1/repositories",
             data=repository_data
         )
+        if self.registry is not None:
+            created = (response or {}).get("repository")
+            if created:
+                self.registry.upsert(dict(repository_data, **created))
+            else:
+                self.registry.invalidate()
+        invalidate(self.client, "repositories")
+        return response
     
     def get(self, name: str) -> Dict[str, Any]:
         """
         Get a specific repository by name.
         
         Args:
-            name: Repository name
+            name: Repository name or ID
         
         Returns:
             dict: Repository information
@@ -86,10 +180,7 @@ class RepositoriesAPI:
             >>> repo = client.repositories.get(name="my-backup-repo")
             >>> print(repo['name'])
         """
-        return self.client._make_request(
-            "GET",
-            f"/api/v1/repositories/{name}"
-        )
+        return self._request("GET", name)
     
     def update(
         self,
@@ -100,7 +191,7 @@ class RepositoriesAPI:
         Update a repository.
         
         Args:
-            name: Repository name
+            name: Repository name or ID
             repository_data: Updated repository configuration
         
         Returns:
@@ -112,18 +203,24 @@ class RepositoriesAPI:
             ...     repository_data={"compressionMode": "max"}
             ... )
         """
-        return self.client._make_request(
-            "PUT",
-            f"/api/v1/repositories/{name}",
-            data=repository_data
-        )
+        name = self._ref(name)
+        response = self._request("PUT", name, data=repository_data)
+        invalidate(self.client, "repositories")
+        if self.registry is not None:
+            if response and response.get("name"):
+                if response["name"] != name:
+                    self.registry.discard(name)
+                self.registry.upsert(response)
+            else:
+                self.registry.invalidate()
+        return response
     
     def delete(self, name: str) -> Dict[str, Any]:
         """
         Delete a repository.
         
         Args:
-            name: Repository name
+            name: Repository name or ID
         
         Returns:
             dict: Deletion response
@@ -131,17 +228,20 @@ class RepositoriesAPI:
         Example:
             >>> response = client.repositories.delete(name="my-backup-repo")
         """
-        return self.client._make_request(
-            "DELETE",
-            f"/api/v1/repositories/{name}"
-        )
+        name = self._ref(name)
+        response = self._request("DELETE", name)
+        invalidate(self.client, "repositories")
+        if self.registry is not None:
+            self.registry.discard(name)
+        return response
     
-    def doctor(self, name: str) -> Dict[str, Any]:
+    def doctor(self, name: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Run doctor command on a repository to check and repair issues.
         
         Args:
-            name: Repository name
+            name: Repository name or ID
+            timeout: Seconds to wait for the server's response (optional)
         
         Returns:
             dict: Doctor command result
@@ -149,7 +249,158 @@ class RepositoriesAPI:
         Example:
             >>> result = client.repositories.doctor(name="my-backup-repo")
         """
-        return self.client._make_request(
-            "POST",
-            f"/api/v1/repositories/{name}/doctor"
-        )
+        return self._request("POST", name, "/doctor", timeout=timeout)
+    
+    def bulk_doctor(
+        self,
+        repositories: Optional[Iterable[Union[str, Dict[str, Any]]]] = None,
+        max_per_target: int = 1,
+        max_workers: int = 8,
+        timeout: Optional[float] = 3600.0,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        state_file: Optional[str] = None,
+        target: Callable[[Dict[str, Any]], Hashable] = storage_target
+    ) -> Dict[str, Any]:
+        """
+        Run doctor on many repositories, a few at a time per storage target.
+        
+        Doctor reads a whole repository, so repositories on the same storage
+        (see :func:`storage_target`) are checked at most ``max_per_target``
+        at a time while different targets run in parallel. Failures are
+        collected rather than aborting the run.
+        
+        Args:
+            repositories: Repository names or dicts (optional, defaults to
+                every repository)
+            max_per_target: Maximum number of concurrent doctor runs per
+                storage target
+            max_workers: Maximum number of concurrent doctor runs overall
+            timeout: Seconds to wait for each doctor run (None waits forever)
+            progress: Called after each repository with a dict containing
+                repository, target, status ('healthy', 'unhealthy' or
+                'failed'), error, elapsed, done and total
+            state_file: Path of a journal of completed doctor runs.
+                Repositories already recorded there are skipped (their
+                recorded outcome is part of the report), so an interrupted
+                run resumes where it stopped. Request errors are not
+                recorded and are retried on resume.
+            target: Returns the storage key of a repository
+        
+        Returns:
+            dict: Report containing:
+                - healthy (list): Names of repositories whose doctor succeeded
+                - unhealthy (list): Dicts with repository and the errors of
+                    the failed doctor steps
+                - failed (list): Dicts with repository and error (request errors)
+                - skipped (list): Names already recorded in ``state_file``
+                - targets (dict): Storage key to healthy, unhealthy and
+                    failed counts, including skipped repositories
+        
+        Example:
+            >>> report = client.repositories.bulk_doctor(
+            ...     max_per_target=2,
+            ...     state_file="doctor-weekend.journal"
+            ... )
+            >>> for item in report['unhealthy']:
+            ...     print(item['repository'], item['errors'])
+        """
+        known = None
+        selected = []
+        for repository in (self._fetch_all() or []) if repositories is None else repositories:
+            if not isinstance(repository, dict):
+                if known is None:
+                    known = {repo["name"]: repo for repo in self._fetch_all() or []}
+                repository = known.get(repository, {"name": repository})
+            selected.append(repository)
+        
+        recorded: Dict[str, Dict[str, Any]] = {}
+        if state_file and os.path.exists(state_file):
+            with open(state_file) as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        recorded[record["repository"]] = record
+        
+        report: Dict[str, Any] = {
+            'healthy': [],
+            'unhealthy': [],
+            'failed': [],
+            'skipped': [],
+            'targets': {},
+        }
+        
+        def count(key: str, status: str) -> None:
+            totals = report['targets'].setdefault(key, {'healthy': 0, 'unhealthy': 0, 'failed': 0})
+            totals[status] += 1
+        
+        def add(record: Dict[str, Any]) -> None:
+            if record['success']:
+                report['healthy'].append(record['repository'])
+            else:
+                report['unhealthy'].append({'repository': record['repository'], 'errors': record['errors']})
+            count(record['target'], 'healthy' if record['success'] else 'unhealthy')
+        
+        pending = []
+        lanes: Dict[str, int] = {}
+        for repository in selected:
+            if repository["name"] in recorded:
+                report['skipped'].append(repository["name"])
+                add(recorded[repository["name"]])
+                continue
+            key = str(target(repository))
+            lane = lanes.get(key, 0)
+            lanes[key] = lane + 1
+            pending.append((repository["name"], key, lane % max(1, max_per_target)))
+        
+        def run(item) -> Dict[str, Any]:
+            start = time.monotonic()
+            response = self.doctor(item[0], timeout=timeout) or {}
+            return {'response': response, 'elapsed': time.monotonic() - start}
+        
+        journal = open(state_file, 'a') if state_file else None
+        try:
+            done = len(report['skipped'])
+            for item, outcome, error in imap_grouped(
+                run,
+                pending,
+                key=lambda item: (item[1], item[2]),
+                max_workers=max_workers
+            ):
+                done += 1
+                name, key, _ = item
+                if error is None:
+                    response = outcome['response']
+                    record = {
+                        'repository': name,
+                        'target': key,
+                        'success': bool(response.get('success')),
+                        'errors': [
+                            {'step': step.get('step'), 'error': step.get('error')}
+                            for step in response.get('steps') or []
+                            if not step.get('success')
+                        ],
+                    }
+                    add(record)
+                    if journal:
+                        journal.write(json.dumps(record) + "\n")
+                        journal.flush()
+                    status = 'healthy' if record['success'] else 'unhealthy'
+                else:
+                    report['failed'].append({'repository': name, 'error': error})
+                    count(key, 'failed')
+                    status = 'failed'
+                if progress:
+                    progress({
+                        'repository': name,
+                        'target': key,
+                        'status': status,
+                        'error': error,
+                        'elapsed': outcome['elapsed'] if error is None else None,
+                        'done': done,
+                        'total': len(selected)
+                    })
+        finally:
+            if journal:
+                journal.close()
+        
+        return report
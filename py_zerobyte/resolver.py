@@ -0,0 +1,237 @@
+"""Name/ID resolution for volumes, repositories, schedules and notification destinations."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from .exceptions import NotFoundError, ValidationError
+
+
+Reference = Union[int, str]
+T = TypeVar("T")
+
+
+def _is_numeric(value: Reference) -> bool:
+    return isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+
+
+class Resolver:
+    """
+    Bidirectional name/ID maps for the resources addressed by the API.
+    
+    The map of a resource type is built from its list endpoint the first
+    time a reference of that type needs translating, and rebuilt once
+    ``ttl`` seconds have passed or after a create, update or delete made
+    through the client. Every ``ZerobyteClient`` carries one as
+    ``client.resolver``, which the API methods use to accept either names
+    or IDs. Repository references are answered from the registry of
+    ``client.repositories.use_registry()`` when one is attached.
+    
+    Resource types are "volumes", "repositories", "schedules" and
+    "destinations" (notification destinations).
+    
+    Args:
+        client: ZerobyteClient instance
+        ttl: Seconds before a map is rebuilt (None never expires)
+    
+    Example:
+        >>> client.resolver.id_of("volumes", "my-volume")
+        1
+        >>> client.resolver.name_of("schedules", 3)
+        'nightly'
+    """
+    
+    def __init__(self, client, ttl: Optional[float] = 300.0):
+        """Initialize Resolver with client instance."""
+        self.client = client
+        self.ttl = ttl
+        # Set by repositories.use_registry()
+        self.registry = None
+        self._lock = threading.Lock()
+        # kind -> (name to items, str(ID or short ID) to (ID, name), fetched at)
+        self._maps: Dict[str, Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Tuple[Any, str]], float]] = {}
+    
+    def _list(self, kind: str) -> List[Dict[str, Any]]:
+        listers: Dict[str, Callable[[], List[Dict[str, Any]]]] = {
+            "volumes": self.client.volumes.list,
+            "repositories": self.client.repositories.list,
+            "schedules": self.client.backup_schedules.list_all,
+            "destinations": self.client.notifications.list_destinations,
+        }
+        if kind not in listers:
+            raise ValueError(f"Unknown resource type: {kind!r}")
+        return listers[kind]() or []
+    
+    def _map(
+        self,
+        kind: str,
+        fetch: bool = True
+    ) -> Optional[Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Tuple[Any, str]], float]]:
+        with self._lock:
+            cached = self._maps.get(kind)
+        if cached is not None and (self.ttl is None or time.monotonic() - cached[2] < self.ttl):
+            return cached
+        if not fetch:
+            return None
+        names: Dict[str, List[Dict[str, Any]]] = {}
+        ids: Dict[str, Tuple[Any, str]] = {}
+        for item in self._list(kind):
+            identifier, name = item.get("id"), item.get("name")
+            if identifier is None or name is None:
+                continue
+            names.setdefault(name, []).append(item)
+            ids[str(identifier)] = (identifier, name)
+            if item.get("shortId") is not None:
+                ids[str(item["shortId"])] = (identifier, name)
+        cached = (names, ids, time.monotonic())
+        with self._lock:
+            self._maps[kind] = cached
+        return cached
+    
+    def _registered(self, kind: str, reference: Reference) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look a repository up in the attached registry: (consulted, repository)."""
+        if kind != "repositories" or self.registry is None:
+            return False, None
+        return True, self.registry.get_by_id(reference) or self.registry.get(reference)
+    
+    def id_of(
+        self,
+        kind: str,
+        reference: Reference,
+        scope: Optional[Dict[str, Any]] = None,
+        fetch: bool = True
+    ) -> Any:
+        """
+        Translate a name (or ID) to an ID.
+        
+        Args:
+            kind: Resource type
+            reference: Name, ID or short ID
+            scope: Only consider resources whose fields have these values
+                when matching a name (e.g. ``{"volumeId": 1}``)
+            fetch: Build the map if it is not cached (otherwise unknown
+                references are returned unchanged); an attached
+                registry is always consulted
+        
+        Returns:
+            ID of the resource; unknown references are returned unchanged
+                so the server can report them
+        
+        Raises:
+            ValidationError: If the name matches more than one resource
+        """
+        consulted, repository = self._registered(kind, reference)
+        if consulted:
+            return repository["id"] if repository else reference
+        cached = self._map(kind, fetch)
+        if cached is None:
+            return reference
+        names, ids, _ = cached
+        if str(reference) in ids:
+            return ids[str(reference)][0]
+        matches = [
+            item for item in names.get(reference, [])
+            if all(str(item.get(field)) == str(value) for field, value in (scope or {}).items())
+        ]
+        if len(matches) > 1:
+            raise ValidationError(
+                f"{kind} name {reference!r} is ambiguous (IDs "
+                f"{', '.join(str(item['id']) for item in matches)}); use an ID instead"
+            )
+        return matches[0]["id"] if matches else reference
+    
+    def name_of(self, kind: str, reference: Reference, fetch: bool = True) -> Any:
+        """
+        Translate an ID (or name) to a name.
+        
+        Args:
+            kind: Resource type
+            reference: Name, ID or short ID
+            fetch: Build the map if it is not cached (otherwise unknown
+                references are returned unchanged); an attached
+                registry is always consulted
+        
+        Returns:
+            Name of the resource; unknown references are returned unchanged
+                so the server can report them
+        """
+        consulted, repository = self._registered(kind, reference)
+        if consulted:
+            return repository["name"] if repository else reference
+        cached = self._map(kind, fetch)
+        if cached is None:
+            return reference
+        names, ids, _ = cached
+        if isinstance(reference, str) and reference in names:
+            return reference
+        if str(reference) in ids:
+            return ids[str(reference)][1]
+        return reference
+    
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """
+        Drop a cached map so it is rebuilt on next use.
+        
+        Args:
+            kind: Resource type (optional, defaults to every type)
+        """
+        with self._lock:
+            if kind is None:
+                self._maps.clear()
+            else:
+                self._maps.pop(kind, None)
+
+
+def resolve_name(client, kind: str, reference: Reference, fetch: bool = True) -> Any:
+    """
+    Return the name form of a reference for routes addressed by name.
+    
+    Volume names are recognised by type (volume IDs are numeric) and
+    passed through without a lookup. Repository IDs are strings like
+    their names; see :func:`request_by_name` for repository routes.
+    """
+    if kind != "repositories" and not isinstance(reference, int):
+        return reference
+    return client.resolver.name_of(kind, reference, fetch=fetch)
+
+
+def resolve_id(
+    client,
+    kind: str,
+    reference: Reference,
+    scope: Optional[Dict[str, Any]] = None,
+    fetch: bool = True
+) -> Any:
+    """
+    Return the ID form of a reference for routes addressed by ID.
+    
+    Numeric references are passed through without a lookup, except for
+    repositories, whose IDs are strings.
+    """
+    if kind != "repositories" and _is_numeric(reference):
+        return reference
+    return client.resolver.id_of(kind, reference, scope=scope, fetch=fetch)
+
+
+def request_by_name(client, kind: str, reference: Reference, request: Callable[[Any], T]) -> T:
+    """
+    Call ``request`` with the name form of a reference, trying it as a name first.
+    
+    The reference is translated only from the maps already cached; if the
+    server answers 404, the map is built and the request retried once with
+    the translated name. References that are names therefore never cost a
+    list request.
+    """
+    name = resolve_name(client, kind, reference, fetch=False)
+    try:
+        return request(name)
+    except NotFoundError:
+        retry = resolve_name(client, kind, reference)
+        if retry == name:
+            raise
+        return request(retry)
+
+
+def invalidate(client, kind: str) -> None:
+    """Drop the resolver's map of a resource type after a mutation."""
+    client.resolver.invalidate(kind)
@@ -0,0 +1,460 @@
+"""Planning and batching of snapshot restores."""
+
+import heapq
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from .concurrency import imap_unordered
+from .exceptions import NotFoundError
+from .files import entry_mtime, is_directory, merge_walks, normalize_path
+
+
+def _is_within(path: str, directory: str) -> bool:
+    return directory == "/" or path == directory or path.startswith(directory + "/")
+
+
+def collapse_paths(paths: Iterable[str]) -> List[str]:
+    """
+    Remove duplicate paths and paths already covered by an ancestor in the list.
+    
+    Args:
+        paths: Paths to restore
+    
+    Returns:
+        list: Sorted, normalized paths none of which lies within another
+    """
+    collapsed: List[str] = []
+    for path in sorted({normalize_path(path) for path in paths}, key=lambda p: p.split("/")):
+        if not collapsed or not _is_within(path, collapsed[-1]):
+            collapsed.append(path)
+    return collapsed
+
+
+def _rebase(path: str, root: str, new_root: str) -> str:
+    """Move a path below ``root`` to the same relative location below ``new_root``."""
+    relative = posixpath.relpath(path, root)
+    return new_root if relative == "." else posixpath.join(new_root, relative)
+
+
+def entry_differs(source: Dict[str, Any], target: Dict[str, Any], mtime_tolerance: float = 1.0) -> bool:
+    """
+    Decide whether a restored entry would differ from the one already on the target.
+    
+    Entries differ if one is a directory and the other is not, or if
+    their size, modification time (beyond ``mtime_tolerance`` seconds) or
+    permission bits differ. Attributes missing from either side (volume
+    listings carry no mode) are not compared.
+    
+    Args:
+        source: Snapshot listing entry
+        target: Volume listing entry
+        mtime_tolerance: Allowed modification time difference in seconds
+    
+    Returns:
+        bool: True if the entry needs to be restored
+    """
+    if is_directory(source) != is_directory(target):
+        return True
+    if is_directory(source):
+        return False
+    if source.get("size") is not None and target.get("size") is not None:
+        if source["size"] != target["size"]:
+            return True
+    source_mtime, target_mtime = entry_mtime(source), entry_mtime(target)
+    if source_mtime is not None and target_mtime is not None:
+        if abs(source_mtime - target_mtime) > mtime_tolerance:
+            return True
+    if source.get("mode") is not None and target.get("mode") is not None:
+        if source["mode"] & 0o777 != target["mode"] & 0o777:
+            return True
+    return False
+
+
+def batch_paths(paths: List[str], max_batch_size: int) -> List[List[str]]:
+    """Split paths into consecutive batches of at most ``max_batch_size``."""
+    size = max(1, max_batch_size)
+    return [paths[i:i + size] for i in range(0, len(paths), size)]
+
+
+class RestorePlanner:
+    """
+    Turn a large list of paths into a few compact restore requests.
+    
+    Paths are first reduced to those not covered by another path in the
+    list. Then, deepest directories first, a directory's listing is
+    fetched and, if every entry in it is wanted, its entries are replaced
+    by the directory itself, which may in turn complete its parent. The
+    resulting include list is split into bounded batches that are
+    restored with limited concurrency.
+    
+    Args:
+        client: ZerobyteClient instance
+        repository_name: Repository name
+        snapshot_id: Snapshot ID
+    
+    Example:
+        >>> planner = RestorePlanner(client, "my-backup-repo", "abc123")
+        >>> plan = planner.plan(paths, max_batch_size=200)
+        >>> result = planner.execute(plan, {"targetPath": "/restore"})
+    """
+    
+    def __init__(self, client, repository_name: str, snapshot_id: str):
+        """Initialize RestorePlanner with client instance."""
+        self.client = client
+        self.repository_name = repository_name
+        self.snapshot_id = snapshot_id
+        self._listings: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def _list_directory(self, directory: str) -> List[Dict[str, Any]]:
+        """Return the snapshot entries directly inside a directory, cached per planner."""
+        if directory not in self._listings:
+            listing = self.client.snapshots.list_files(
+                self.repository_name,
+                self.snapshot_id,
+                path=directory
+            )
+            self._listings[directory] = [
+                entry for entry in (listing or {}).get("files", [])
+                if normalize_path(entry.get("path", "")) != directory
+            ]
+        return self._listings[directory]
+    
+    def _list_children(self, directory: str) -> Set[str]:
+        return {normalize_path(entry.get("path", "")) for entry in self._list_directory(directory)}
+    
+    def cover(self, paths: Iterable[str]) -> List[str]:
+        """
+        Compute the minimal set of paths covering exactly the requested ones.
+        
+        Args:
+            paths: Paths to restore
+        
+        Returns:
+            list: Sorted covering paths
+        """
+        wanted = set(collapse_paths(paths))
+        
+        def depth(path: str) -> int:
+            return 0 if path == "/" else path.count("/")
+        
+        queue: List[Any] = []
+        queued: Set[str] = set()
+        
+        def enqueue(path: str) -> None:
+            if path == "/":
+                return
+            parent = posixpath.dirname(path)
+            if parent not in queued:
+                queued.add(parent)
+                heapq.heappush(queue, (-depth(parent), parent))
+        
+        for path in wanted:
+            enqueue(path)
+        
+        while queue:
+            _, directory = heapq.heappop(queue)
+            if directory in wanted:
+                continue
+            children = self._list_children(directory)
+            if children and children <= wanted:
+                wanted -= children
+                wanted.add(directory)
+                enqueue(directory)
+        
+        return collapse_paths(wanted)
+    
+    def plan(self, paths: Iterable[str], max_batch_size: int = 100) -> Dict[str, Any]:
+        """
+        Plan a restore of many paths.
+        
+        Args:
+            paths: Paths to restore
+            max_batch_size: Maximum number of include paths per restore request
+        
+        Returns:
+            dict: Plan containing include (list) and batches (list of lists)
+        """
+        include = self.cover(paths)
+        return {"include": include, "batches": batch_paths(include, max_batch_size)}
+    
+    def execute(
+        self,
+        plan: Dict[str, Any],
+        restore_data: Optional[Dict[str, Any]] = None,
+        max_workers: int = 2,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the restore requests of a plan concurrently.
+        
+        Args:
+            plan: Result of :meth:`plan`
+            restore_data: Extra restore options shared by every batch (e.g.
+                ``targetPath``, ``overwrite``, ``exclude``); ``snapshotId`` and
+                ``include`` are set per batch
+            max_workers: Maximum number of concurrent restore requests
+            progress: Called after each batch with include, response, error,
+                done and total
+        
+        Returns:
+            dict: Outcome containing succeeded and failed lists of
+                ``{"include", "response"}`` / ``{"include", "error"}`` dicts
+                and files_restored, the sum reported by the server
+        """
+        def restore(batch: List[str]) -> Any:
+            data = dict(restore_data or {})
+            data["snapshotId"] = self.snapshot_id
+            data["include"] = batch
+            return self.client.snapshots.restore(self.repository_name, data)
+        
+        result: Dict[str, Any] = {"succeeded": [], "failed": [], "files_restored": 0}
+        batches = plan["batches"]
+        for done, (batch, response, error) in enumerate(
+            imap_unordered(restore, batches, max_workers=max_workers), start=1
+        ):
+            if error is None:
+                result["succeeded"].append({"include": batch, "response": response})
+                if isinstance(response, dict):
+                    result["files_restored"] += response.get("filesRestored") or 0
+            else:
+                result["failed"].append({"include": batch, "error": error})
+            if progress:
+                progress({
+                    "include": batch,
+                    "response": response,
+                    "error": error,
+                    "done": done,
+                    "total": len(batches),
+                })
+        return result
+    
+    def restore(
+        self,
+        paths: Iterable[str],
+        restore_data: Optional[Dict[str, Any]] = None,
+        max_batch_size: int = 100,
+        max_workers: int = 2,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Plan and execute a restore of many paths.
+        
+        Args:
+            paths: Paths to restore
+            restore_data: Extra restore options shared by every batch
+            max_batch_size: Maximum number of include paths per restore request
+            max_workers: Maximum number of concurrent restore requests
+            progress: Called after each batch (see :meth:`execute`)
+        
+        Returns:
+            dict: See :meth:`execute`, plus the include list that was used
+        """
+        plan = self.plan(paths, max_batch_size=max_batch_size)
+        result = self.execute(plan, restore_data, max_workers=max_workers, progress=progress)
+        result["include"] = plan["include"]
+        return result
+    
+    def diff(
+        self,
+        volume_id: Any,
+        path: str = "/",
+        volume_path: Optional[str] = None,
+        mtime_tolerance: float = 1.0
+    ) -> Dict[str, Any]:
+        """
+        Compare a snapshot directory with its restore target on a volume.
+        
+        Both trees are listed one directory at a time and only directories
+        present on both sides are descended into; a directory missing from
+        the target is restored as a whole without listing its contents.
+        Snapshot listings are kept, so the following :meth:`cover` of the
+        differences costs no extra snapshot requests below ``path``.
+        
+        Args:
+            volume_id: Volume holding the restore target
+            path: Snapshot directory to compare
+            volume_path: Directory on the volume that corresponds to ``path``
+                (optional, defaults to ``path``)
+            mtime_tolerance: Allowed modification time difference in seconds
+        
+        Returns:
+            dict: Comparison containing:
+                - changed (list): ``{"path", "reason", "entry"}`` dicts with
+                    reason "missing" or "changed"
+                - include (list): Minimal include paths restoring every change
+                - unchanged (int): Number of files already up to date
+                - bytes_saved (int): Size of the files that need no restore
+                - bytes_to_restore (int): Size of the missing or changed files
+                    (contents of missing directories are not counted)
+        """
+        root = normalize_path(path)
+        target_root = normalize_path(volume_path if volume_path is not None else path)
+        result: Dict[str, Any] = {
+            "changed": [],
+            "unchanged": 0,
+            "bytes_saved": 0,
+            "bytes_to_restore": 0,
+        }
+        
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            target_directory = _rebase(directory, root, target_root)
+            try:
+                listing = self.client.volumes.list_files(volume_id, path=target_directory)
+            except NotFoundError:
+                listing = None
+            targets = {
+                entry.get("name") or posixpath.basename(entry.get("path", "")): entry
+                for entry in (listing or {}).get("files", [])
+                if normalize_path(entry.get("path", "")) != target_directory
+            }
+            
+            for entry in self._list_directory(directory):
+                entry_path = normalize_path(entry.get("path", ""))
+                target = targets.get(entry.get("name") or posixpath.basename(entry_path))
+                size = 0 if is_directory(entry) else entry.get("size") or 0
+                if target is None:
+                    reason = "missing"
+                elif entry_differs(entry, target, mtime_tolerance):
+                    reason = "changed"
+                else:
+                    if is_directory(entry):
+                        stack.append(entry_path)
+                    else:
+                        result["unchanged"] += 1
+                        result["bytes_saved"] += size
+                    continue
+                result["changed"].append({"path": entry_path, "reason": reason, "entry": entry})
+                result["bytes_to_restore"] += size
+        
+        result["changed"].sort(key=lambda change: change["path"].split("/"))
+        result["include"] = self.cover(change["path"] for change in result["changed"])
+        return result
+    
+    def restore_differences(
+        self,
+        volume_id: Any,
+        path: str = "/",
+        volume_path: Optional[str] = None,
+        restore_data: Optional[Dict[str, Any]] = None,
+        dry_run: bool = False,
+        mtime_tolerance: float = 1.0,
+        max_batch_size: int = 100,
+        max_workers: int = 2,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Restore only the entries that are missing from or differ on the target.
+        
+        Args:
+            volume_id: Volume holding the restore target
+            path: Snapshot directory to restore
+            volume_path: Directory on the volume that corresponds to ``path``
+                (optional, defaults to ``path``)
+            restore_data: Extra restore options shared by every batch (e.g.
+                ``targetPath``, ``overwrite``)
+            dry_run: Only compare and report, without restoring
+            mtime_tolerance: Allowed modification time difference in seconds
+            max_batch_size: Maximum number of include paths per restore request
+            max_workers: Maximum number of concurrent restore requests
+            progress: Called after each batch (see :meth:`execute`)
+        
+        Returns:
+            dict: The :meth:`diff` result plus batches and, unless ``dry_run``,
+                the :meth:`execute` outcome (succeeded, failed, files_restored)
+        
+        Example:
+            >>> report = planner.restore_differences(1, "/data", dry_run=True)
+            >>> print(len(report['include']), report['bytes_saved'])
+        """
+        result = self.diff(volume_id, path, volume_path=volume_path, mtime_tolerance=mtime_tolerance)
+        result["batches"] = batch_paths(result["include"], max_batch_size)
+        if not dry_run and result["batches"]:
+            result.update(self.execute(result, restore_data, max_workers=max_workers, progress=progress))
+        return result
+
+
+def verify_restore(
+    client,
+    repository_name: str,
+    snapshot_id: str,
+    volume_id: Any,
+    path: str = "/",
+    volume_path: Optional[str] = None,
+    mtime_tolerance: float = 1.0,
+    ignore_extra: bool = False,
+    max_mismatches: Optional[int] = None,
+    max_workers: int = 8
+) -> Dict[str, Any]:
+    """
+    Check that a restored directory on a volume matches the snapshot.
+    
+    The snapshot and the volume are walked at the same time, sharing a
+    pool of ``max_workers`` threads that fetches directory listings ahead
+    of both walks, and the two streams of entries are compared with a
+    sorted merge.
+    
+    Args:
+        client: ZerobyteClient instance
+        repository_name: Repository name
+        snapshot_id: Snapshot ID
+        volume_id: Volume holding the restored files
+        path: Restored snapshot directory
+        volume_path: Directory on the volume that corresponds to ``path``
+            (optional, defaults to ``path``)
+        mtime_tolerance: Allowed modification time difference in seconds
+        ignore_extra: Do not report entries found only on the volume
+        max_mismatches: Stop after this many mismatches (optional)
+        max_workers: Maximum number of concurrent listing requests
+    
+    Returns:
+        dict: Verification result containing:
+            - ok (bool): True if no mismatch was found
+            - matched (int): Number of matching entries
+            - mismatches (list): ``{"path", "reason", "source", "target"}``
+                dicts with reason "missing", "extra" or "changed" and the
+                path relative to ``path``
+    
+    Example:
+        >>> report = verify_restore(client, "my-backup-repo", "abc123", 1, "/data")
+        >>> for mismatch in report['mismatches']:
+        ...     print(mismatch['reason'], mismatch['path'])
+    """
+    root = normalize_path(path)
+    target_root = normalize_path(volume_path if volume_path is not None else path)
+    result: Dict[str, Any] = {"ok": True, "matched": 0, "mismatches": []}
+    
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        source = client.snapshots.walk(repository_name, snapshot_id, root, executor=executor)
+        target = client.volumes.walk(volume_id, target_root, executor=executor)
+        merged = merge_walks(source, target, root, target_root)
+        try:
+            for relative, source_entry, target_entry in merged:
+                if source_entry is None:
+                    if ignore_extra:
+                        continue
+                    reason = "extra"
+                elif target_entry is None:
+                    reason = "missing"
+                elif entry_differs(source_entry, target_entry, mtime_tolerance):
+                    reason = "changed"
+                else:
+                    result["matched"] += 1
+                    continue
+                result["mismatches"].append({
+                    "path": relative,
+                    "reason": reason,
+                    "source": source_entry,
+                    "target": target_entry,
+                })
+                if max_mismatches is not None and len(result["mismatches"]) >= max_mismatches:
+                    break
+        finally:
+            merged.close()
+            source.close()
+            target.close()
+    
+    result["ok"] = not result["mismatches"]
+    return result
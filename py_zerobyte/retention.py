@@ -0,0 +1,253 @@
+"""Local simulation of restic ``forget`` retention policies.
+
+Requires the optional ``numpy`` dependency (``pip install py-zerobyte[analytics]``).
+"""
+
+import re
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None
+
+from .files import parse_time
+
+
+# Policy keys in restic's evaluation order
+_BUCKETS = ("keepLast", "keepHourly", "keepDaily", "keepWeekly", "keepMonthly", "keepYearly")
+_DURATION = re.compile(r"(\d+)([ymdh])")
+_NOT_NEW = np.iinfo(np.int64).max if np is not None else None
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "RetentionSimulator requires numpy. Install it with: pip install py-zerobyte[analytics]"
+        )
+
+
+def _parse_duration(value: str) -> Dict[str, int]:
+    """Parse a restic duration such as "1y6m2d12h"."""
+    text = str(value).strip()
+    parts = _DURATION.findall(text)
+    if not parts or "".join(number + unit for number, unit in parts) != text:
+        raise ValueError(f"Invalid retention duration: {value!r}")
+    duration = {"y": 0, "m": 0, "d": 0, "h": 0}
+    for number, unit in parts:
+        duration[unit] += int(number)
+    return duration
+
+
+def _subtract_duration(moment: datetime, duration: Dict[str, int]) -> datetime:
+    """Subtract a duration with Go ``AddDate`` semantics (overflowing days roll over)."""
+    months = moment.year * 12 + (moment.month - 1) - duration["y"] * 12 - duration["m"]
+    first = moment.replace(year=months // 12, month=months % 12 + 1, day=1)
+    return first + timedelta(days=moment.day - 1 - duration["d"], hours=-duration["h"])
+
+
+def _bucket_key(kind: str, moment: datetime, index: int) -> int:
+    if kind == "keepLast":
+        return index
+    if kind == "keepHourly":
+        return ((moment.year * 100 + moment.month) * 100 + moment.day) * 100 + moment.hour
+    if kind == "keepDaily":
+        return (moment.year * 100 + moment.month) * 100 + moment.day
+    if kind == "keepWeekly":
+        year, week, _ = moment.isocalendar()
+        return year * 100 + week
+    if kind == "keepMonthly":
+        return moment.year * 100 + moment.month
+    return moment.year
+
+
+class RetentionSimulator:
+    """
+    Preview which snapshots a retention policy keeps, without running forget.
+    
+    Follows restic's ``forget`` semantics: snapshots are grouped (by their
+    backed-up paths, like restic's default ``--group-by host,paths``) and
+    walked newest first; a ``keepDaily: 7`` policy keeps the newest
+    snapshot of each of the 7 most recent days that have snapshots, and a
+    snapshot is kept if any rule keeps it. An empty policy keeps everything.
+    
+    The bucket of every snapshot for every rule is computed once, so each
+    policy is evaluated with a handful of NumPy operations and many
+    candidate policies can be compared instantly.
+    
+    Args:
+        snapshots: Snapshots as returned by ``snapshots.list``
+        tz: Time zone used for calendar buckets (optional, defaults to the
+            local time zone, as restic uses the snapshot's local time)
+        group_by_paths: Whether to apply the policy separately to each set
+            of backed-up paths
+    
+    Example:
+        >>> simulator = RetentionSimulator(client.snapshots.list("my-backup-repo"))
+        >>> preview = simulator.simulate({"keepLast": 7, "keepMonthly": 12})
+        >>> print(len(preview['remove']), preview['reclaimed_size'])
+    """
+    
+    def __init__(
+        self,
+        snapshots: Iterable[Dict[str, Any]],
+        tz: Optional[tzinfo] = None,
+        group_by_paths: bool = True
+    ):
+        """Initialize RetentionSimulator and precompute snapshot buckets."""
+        _require_numpy()
+        snapshots = list(snapshots)
+        seconds = [parse_time(snapshot.get("time")) or 0.0 for snapshot in snapshots]
+        order = sorted(range(len(snapshots)), key=lambda i: seconds[i], reverse=True)
+        
+        self.snapshots = [snapshots[i] for i in order]
+        self.times = np.array([seconds[i] for i in order], dtype=np.float64)
+        self.sizes = np.array([snapshot.get("size") or 0 for snapshot in self.snapshots], dtype=np.int64)
+        moments = [datetime.fromtimestamp(t, tz) for t in self.times.tolist()]
+        
+        group_ids: Dict[Any, int] = {}
+        groups = []
+        for snapshot in self.snapshots:
+            key = tuple(sorted(snapshot.get("paths") or [])) if group_by_paths else None
+            groups.append(group_ids.setdefault(key, len(group_ids)))
+        self.groups = np.array(groups, dtype=np.int64)
+        
+        # Stable sort by group keeps newest-first order inside each group
+        permutation = np.argsort(self.groups, kind="stable")
+        sorted_groups = self.groups[permutation]
+        group_start = np.ones(len(permutation), dtype=bool)
+        group_start[1:] = sorted_groups[1:] != sorted_groups[:-1]
+        start_index = np.maximum.accumulate(np.where(group_start, np.arange(len(permutation)), 0))
+        
+        # For each rule, the rank of the bucket a snapshot opens within its
+        # group (1 = newest bucket), or _NOT_NEW if it shares the bucket of
+        # a newer snapshot. restic keeps it iff rank <= the rule's count.
+        self._ranks = {}
+        for kind in _BUCKETS:
+            keys = np.array(
+                [_bucket_key(kind, moments[i], i) for i in permutation.tolist()],
+                dtype=np.int64
+            )
+            new = group_start.copy()
+            new[1:] |= keys[1:] != keys[:-1]
+            counts = np.cumsum(new)
+            ranks = counts - counts[start_index] + 1
+            ranks = np.where(new, ranks, _NOT_NEW)
+            unpermuted = np.empty_like(ranks)
+            unpermuted[permutation] = ranks
+            self._ranks[kind] = unpermuted
+        
+        self._latest = {}
+        for index, group in enumerate(groups):
+            self._latest.setdefault(group, moments[index])
+    
+    def keep_mask(self, retention: Optional[Dict[str, Any]]) -> Any:
+        """
+        Evaluate a policy.
+        
+        Args:
+            retention: Policy dict with keepLast, keepHourly, keepDaily,
+                keepWeekly, keepMonthly, keepYearly (-1 for unlimited) and
+                keepWithinDuration (e.g. "30d")
+        
+        Returns:
+            ndarray: Boolean mask aligned with :attr:`snapshots` (newest first)
+        """
+        retention = retention or {}
+        keep = np.zeros(len(self.snapshots), dtype=bool)
+        empty = True
+        for kind in _BUCKETS:
+            count = retention.get(kind)
+            if not count:
+                continue
+            empty = False
+            ranks = self._ranks[kind]
+            keep |= ranks != _NOT_NEW if count < 0 else ranks <= count
+        
+        within = retention.get("keepWithinDuration")
+        if within:
+            empty = False
+            duration = _parse_duration(within)
+            cutoffs = {
+                group: _subtract_duration(latest, duration).timestamp()
+                for group, latest in self._latest.items()
+            }
+            cutoff = np.array([cutoffs[group] for group in self.groups.tolist()], dtype=np.float64)
+            keep |= self.times > cutoff
+        
+        if empty:
+            keep[:] = True
+        return keep
+    
+    def simulate(self, retention: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Preview the result of applying a policy.
+        
+        Args:
+            retention: Policy dict (see :meth:`keep_mask`)
+        
+        Returns:
+            dict: Preview containing:
+                - keep (list): Snapshots kept, newest first
+                - remove (list): Snapshots removed, newest first
+                - kept_size (int): Total size of kept snapshots
+                - reclaimed_size (int): Total size of removed snapshots. Data
+                    shared with kept snapshots is not freed, so this is an
+                    upper bound on the space reclaimed by prune.
+        """
+        keep = self.keep_mask(retention)
+        return {
+            "keep": [self.snapshots[i] for i in np.flatnonzero(keep).tolist()],
+            "remove": [self.snapshots[i] for i in np.flatnonzero(~keep).tolist()],
+            "kept_size": int(self.sizes[keep].sum()),
+            "reclaimed_size": int(self.sizes[~keep].sum()),
+        }
+    
+    def compare(self, policies: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Summarize several candidate policies.
+        
+        Args:
+            policies: Policy dicts
+        
+        Returns:
+            list: One summary per policy with policy, kept, removed,
+                kept_size and reclaimed_size
+        """
+        summaries = []
+        for policy in policies:
+            keep = self.keep_mask(policy)
+            summaries.append({
+                "policy": policy,
+                "kept": int(keep.sum()),
+                "removed": int((~keep).sum()),
+                "kept_size": int(self.sizes[keep].sum()),
+                "reclaimed_size": int(self.sizes[~keep].sum()),
+            })
+        return summaries
+
+
+def simulate_forget(
+    snapshots: Iterable[Dict[str, Any]],
+    retention: Optional[Dict[str, Any]],
+    tz: Optional[tzinfo] = None
+) -> Dict[str, Any]:
+    """
+    Preview the result of applying one retention policy to a snapshot list.
+    
+    Args:
+        snapshots: Snapshots as returned by ``snapshots.list``
+        retention: Policy dict, e.g. ``{"keepLast": 7, "keepDaily": 14}``
+        tz: Time zone used for calendar buckets (optional, defaults to local time)
+    
+    Returns:
+        dict: See :meth:`RetentionSimulator.simulate`
+    
+    Example:
+        >>> preview = simulate_forget(
+        ...     client.snapshots.list("my-backup-repo"),
+        ...     {"keepDaily": 7, "keepWeekly": 4}
+        ... )
+    """
+    return RetentionSimulator(snapshots, tz=tz).simulate(retention)
@@ -0,0 +1,263 @@
+"""In-memory index over the snapshots of every repository."""
+
+import bisect
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+from .files import normalize_path, parse_time
+from .snapshots import _snapshot_id
+
+
+TimeLike = Union[int, float, datetime]
+_Key = Tuple[str, str]
+
+
+def _to_seconds(value: Optional[TimeLike]) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return parse_time(value)
+
+
+def _overlaps(path: str, prefix: str) -> bool:
+    """Return True if either path lies within the other."""
+    for inner, outer in ((path, prefix), (prefix, path)):
+        if outer == "/" or inner == outer or inner.startswith(outer + "/"):
+            return True
+    return False
+
+
+class SnapshotIndex:
+    """
+    Tag and time index over the snapshots of all repositories.
+    
+    Holds an inverted index from tag to snapshots and a time-sorted index,
+    so combined tag, time range and path queries are answered without API
+    calls. :meth:`refresh` re-lists repositories and applies only the
+    snapshots that were added or removed since the previous refresh.
+    
+    Args:
+        client: ZerobyteClient instance
+    
+    Example:
+        >>> index = SnapshotIndex(client)
+        >>> index.refresh()
+        >>> month_ago = time.time() - 30 * 86400
+        >>> for hit in index.query(tags=["pre-upgrade"], since=month_ago):
+        ...     print(hit['repository'], hit['snapshot']['short_id'])
+    """
+    
+    def __init__(self, client):
+        """Initialize SnapshotIndex with client instance."""
+        self.client = client
+        self._snapshots: Dict[_Key, Dict[str, Any]] = {}
+        # Parallel lists sorted by snapshot time
+        self._times: List[float] = []
+        self._time_keys: List[_Key] = []
+        self._tags: Dict[str, Set[_Key]] = {}
+        self._repositories: Dict[str, Set[_Key]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._snapshots)
+    
+    def _time_of(self, key: _Key) -> float:
+        seconds = parse_time(self._snapshots[key].get("time"))
+        return seconds if seconds is not None else 0.0
+    
+    def _add(self, repository_name: str, snapshot: Dict[str, Any]) -> None:
+        key = (repository_name, _snapshot_id(snapshot))
+        if key in self._snapshots:
+            self._remove(key)
+        self._snapshots[key] = snapshot
+        seconds = self._time_of(key)
+        position = bisect.bisect_left(self._times, seconds)
+        # Snapshots with the same time are kept ordered by key
+        while position < len(self._times) and self._times[position] == seconds and self._time_keys[position] < key:
+            position += 1
+        self._times.insert(position, seconds)
+        self._time_keys.insert(position, key)
+        for tag in snapshot.get("tags") or []:
+            self._tags.setdefault(tag, set()).add(key)
+        self._repositories.setdefault(repository_name, set()).add(key)
+    
+    def _remove(self, key: _Key) -> None:
+        seconds = self._time_of(key)
+        position = bisect.bisect_left(self._times, seconds)
+        while position < len(self._times) and self._times[position] == seconds:
+            if self._time_keys[position] == key:
+                del self._times[position]
+                del self._time_keys[position]
+                break
+            position += 1
+        for tag in self._snapshots[key].get("tags") or []:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+        self._repositories[key[0]].discard(key)
+        del self._snapshots[key]
+    
+    def update_repository(self, repository_name: str, snapshots: Iterable[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Replace the indexed snapshots of one repository.
+        
+        Only the differences are applied to the index.
+        
+        Args:
+            repository_name: Repository name
+            snapshots: Current snapshot list, as returned by ``snapshots.list``
+        
+        Returns:
+            tuple: (added, removed) snapshot counts
+        """
+        current = {(repository_name, _snapshot_id(snapshot)): snapshot for snapshot in snapshots}
+        known = self._repositories.get(repository_name, set())
+        
+        removed = [key for key in known if key not in current]
+        for key in removed:
+            self._remove(key)
+        
+        added = 0
+        for key, snapshot in current.items():
+            if key not in self._snapshots:
+                self._add(repository_name, snapshot)
+                added += 1
+            elif self._snapshots[key] != snapshot:
+                self._add(repository_name, snapshot)
+        return added, len(removed)
+    
+    def refresh(self, repository_names: Optional[Iterable[str]] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        Re-list snapshots and update the index.
+        
+        Args:
+            repository_names: Repositories to refresh (optional, defaults to
+                every repository; repositories that no longer exist are dropped)
+        
+        Returns:
+            dict: Repository name to (added, removed) snapshot counts
+        """
+        if repository_names is None:
+            repository_names = [repo["name"] for repo in self.client.repositories.list() or []]
+            for stale in set(self._repositories) - set(repository_names):
+                self.update_repository(stale, [])
+                del self._repositories[stale]
+        
+        changes = {}
+        for repository_name in repository_names:
+            snapshots = self.client.snapshots.list(repository_name) or []
+            changes[repository_name] = self.update_repository(repository_name, snapshots)
+        return changes
+    
+    def tags(self) -> Dict[str, int]:
+        """
+        Return every indexed tag with its snapshot count.
+        
+        Returns:
+            dict: Tag to number of snapshots
+        """
+        return {tag: len(keys) for tag, keys in self._tags.items()}
+    
+    def query(
+        self,
+        tags: Optional[Iterable[str]] = None,
+        any_tags: Optional[Iterable[str]] = None,
+        since: Optional[TimeLike] = None,
+        until: Optional[TimeLike] = None,
+        path_prefix: Optional[str] = None,
+        repository_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find snapshots matching every given condition, without API calls.
+        
+        Args:
+            tags: Tags that must all be present
+            any_tags: Tags of which at least one must be present
+            since: Earliest snapshot time (epoch seconds or datetime, inclusive)
+            until: Latest snapshot time (epoch seconds or datetime, inclusive)
+            path_prefix: Only snapshots whose backed-up paths overlap this path
+            repository_name: Only snapshots of this repository
+        
+        Returns:
+            list: ``{"repository": name, "snapshot": snapshot}`` dicts, oldest first
+        """
+        candidates: Optional[Set[_Key]] = None
+        
+        def narrow(keys: Set[_Key]) -> None:
+            nonlocal candidates
+            candidates = set(keys) if candidates is None else candidates & keys
+        
+        for tag in tags or []:
+            narrow(self._tags.get(tag, set()))
+        if any_tags is not None:
+            matching: Set[_Key] = set()
+            for tag in any_tags:
+                matching |= self._tags.get(tag, set())
+            narrow(matching)
+        if repository_name is not None:
+            narrow(self._repositories.get(repository_name, set()))
+        
+        start_time = _to_seconds(since)
+        end_time = _to_seconds(until)
+        lo = 0 if start_time is None else bisect.bisect_left(self._times, start_time)
+        hi = len(self._times) if end_time is None else bisect.bisect_right(self._times, end_time)
+        
+        if candidates is not None and len(candidates) < hi - lo:
+            # Fewer tag/repository matches than snapshots in the time range:
+            # filter the matches by time instead of scanning the range
+            keys = [
+                key for seconds, key in sorted((self._time_of(key), key) for key in candidates)
+                if (start_time is None or seconds >= start_time) and (end_time is None or seconds <= end_time)
+            ]
+        else:
+            keys = [key for key in self._time_keys[lo:hi] if candidates is None or key in candidates]
+        
+        prefix = normalize_path(path_prefix) if path_prefix is not None else None
+        results = []
+        for key in keys:
+            snapshot = self._snapshots[key]
+            if prefix is not None and not any(
+                _overlaps(normalize_path(path), prefix) for path in snapshot.get("paths") or []
+            ):
+                continue
+            results.append({"repository": key[0], "snapshot": snapshot})
+        return results
+    
+    def save(self, path: str) -> None:
+        """
+        Persist the index as JSON.
+        
+        Args:
+            path: Output file path
+        """
+        data = {
+            repository_name: [self._snapshots[key] for key in sorted(keys)]
+            for repository_name, keys in self._repositories.items()
+        }
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": 1, "repositories": data}, f)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, client, path: str) -> "SnapshotIndex":
+        """
+        Load an index saved with :meth:`save`.
+        
+        Args:
+            client: ZerobyteClient instance used for later refreshes
+            path: Index file path
+        
+        Returns:
+            SnapshotIndex: Restored index
+        """
+        index = cls(client)
+        with open(path) as f:
+            data = json.load(f)
+        for repository_name, snapshots in data.get("repositories", {}).items():
+            index.update_repository(repository_name, snapshots)
+        return index
@@ -1,6 +1,53 @@
 """Snapshots API methods."""
 
-from typing import Dict, Any, List, Optional
+import json
+import os
+import posixpath
+from concurrent.futures import Executor
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .concurrency import imap_grouped
+from .exceptions import NotFoundError
+from .files import normalize_path, walk_listing
+from .resolver import request_by_name
+
+
+def _snapshot_id(snapshot: Dict[str, Any]) -> str:
+    """Return the identifier used to address a snapshot in API paths."""
+    return snapshot.get('id') or snapshot['short_id']
+
+
+def _deletion_targets(
+    selection: Union[Dict[str, Iterable[str]], Iterable[Any]]
+) -> List[Tuple[str, str]]:
+    """Normalize a bulk deletion selection to unique (repository, snapshot ID) pairs."""
+    if isinstance(selection, dict):
+        pairs = [
+            (repository_name, snapshot_id)
+            for repository_name, snapshot_ids in selection.items()
+            for snapshot_id in snapshot_ids
+        ]
+    else:
+        pairs = []
+        for item in selection:
+            if isinstance(item, dict):
+                pairs.append((item['repository'], _snapshot_id(item['snapshot'])))
+            else:
+                repository_name, snapshot_id = item
+                pairs.append((repository_name, snapshot_id))
+    return list(dict.fromkeys(pairs))
+
+
+def _entry_signature(entry: Optional[Dict[str, Any]]) -> Optional[Tuple[Any, ...]]:
+    """Return the attributes used to decide whether a file entry changed."""
+    if entry is None:
+        return None
+    return (
+        entry.get('type'),
+        entry.get('size'),
+        entry.get('mtime'),
+        entry.get('mode'),
+    )
 
 
 class SnapshotsAPI:
@@ -10,12 +57,21 @@ class SnapshotsAPI:
         """Initialize SnapshotsAPI with client instance."""
         self.client = client
     
+    def _request(self, method: str, repository_name: str, suffix: str, **kwargs: Any) -> Any:
+        """Send a request to a repository route, retrying with the resolved name on 404."""
+        return request_by_name(
+            self.client,
+            "repositories",
+            repository_name,
+            lambda ref: self.client._make_request(method, f"/api/v1/repositories/{ref}{suffix}", **kwargs)
+        )
+    
     def list(self, repository_name: str, backup_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         List all snapshots in a repository.
         
         Args:
-            repository_name: Repository name
+            repository_name: Repository name or ID
             backup_id: Optional backup ID to filter snapshots
         
         Returns:
@@ -30,9 +86,10 @@ class SnapshotsAPI:
         if backup_id:
             params['backupId'] = backup_id
         
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/repositories/{repository_name}/snapshots",
+            repository_name,
+            "/snapshots",
             params=params if params else None
         )
     
@@ -45,7 +102,7 @@ class SnapshotsAPI:
         Get details of a specific snapshot.
         
         Args:
-            repository_name: Repository name
+            repository_name: Repository name or ID
             snapshot_id: Snapshot ID
         
         Returns:
@@ -57,9 +114,10 @@ class SnapshotsAPI:
             ...     snapshot_id="abc123"
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/repositories/{repository_name}/snapshots/{snapshot_id}"
+            repository_name,
+            f"/snapshots/{snapshot_id}"
         )
     
     def delete(
@@ -71,7 +129,7 @@ class SnapshotsAPI:
         Delete a snapshot.
         
         Args:
-            repository_name: Repository name
+            repository_name: Repository name or ID
             snapshot_id: Snapshot ID
         
         Returns:
@@ -83,9 +141,10 @@ class SnapshotsAPI:
             ...     snapshot_id="abc123"
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "DELETE",
-            f"/api/v1/repositories/{repository_name}/snapshots/{snapshot_id}"
+            repository_name,
+            f"/snapshots/{snapshot_id}"
         )
     
     def list_files(
@@ -98,7 +157,7 @@ class SnapshotsAPI:
         List files in a snapshot.
         
         Args:
-            repository_name: Repository name
+            repository_name: Repository name or ID
             snapshot_id: Snapshot ID
             path: Path within snapshot (optional)
         
@@ -116,9 +175,10 @@ class SnapshotsAPI:
         if path:
             params['path'] = path
         
-        return self.client._make_request(
+        return self._request(
             "GET",
-            f"/api/v1/repositories/{repository_name}/snapshots/{snapshot_id}/files",
+            repository_name,
+            f"/snapshots/{snapshot_id}/files",
             params=params if params else None
         )
     
@@ -131,7 +191,7 @@ class SnapshotsAPI:
         Restore from a repository.
         
         Args:
-            repository_name: Repository name
+            repository_name: Repository name or ID
             restore_data: Restore configuration including:
                 - target (str): Target path for restoration
                 - include (list): Paths to include (optional)
@@ -152,8 +212,270 @@ class SnapshotsAPI:
             ...     }
             ... )
         """
-        return self.client._make_request(
+        return self._request(
             "POST",
-            f"/api/v1/repositories/{repository_name}/restore",
+            repository_name,
+            "/restore",
             data=restore_data
         )
+    
+    
+    def find_entry(
+        self,
+        repository_name: str,
+        snapshot_id: str,
+        path: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a single file or directory entry in a snapshot.
+        
+        The entry is found by listing its parent directory, so only one
+        request is made regardless of the size of the snapshot.
+        
+        Args:
+            repository_name: Repository name or ID
+            snapshot_id: Snapshot ID
+            path: Absolute path of the entry within the snapshot
+        
+        Returns:
+            dict: File entry, or None if the path does not exist in the snapshot
+        
+        Example:
+            >>> entry = client.snapshots.find_entry(
+            ...     repository_name="my-backup-repo",
+            ...     snapshot_id="abc123",
+            ...     path="/data/report.pdf"
+            ... )
+        """
+        path = normalize_path(path)
+        parent = posixpath.dirname(path)
+        
+        try:
+            listing = self.list_files(repository_name, snapshot_id, path=parent)
+        except NotFoundError:
+            return None
+        
+        for entry in (listing or {}).get('files', []):
+            if normalize_path(entry.get('path', '')) == path:
+                return entry
+        return None
+    
+    def path_history(
+        self,
+        repository_name: str,
+        path: str,
+        backup_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the snapshots in which a path appeared, changed or disappeared.
+        
+        Snapshots are ordered by time and the path is looked up with
+        :meth:`find_entry` using bisection: a range of snapshots whose
+        endpoints hold the same version of the path is assumed unchanged,
+        so each transition costs O(log n) lookups instead of one per
+        snapshot. A change that is reverted between two probed snapshots
+        (A -> B -> A, or a path that appears and disappears again) is
+        therefore not reported.
+        
+        Args:
+            repository_name: Repository name or ID
+            path: Absolute path of the file or directory within the snapshots
+            backup_id: Optional backup ID to restrict the snapshots considered
+        
+        Returns:
+            list: Timeline of changes, oldest first. Each item contains:
+                - change (str): 'added', 'modified' or 'removed'
+                - snapshot (dict): First snapshot showing the change
+                - entry (dict): File entry in that snapshot (None when removed)
+        
+        Example:
+            >>> history = client.snapshots.path_history(
+            ...     repository_name="my-backup-repo",
+            ...     path="/data/report.pdf"
+            ... )
+            >>> for version in history:
+            ...     print(version['change'], version['snapshot']['time'])
+        """
+        snapshots = sorted(
+            self.list(repository_name, backup_id=backup_id) or [],
+            key=lambda snapshot: snapshot.get('time') or 0
+        )
+        if not snapshots:
+            return []
+        
+        entries: Dict[int, Optional[Dict[str, Any]]] = {}
+        
+        def lookup(index: int) -> Optional[Dict[str, Any]]:
+            if index not in entries:
+                entries[index] = self.find_entry(
+                    repository_name,
+                    _snapshot_id(snapshots[index]),
+                    path
+                )
+            return entries[index]
+        
+        # Indices of the first snapshot of every version after the first one
+        transitions = []
+        stack = [(0, len(snapshots) - 1)]
+        while stack:
+            lo, hi = stack.pop()
+            if _entry_signature(lookup(lo)) == _entry_signature(lookup(hi)):
+                continue
+            if hi - lo == 1:
+                transitions.append(hi)
+                continue
+            mid = (lo + hi) // 2
+            stack.append((mid, hi))
+            stack.append((lo, mid))
+        
+        history = []
+        previous = None
+        for index in [0] + sorted(transitions):
+            entry = lookup(index)
+            if entry is None:
+                change = 'removed' if previous is not None else None
+            else:
+                change = 'added' if previous is None else 'modified'
+            if change:
+                history.append({
+                    'change': change,
+                    'snapshot': snapshots[index],
+                    'entry': entry
+                })
+            previous = entry
+        
+        return history
+    
+    def walk(
+        self,
+        repository_name: str,
+        snapshot_id: str,
+        path: Optional[str] = None,
+        executor: Optional[Executor] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recursively iterate over every entry in a snapshot.
+        
+        Directories are listed one at a time with :meth:`list_files` and
+        entries are yielded depth first with children in name order, so
+        only the listings along the current branch are held in memory.
+        
+        Args:
+            repository_name: Repository name or ID
+            snapshot_id: Snapshot ID
+            path: Directory to start from (optional, defaults to the root)
+            executor: Executor used to fetch subdirectory listings ahead of
+                the walk (optional)
+        
+        Yields:
+            dict: File entries below ``path``
+        
+        Example:
+            >>> for entry in client.snapshots.walk("my-backup-repo", "abc123", "/data"):
+            ...     print(entry['path'], entry.get('size'))
+        """
+        return walk_listing(
+            lambda directory: self.list_files(repository_name, snapshot_id, path=directory),
+            path,
+            executor=executor
+        )
+    
+    def bulk_delete(
+        self,
+        selection: Union[Dict[str, Iterable[str]], Iterable[Any]],
+        max_workers: int = 4,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        state_file: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete many snapshots, one repository at a time per worker.
+        
+        Deleting a snapshot locks its repository on the server, so deletions
+        within a repository run sequentially while different repositories
+        are processed in parallel. Failures are collected rather than
+        aborting the run, and snapshots that no longer exist count as
+        deleted.
+        
+        Args:
+            selection: Snapshots to delete, as any of:
+                - dict mapping repository name to snapshot IDs
+                - (repository_name, snapshot_id) pairs
+                - ``SnapshotIndex.query`` results (to select by tag or time range)
+            max_workers: Maximum number of repositories processed at once
+            progress: Called after each snapshot with a dict containing
+                repository, snapshot_id, status ('deleted' or 'failed'),
+                error, done and total
+            state_file: Path of a journal of completed deletions. Snapshots
+                already recorded there are skipped, so an interrupted run
+                resumes where it stopped.
+        
+        Returns:
+            dict: Outcome containing:
+                - deleted (list): (repository_name, snapshot_id) pairs deleted
+                - skipped (list): Pairs already recorded in ``state_file``
+                - failed (list): Dicts with repository, snapshot_id and error
+        
+        Example:
+            >>> index = SnapshotIndex(client)
+            >>> index.refresh()
+            >>> result = client.snapshots.bulk_delete(
+            ...     index.query(tags=["misconfigured"], since=start, until=end),
+            ...     state_file="cleanup.journal"
+            ... )
+            >>> print(len(result['deleted']), len(result['failed']))
+        """
+        targets = _deletion_targets(selection)
+        
+        completed = set()
+        if state_file and os.path.exists(state_file):
+            with open(state_file) as f:
+                for line in f:
+                    if line.strip():
+                        completed.add(tuple(json.loads(line)))
+        
+        skipped = [target for target in targets if target in completed]
+        pending = [target for target in targets if target not in completed]
+        result: Dict[str, Any] = {'deleted': [], 'skipped': skipped, 'failed': []}
+        
+        def delete(target: Tuple[str, str]) -> None:
+            try:
+                self.delete(*target)
+            except NotFoundError:
+                pass
+        
+        journal = open(state_file, 'a') if state_file else None
+        try:
+            done = len(skipped)
+            for target, _, error in imap_grouped(
+                delete,
+                pending,
+                key=lambda target: target[0],
+                max_workers=max_workers
+            ):
+                done += 1
+                repository_name, snapshot_id = target
+                if error is None:
+                    result['deleted'].append(target)
+                    if journal:
+                        journal.write(json.dumps(list(target)) + "\n")
+                        journal.flush()
+                else:
+                    result['failed'].append({
+                        'repository': repository_name,
+                        'snapshot_id': snapshot_id,
+                        'error': error
+                    })
+                if progress:
+                    progress({
+                        'repository': repository_name,
+                        'snapshot_id': snapshot_id,
+                        'status': 'deleted' if error is None else 'failed',
+                        'error': error,
+                        'done': done,
+                        'total': len(targets)
+                    })
+        finally:
+            if journal:
+                journal.close()
+        
+        return result
@@ -1,6 +1,52 @@
 """Volumes API methods."""
 
-from typing import Dict, Any, List, Optional
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional, Set, Union
+
+import requests
+
+from .concurrency import imap_unordered
+from .exceptions import APIError, AuthenticationError, ZerobyteError
+from .files import walk_listing
+from .resolver import invalidate, resolve_name
+
+
+# Volume backends whose mounts go over the network
+NETWORK_BACKENDS = {"nfs", "smb", "webdav", "rclone"}
+
+
+def _caused_by(error: Optional[BaseException], types: Any) -> bool:
+    """Return True if an error or one of its causes is of the given types."""
+    while error is not None:
+        if isinstance(error, types):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _is_timeout(error: Optional[BaseException]) -> bool:
+    """Return True if a request failed because it timed out."""
+    return _caused_by(error, requests.Timeout)
+
+
+def _is_transient(error: BaseException) -> bool:
+    """Return True if a failed request is worth retrying."""
+    if isinstance(error, _MountStatusError):
+        return True
+    if isinstance(error, APIError):
+        return error.status_code is not None and (error.status_code >= 500 or error.status_code == 429)
+    if isinstance(error, AuthenticationError):
+        return False
+    if isinstance(error, (requests.RequestException, ZerobyteError)):
+        # The client wraps connection errors and timeouts in ZerobyteError
+        return _caused_by(error, (requests.ConnectionError, requests.Timeout))
+    return False
+
+
+class _MountStatusError(ZerobyteError):
+    """A mount or unmount request that the server answered with status "error"."""
 
 
 class VolumesAPI:
@@ -10,6 +56,10 @@ class VolumesAPI:
         """Initialize VolumesAPI with client instance."""
         self.client = client
     
+    def _ref(self, volume_id: Union[int, str]) -> Union[int, str]:
+        """Return the name a volume is addressed by."""
+        return resolve_name(self.client, "volumes", volume_id)
+    
     def list(self) -> List[Dict[str, Any]]:
         """
         List all volumes.
@@ -52,18 +102,21 @@ class VolumesAPI:
             ...     "options": []
             ... })
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "POST",
             "/api/v1/volumes",
             data=volume_data
         )
+        invalidate(self.client, "volumes")
+        return response
     
-    def test_connection(self, volume_data: Dict[str, Any]) -> Dict[str, Any]:
+    def test_connection(self, volume_data: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Test connection to a volume before creating it.
         
         Args:
             volume_data: Volume configuration to test
+            timeout: Seconds to wait for the server's response (optional)
         
         Returns:
             dict: Test result
@@ -77,15 +130,102 @@ class VolumesAPI:
         return self.client._make_request(
             "POST",
             "/api/v1/volumes/test-connection",
-            data=volume_data
+            data=volume_data,
+            timeout=timeout
         )
     
-    def get(self, volume_id: int) -> Dict[str, Any]:
+    def preflight(
+        self,
+        configs: Iterable[Dict[str, Any]],
+        timeout: float = 60.0,
+        max_workers: int = 16,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Test many candidate volume configurations concurrently.
+        
+        Identical configurations are tested once. Each test is bounded by
+        ``timeout``, so the preflight takes about as long as the slowest
+        configuration.
+        
+        Args:
+            configs: Volume configurations, as passed to :meth:`test_connection`
+            timeout: Seconds to wait for each connection test
+            max_workers: Maximum number of concurrent tests
+            progress: Callable receiving each result with ``done`` and
+                ``total`` counts of distinct configurations (optional)
+        
+        Returns:
+            dict: Preflight report containing:
+                - ok (bool): True if every configuration passed
+                - tested (int): Number of distinct configurations tested
+                - results (list): Result per input configuration, in order
+                    (duplicates share one result)
+                - passed (list): Results of the distinct passing configurations
+                - failed (list): Results of the distinct failing configurations
+            
+            Each result contains config, status ("passed", "failed" as
+            reported by the server, "timeout" or "error"), success, message,
+            error and elapsed (seconds).
+        
+        Example:
+            >>> report = client.volumes.preflight(candidates, timeout=20)
+            >>> for result in report['failed']:
+            ...     print(result['config']['name'], result['status'], result['message'])
+        """
+        configs = list(configs)
+        keys = [json.dumps(config, sort_keys=True, default=str) for config in configs]
+        distinct = {}
+        for key, config in zip(keys, configs):
+            distinct.setdefault(key, config)
+        
+        def test(key: str) -> Dict[str, Any]:
+            result: Dict[str, Any] = {
+                "config": distinct[key],
+                "status": None,
+                "success": False,
+                "message": None,
+                "error": None,
+                "elapsed": 0.0,
+            }
+            start = time.monotonic()
+            try:
+                response = self.test_connection(distinct[key], timeout=timeout) or {}
+                result["success"] = bool(response.get("success"))
+                result["message"] = response.get("message")
+                result["status"] = "passed" if result["success"] else "failed"
+            except Exception as e:
+                result["error"] = e
+                result["message"] = str(e)
+                result["status"] = "timeout" if _is_timeout(e) else "error"
+            result["elapsed"] = time.monotonic() - start
+            return result
+        
+        results = {}
+        for key, result, error in imap_unordered(test, distinct, max_workers=max_workers):
+            if error is not None:
+                raise error
+            results[key] = result
+            if progress is not None:
+                progress(dict(result, done=len(results), total=len(distinct)))
+        
+        unique = [results[key] for key in distinct]
+        passed = [result for result in unique if result["success"]]
+        failed = [result for result in unique if not result["success"]]
+        return {
+            "ok": not failed,
+            "tested": len(unique),
+            "results": [results[key] for key in keys],
+            "passed": passed,
+            "failed": failed,
+        }
+    
+    def get(self, volume_id: Union[int, str]) -> Dict[str, Any]:
         """
         Get a specific volume by ID.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
         
         Returns:
             dict: Volume information
@@ -94,14 +234,14 @@ class VolumesAPI:
             >>> volume = client.volumes.get(1)
             >>> print(volume['name'])
         """
-        return self.client._make_request("GET", f"/api/v1/volumes/{volume_id}")
+        return self.client._make_request("GET", f"/api/v1/volumes/{self._ref(volume_id)}")
     
-    def update(self, volume_id: int, volume_data: Dict[str, Any]) -> Dict[str, Any]:
+    def update(self, volume_id: Union[int, str], volume_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Update a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
             volume_data: Updated volume configuration
         
         Returns:
@@ -113,18 +253,20 @@ class VolumesAPI:
             ...     "autoRemount": True
             ... })
         """
-        return self.client._make_request(
+        response = self.client._make_request(
             "PUT",
-            f"/api/v1/volumes/{volume_id}",
+            f"/api/v1/volumes/{self._ref(volume_id)}",
             data=volume_data
         )
+        invalidate(self.client, "volumes")
+        return response
     
-    def delete(self, volume_id: int) -> Dict[str, Any]:
+    def delete(self, volume_id: Union[int, str]) -> Dict[str, Any]:
         """
         Delete a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
         
         Returns:
             dict: Deletion response
@@ -132,14 +274,17 @@ class VolumesAPI:
         Example:
             >>> response = client.volumes.delete(1)
         """
-        return self.client._make_request("DELETE", f"/api/v1/volumes/{volume_id}")
+        response = self.client._make_request("DELETE", f"/api/v1/volumes/{self._ref(volume_id)}")
+        invalidate(self.client, "volumes")
+        return response
     
-    def mount(self, volume_id: int) -> Dict[str, Any]:
+    def mount(self, volume_id: Union[int, str], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Mount a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
+            timeout: Seconds to wait for the server's response (optional)
         
         Returns:
             dict: Mount response
@@ -149,15 +294,17 @@ class VolumesAPI:
         """
         return self.client._make_request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/mount"
+            f"/api/v1/volumes/{self._ref(volume_id)}/mount",
+            timeout=timeout
         )
     
-    def unmount(self, volume_id: int) -> Dict[str, Any]:
+    def unmount(self, volume_id: Union[int, str], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Unmount a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
+            timeout: Seconds to wait for the server's response (optional)
         
         Returns:
             dict: Unmount response
@@ -167,15 +314,226 @@ class VolumesAPI:
         """
         return self.client._make_request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/unmount"
+            f"/api/v1/volumes/{self._ref(volume_id)}/unmount",
+            timeout=timeout
+        )
+    
+    def _bulk_action(
+        self,
+        action: str,
+        volumes: Iterable[Union[str, Dict[str, Any]]],
+        after: Optional[Dict[str, Iterable[str]]],
+        max_workers: int,
+        network_max_workers: int,
+        retries: int,
+        backoff: float,
+        timeout: Optional[float],
+        progress: Optional[Callable[[Dict[str, Any]], None]]
+    ) -> Dict[str, Any]:
+        """Run mount or unmount over many volumes (see :meth:`bulk_mount`)."""
+        volumes = list(volumes)
+        if any(not isinstance(volume, dict) for volume in volumes):
+            known = {volume.get("name"): volume for volume in self.list() or []}
+            volumes = [
+                volume if isinstance(volume, dict) else known.get(volume, {"name": volume})
+                for volume in volumes
+            ]
+        by_name = {volume["name"]: volume for volume in volumes}
+        
+        # waits_for[name] = volumes that must finish first
+        waits_for: Dict[str, Set[str]] = {name: set() for name in by_name}
+        for name, dependencies in (after or {}).items():
+            for dependency in dependencies:
+                if name in by_name and dependency in by_name:
+                    if action == "mount":
+                        waits_for[name].add(dependency)
+                    else:
+                        waits_for[dependency].add(name)
+        
+        remaining = {name: set(dependencies) for name, dependencies in waits_for.items()}
+        order: List[str] = []
+        ready = [name for name, dependencies in remaining.items() if not dependencies]
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for other, dependencies in remaining.items():
+                if name in dependencies:
+                    dependencies.discard(name)
+                    if not dependencies:
+                        ready.append(other)
+        if len(order) != len(by_name):
+            raise ValueError("Volume ordering constraints contain a cycle")
+        
+        request = self.mount if action == "mount" else self.unmount
+        expected = "mounted" if action == "mount" else "unmounted"
+        
+        def run(name: str) -> Dict[str, Any]:
+            attempt = 0
+            while True:
+                attempt += 1
+                try:
+                    response = request(name, timeout=timeout)
+                    if (response or {}).get("status") == "error":
+                        raise _MountStatusError(response.get("error") or f"{action} failed")
+                    return {"response": response, "error": None, "attempts": attempt}
+                except Exception as e:
+                    if attempt > retries or not _is_transient(e):
+                        return {"response": None, "error": e, "attempts": attempt}
+                    time.sleep(backoff * 2 ** (attempt - 1))
+        
+        def is_network(name: str) -> bool:
+            return by_name[name].get("type") in NETWORK_BACKENDS
+        
+        result: Dict[str, Any] = {"succeeded": [], "failed": [], "skipped": []}
+        finished: Dict[str, bool] = {}
+        limits = {True: max(1, network_max_workers), False: max(1, max_workers)}
+        active = {True: 0, False: 0}
+        
+        def report(name: str, status: str, error: Optional[BaseException], attempts: int) -> None:
+            if progress:
+                progress({
+                    "volume": name,
+                    "status": status,
+                    "attempts": attempts,
+                    "error": error,
+                    "done": len(finished),
+                    "total": len(by_name),
+                })
+        
+        pending = list(order)
+        with ThreadPoolExecutor(max_workers=limits[True] + limits[False]) as executor:
+            running: Dict[Any, str] = {}
+            while pending or running:
+                for name in list(pending):
+                    dependencies = waits_for[name]
+                    if any(finished.get(dependency) is False for dependency in dependencies):
+                        pending.remove(name)
+                        finished[name] = False
+                        result["skipped"].append(name)
+                        report(name, "skipped", None, 0)
+                        continue
+                    if not all(finished.get(dependency) for dependency in dependencies):
+                        continue
+                    network = is_network(name)
+                    if active[network] >= limits[network]:
+                        continue
+                    pending.remove(name)
+                    active[network] += 1
+                    running[executor.submit(run, name)] = name
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    active[is_network(name)] -= 1
+                    outcome = future.result()
+                    error, attempts = outcome["error"], outcome["attempts"]
+                    if error is not None:
+                        finished[name] = False
+                        result["failed"].append({"volume": name, "error": error, "attempts": attempts})
+                        report(name, "failed", error, attempts)
+                    else:
+                        finished[name] = True
+                        result["succeeded"].append(name)
+                        report(name, expected, None, outcome["attempts"])
+        return result
+    
+    def bulk_mount(
+        self,
+        volumes: Iterable[Union[str, Dict[str, Any]]],
+        after: Optional[Dict[str, Iterable[str]]] = None,
+        max_workers: int = 8,
+        network_max_workers: int = 2,
+        retries: int = 2,
+        backoff: float = 1.0,
+        timeout: Optional[float] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Mount many volumes in parallel.
+        
+        Network volumes (NFS, SMB, WebDAV, rclone) share a smaller
+        concurrency limit than local ones. A volume starts only after the
+        volumes it is declared to come after have mounted; if one of them
+        fails, it is skipped. Transient failures (connection errors,
+        timeouts, 5xx and 429 responses and mount status "error") are
+        retried with exponential backoff; other errors fail the volume at
+        once.
+        
+        Args:
+            volumes: Volume names or volume dicts (as returned by :meth:`list`);
+                dicts avoid an extra :meth:`list` call to look up types
+            after: Ordering constraints, mapping a volume name to the names
+                that must be mounted first
+            max_workers: Maximum number of concurrent local mounts
+            network_max_workers: Maximum number of concurrent network mounts
+            retries: Retries per volume after the first attempt
+            backoff: Seconds before the first retry, doubled for each next one
+            timeout: Seconds to wait for each mount request (optional)
+            progress: Called after each volume with volume, status
+                ('mounted', 'failed' or 'skipped'), attempts, error, done
+                and total
+        
+        Returns:
+            dict: Outcome containing:
+                - succeeded (list): Names of mounted volumes
+                - failed (list): Dicts with volume, error and attempts
+                - skipped (list): Names of volumes whose prerequisites failed
+        
+        Raises:
+            ValueError: If the ordering constraints contain a cycle
+        
+        Example:
+            >>> result = client.volumes.bulk_mount(
+            ...     client.volumes.list(),
+            ...     after={"media-bind": ["nas-share"]},
+            ...     progress=lambda p: print(p['done'], '/', p['total'], p['volume'], p['status'])
+            ... )
+        """
+        return self._bulk_action(
+            "mount", volumes, after, max_workers, network_max_workers,
+            retries, backoff, timeout, progress
         )
     
-    def health_check(self, volume_id: int) -> Dict[str, Any]:
+    def bulk_unmount(
+        self,
+        volumes: Iterable[Union[str, Dict[str, Any]]],
+        after: Optional[Dict[str, Iterable[str]]] = None,
+        max_workers: int = 8,
+        network_max_workers: int = 2,
+        retries: int = 2,
+        backoff: float = 1.0,
+        timeout: Optional[float] = None,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Unmount many volumes in parallel.
+        
+        Takes the same arguments as :meth:`bulk_mount`. ``after`` is given
+        in mount order and applied in reverse, so the same constraints can
+        be used for both: a volume is unmounted before the volumes it is
+        mounted after.
+        
+        Returns:
+            dict: Outcome containing succeeded, failed and skipped (see
+                :meth:`bulk_mount`)
+        
+        Example:
+            >>> result = client.volumes.bulk_unmount(["media-bind", "nas-share"],
+            ...                                      after={"media-bind": ["nas-share"]})
+        """
+        return self._bulk_action(
+            "unmount", volumes, after, max_workers, network_max_workers,
+            retries, backoff, timeout, progress
+        )
+    
+    def health_check(self, volume_id: Union[int, str], timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Perform health check on a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
+            timeout: Seconds to wait for the server's response (optional)
         
         Returns:
             dict: Health check result
@@ -186,15 +544,99 @@ class VolumesAPI:
         """
         return self.client._make_request(
             "POST",
-            f"/api/v1/volumes/{volume_id}/health-check"
+            f"/api/v1/volumes/{self._ref(volume_id)}/health-check",
+            timeout=timeout
         )
     
-    def list_files(self, volume_id: int, path: Optional[str] = None) -> Dict[str, Any]:
+    def health_sweep(
+        self,
+        volumes: Optional[Iterable[Dict[str, Any]]] = None,
+        timeout: float = 30.0,
+        max_workers: int = 16,
+        remount: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Health-check many volumes concurrently.
+        
+        Each check is bounded by ``timeout``, so one hung mount delays
+        only its own result and the sweep takes about as long as the
+        slowest volume. Results are yielded as the checks complete.
+        
+        Args:
+            volumes: Volumes to check (optional, defaults to :meth:`list`)
+            timeout: Seconds to wait for each health check (and remount)
+            max_workers: Maximum number of concurrent checks
+            remount: Mount volumes that are not healthy and have
+                ``autoRemount`` set
+        
+        Yields:
+            dict: Result per volume containing:
+                - volume (dict): The volume
+                - status (str): "mounted", "unmounted" or "error" as reported
+                    by the server, "timeout" or "failed" (request error)
+                - healthy (bool): True if the status is "mounted"
+                - result (dict): Health check response (None on failure)
+                - error (Exception): Request error, if any
+                - elapsed (float): Seconds taken by the health check
+                - remount (dict): Mount response, status or error when a
+                    remount was attempted, else None
+        
+        Example:
+            >>> for result in client.volumes.health_sweep(timeout=10, remount=True):
+            ...     if not result['healthy']:
+            ...         print(result['volume']['name'], result['status'], result['error'])
+        """
+        if volumes is None:
+            volumes = self.list() or []
+        
+        def check(volume: Dict[str, Any]) -> Dict[str, Any]:
+            name = volume.get("name")
+            outcome: Dict[str, Any] = {
+                "volume": volume,
+                "status": None,
+                "healthy": False,
+                "result": None,
+                "error": None,
+                "elapsed": 0.0,
+                "remount": None,
+            }
+            start = time.monotonic()
+            try:
+                outcome["result"] = self.health_check(name, timeout=timeout)
+                outcome["status"] = (outcome["result"] or {}).get("status")
+            except Exception as e:
+                outcome["error"] = e
+                outcome["status"] = "timeout" if _is_timeout(e) else "failed"
+            outcome["elapsed"] = time.monotonic() - start
+            outcome["healthy"] = outcome["status"] == "mounted"
+            
+            if remount and not outcome["healthy"] and volume.get("autoRemount"):
+                try:
+                    response = self.mount(name, timeout=timeout)
+                    outcome["remount"] = {
+                        "status": (response or {}).get("status"),
+                        "result": response,
+                        "error": None,
+                    }
+                except Exception as e:
+                    outcome["remount"] = {
+                        "status": "timeout" if _is_timeout(e) else "failed",
+                        "result": None,
+                        "error": e,
+                    }
+            return outcome
+        
+        for _, outcome, error in imap_unordered(check, volumes, max_workers=max_workers):
+            if error is not None:
+                raise error
+            yield outcome
+    
+    def list_files(self, volume_id: Union[int, str], path: Optional[str] = None) -> Dict[str, Any]:
         """
         List files in a volume.
         
         Args:
-            volume_id: Volume ID
+            volume_id: Volume ID or name
             path: Path within the volume (optional)
         
         Returns:
@@ -209,10 +651,42 @@ class VolumesAPI:
         
         return self.client._make_request(
             "GET",
-            f"/api/v1/volumes/{volume_id}/files",
+            f"/api/v1/volumes/{self._ref(volume_id)}/files",
             params=params
         )
     
+    def walk(
+        self,
+        volume_id: Union[int, str],
+        path: Optional[str] = None,
+        executor: Optional[Executor] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Recursively iterate over every entry in a volume.
+        
+        Directories are listed one at a time with :meth:`list_files` and
+        entries are yielded depth first with children in name order, so
+        only the listings along the current branch are held in memory.
+        
+        Args:
+            volume_id: Volume ID or name
+            path: Directory to start from (optional, defaults to the volume root)
+            executor: Executor used to fetch subdirectory listings ahead of
+                the walk (optional)
+        
+        Yields:
+            dict: File entries below ``path``
+        
+        Example:
+            >>> for entry in client.volumes.walk(1, path="/backups"):
+            ...     print(entry['path'], entry.get('size'))
+        """
+        return walk_listing(
+            lambda directory: self.list_files(volume_id, path=directory),
+            path,
+            executor=executor
+        )
+    
     def browse_filesystem(self, path: Optional[str] = None) -> Dict[str, Any]:
         """
         Browse the filesystem.
@@ -0,0 +1,307 @@
+"""Adaptive polling of backup schedule status."""
+
+import heapq
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .exceptions import NotFoundError, ValidationError
+from .files import parse_time
+
+
+# Schedule fields whose changes are reported
+WATCHED_FIELDS = ("lastBackupStatus", "lastBackupAt", "lastBackupError", "nextBackupAt", "enabled")
+
+
+class ScheduleWatcher:
+    """
+    Watch backup schedules and report status changes.
+    
+    All watched schedules share one scheduler: each schedule has its own
+    next poll time, and only schedules that are due are fetched. Running
+    backups ("in_progress") are polled every ``active_interval`` seconds;
+    other schedules are polled again shortly after their ``nextBackupAt``,
+    and at least every ``idle_interval`` seconds. When all schedules are
+    watched, or at least ``bulk_threshold`` are due at once, a single
+    ``backup_schedules.list_all`` call refreshes every schedule instead of
+    one ``get_schedule`` call each.
+    
+    Changes are delivered as event dicts to listeners and through
+    :meth:`events`. Each event contains:
+    
+    - type (str): "changed", "added" (a new schedule, when watching all),
+      "removed" or "error" (also for a watched name or ID that matches
+      no schedule; it is looked up again every ``idle_interval``)
+    - schedule_id: Schedule ID, the watched reference if it could not be
+        resolved, or None for a failed bulk listing
+    - schedule (dict): Current schedule (None if removed or on error)
+    - previous (dict): Previous schedule (None if added)
+    - changes (dict): Field name to (old, new) for the watched fields
+    - error (Exception): Request error of "error" events
+    
+    Args:
+        client: ZerobyteClient instance
+        schedules: Schedule IDs or names to watch (optional, defaults to
+            every schedule, including ones created later)
+        active_interval: Seconds between polls of a running backup
+        idle_interval: Maximum seconds between polls of any schedule
+        grace: Seconds after ``nextBackupAt`` before checking that a
+            backup started
+        bulk_threshold: Number of due schedules from which one bulk
+            listing is used instead of per-schedule requests
+    
+    Example:
+        >>> watcher = ScheduleWatcher(client, active_interval=5)
+        >>> watcher.add_listener(lambda event: print(event['schedule_id'], event['changes']))
+        >>> for event in watcher.events():
+        ...     if event['changes'].get('lastBackupStatus', (None, None))[1] == "error":
+        ...         alert(event['schedule'])
+    """
+    
+    def __init__(
+        self,
+        client,
+        schedules: Optional[Iterable[Union[int, str]]] = None,
+        active_interval: float = 5.0,
+        idle_interval: float = 300.0,
+        grace: float = 5.0,
+        bulk_threshold: int = 3
+    ):
+        """Initialize ScheduleWatcher with client instance."""
+        self.client = client
+        self.watch_all = schedules is None
+        self.active_interval = active_interval
+        self.idle_interval = idle_interval
+        self.grace = grace
+        self.bulk_threshold = bulk_threshold
+        self.schedules: Dict[Any, Dict[str, Any]] = {}
+        self.requests = 0
+        self._pending = [] if schedules is None else list(schedules)
+        # Watched reference (name or ID) -> schedule ID, once resolved
+        self._ids: Dict[Any, Any] = {}
+        self._due: Dict[Any, float] = {}
+        self._heap: List[Tuple[float, str, Any]] = []
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._started = False
+        self._retry_at = 0.0
+        self._stop = threading.Event()
+    
+    def add_listener(self, callback: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Register a callable receiving every event.
+        
+        Args:
+            callback: Called with each event dict, in the polling thread
+        """
+        self._listeners.append(callback)
+    
+    def next_poll_at(self, schedule: Dict[str, Any], now: float) -> float:
+        """
+        Compute when a schedule should be polled next.
+        
+        Args:
+            schedule: Current schedule
+            now: Current time in epoch seconds
+        
+        Returns:
+            float: Epoch seconds of the next poll
+        """
+        if schedule.get("lastBackupStatus") == "in_progress":
+            return now + self.active_interval
+        next_backup = parse_time(schedule.get("nextBackupAt"))
+        if schedule.get("enabled") is False or next_backup is None:
+            return now + self.idle_interval
+        start_check = next_backup + self.grace
+        if start_check > now:
+            return min(start_check, now + self.idle_interval)
+        if now - start_check < self.idle_interval:
+            # The backup is due but has not been seen running yet
+            return now + self.active_interval
+        return now + self.idle_interval
+    
+    def _schedule(self, schedule_id: Any, when: float) -> None:
+        self._due[schedule_id] = when
+        # The ID's repr keeps heap entries comparable when IDs of different types tie
+        heapq.heappush(self._heap, (when, repr(schedule_id), schedule_id))
+    
+    def _emit(self, events: List[Dict[str, Any]], event: Dict[str, Any]) -> None:
+        events.append(event)
+        for listener in self._listeners:
+            listener(event)
+    
+    def _update(self, schedule: Dict[str, Any], now: float, events: List[Dict[str, Any]]) -> None:
+        schedule_id = schedule.get("id")
+        previous = self.schedules.get(schedule_id)
+        self.schedules[schedule_id] = schedule
+        self._schedule(schedule_id, self.next_poll_at(schedule, now))
+        if previous is None:
+            if self._started:
+                self._emit(events, self._event("added", schedule_id, schedule, None))
+            return
+        changes = {
+            field: (previous.get(field), schedule.get(field))
+            for field in WATCHED_FIELDS
+            if previous.get(field) != schedule.get(field)
+        }
+        if changes:
+            self._emit(events, self._event("changed", schedule_id, schedule, previous, changes))
+    
+    def _remove(self, schedule_id: Any, events: List[Dict[str, Any]]) -> None:
+        previous = self.schedules.pop(schedule_id, None)
+        self._due.pop(schedule_id, None)
+        for reference in [reference for reference, known in self._ids.items() if known == schedule_id]:
+            del self._ids[reference]
+        if previous is not None:
+            self._emit(events, self._event("removed", schedule_id, None, previous))
+    
+    def _unresolved(self, reference: Any, error: Exception, now: float, events: List[Dict[str, Any]]) -> None:
+        """Report a watched reference that matches no schedule and look it up again later."""
+        self._schedule(reference, now + self.idle_interval)
+        self._emit(events, self._event("error", reference, None, None, error=error))
+    
+    def _match(self, listing: List[Dict[str, Any]], reference: Any) -> Dict[str, Any]:
+        """Find the schedule a watched ID or name refers to in a listing."""
+        matches = [schedule for schedule in listing if str(schedule.get("id")) == str(reference)]
+        if not matches:
+            matches = [schedule for schedule in listing if schedule.get("name") == reference]
+        if len(matches) > 1:
+            raise ValidationError(f"Schedule name {reference!r} is ambiguous; watch its ID instead")
+        if not matches:
+            raise NotFoundError(f"Schedule {reference!r} not found", status_code=404)
+        return matches[0]
+    
+    @staticmethod
+    def _event(
+        kind: str,
+        schedule_id: Any,
+        schedule: Optional[Dict[str, Any]],
+        previous: Optional[Dict[str, Any]],
+        changes: Optional[Dict[str, Tuple[Any, Any]]] = None,
+        error: Optional[BaseException] = None
+    ) -> Dict[str, Any]:
+        return {
+            "type": kind,
+            "schedule_id": schedule_id,
+            "schedule": schedule,
+            "previous": previous,
+            "changes": changes or {},
+            "error": error,
+        }
+    
+    def _due_ids(self, now: float) -> List[Any]:
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            when, _, schedule_id = heapq.heappop(self._heap)
+            if self._due.get(schedule_id) == when:
+                del self._due[schedule_id]
+                due.append(schedule_id)
+        return due
+    
+    def poll(self) -> List[Dict[str, Any]]:
+        """
+        Fetch the schedules that are due and report their changes.
+        
+        The first call fetches every watched schedule and only records
+        their state.
+        
+        Returns:
+            list: Events, also delivered to the listeners
+        """
+        now = time.time()
+        events: List[Dict[str, Any]] = []
+        due = self._due_ids(now) if self._started else list(self._pending)
+        if self._started and not due:
+            return events
+        
+        if self.watch_all or len(due) >= self.bulk_threshold:
+            try:
+                self.requests += 1
+                listing = self.client.backup_schedules.list_all() or []
+            except Exception as e:
+                if self._started:
+                    for schedule_id in due:
+                        self._schedule(schedule_id, now + self.active_interval)
+                else:
+                    self._retry_at = now + self.active_interval
+                self._emit(events, self._event("error", None, None, None, error=e))
+                return events
+            if self.watch_all:
+                selected = listing
+            else:
+                selected = [schedule for schedule in listing if schedule.get("id") in self.schedules]
+                selected_ids = {schedule.get("id") for schedule in selected}
+                for reference in due:
+                    if reference in self.schedules:
+                        continue
+                    try:
+                        schedule = self._match(listing, reference)
+                    except (NotFoundError, ValidationError) as e:
+                        self._unresolved(reference, e, now, events)
+                        continue
+                    self._ids[reference] = schedule.get("id")
+                    if schedule.get("id") not in selected_ids:
+                        selected_ids.add(schedule.get("id"))
+                        selected.append(schedule)
+            seen = {schedule.get("id") for schedule in selected}
+            for schedule in selected:
+                self._update(schedule, now, events)
+            for schedule_id in list(self.schedules):
+                if schedule_id not in seen:
+                    self._remove(schedule_id, events)
+        else:
+            for reference in due:
+                try:
+                    self.requests += 1
+                    schedule = self.client.backup_schedules.get_schedule(reference)
+                except NotFoundError as e:
+                    if reference in self.schedules:
+                        self._remove(reference, events)
+                    else:
+                        self._unresolved(reference, e, now, events)
+                    continue
+                except Exception as e:
+                    self._schedule(reference, now + self.active_interval)
+                    self._emit(events, self._event("error", reference, None, None, error=e))
+                    continue
+                if schedule:
+                    self._ids[reference] = schedule.get("id")
+                    self._update(schedule, now, events)
+        self._started = True
+        self._pending = []
+        return events
+    
+    def seconds_until_next_poll(self) -> float:
+        """
+        Return how long to wait before the next poll is due.
+        
+        Returns:
+            float: Seconds (0 if a poll is due now)
+        """
+        if not self._started:
+            return max(0.0, self._retry_at - time.time())
+        while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return self.idle_interval
+        return max(0.0, self._heap[0][0] - time.time())
+    
+    def events(self) -> Iterator[Dict[str, Any]]:
+        """
+        Poll until :meth:`stop` is called, yielding events as they occur.
+        
+        Yields:
+            dict: Events (see the class documentation)
+        """
+        self._stop.clear()
+        while not self._stop.is_set():
+            yield from self.poll()
+            self._stop.wait(self.seconds_until_next_poll())
+    
+    def run(self) -> None:
+        """Poll until :meth:`stop` is called, delivering events to the listeners only."""
+        for _ in self.events():
+            pass
+    
+    def stop(self) -> None:
+        """Stop :meth:`events` or :meth:`run` (from another thread or a listener)."""
+        self._stop.set()
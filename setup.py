@@ -36,5 +36,18 @@ setup(
             "black>=21.0",
             "flake8>=3.9",
         ],
+        "analytics": [
+            "numpy>=1.17",
+            "pandas>=1.0",
+        ],
+        "fsspec": [
+            "fsspec>=2021.4.0",
+        ],
+    },
+    entry_points={
+        "fsspec.specs": [
+            "zerobyte = py_zerobyte.fs:ZerobyteFileSystem",
+            "zerobyte-volume = py_zerobyte.fs:ZerobyteVolumeFileSystem",
+        ],
     },
 )
@@ -0,0 +1,65 @@
+"""
+Unit tests for the streaming aggregators.
+"""
+
+import pytest
+from py_zerobyte.aggregators import (
+    DiskUsage,
+    ExtensionHistogram,
+    FileCounter,
+    SizeHistogram,
+    TopK,
+    aggregate,
+)
+
+
+# Walker order: depth first, children in name order
+ENTRIES = [
+    {"name": "a", "path": "/a", "type": "dir"},
+    {"name": "b", "path": "/a/b", "type": "dir"},
+    {"name": "big.iso", "path": "/a/b/big.iso", "type": "file", "size": 1000},
+    {"name": "c.txt", "path": "/a/c.txt", "type": "file", "size": 10},
+    {"name": "d", "path": "/d", "type": "dir"},
+    {"name": "e.txt", "path": "/d/e.txt", "type": "file", "size": 1},
+    {"name": "empty", "path": "/d/empty", "type": "file", "size": 0},
+    {"name": "link", "path": "/d/link", "type": "symlink"},
+]
+
+
+class TestAggregators:
+    """Tests for the aggregators sharing one pass."""
+    
+    def test_single_pass(self):
+        """Test all aggregators over one walk."""
+        counts, du, top, sizes, extensions = aggregate(
+            iter(ENTRIES),
+            FileCounter(),
+            DiskUsage(),
+            TopK(2),
+            SizeHistogram(),
+            ExtensionHistogram(),
+        )
+        
+        assert counts == {"files": 4, "directories": 3, "other": 1, "bytes": 1011}
+        assert du == {
+            "/": {"size": 1011, "files": 4},
+            "/a": {"size": 1010, "files": 2},
+            "/a/b": {"size": 1000, "files": 1},
+            "/d": {"size": 1, "files": 2},
+        }
+        assert top == [{"path": "/a/b/big.iso", "size": 1000}, {"path": "/a/c.txt", "size": 10}]
+        assert [(b["min_size"], b["files"]) for b in sizes] == [(0, 1), (1, 1), (8, 1), (512, 1)]
+        assert extensions[0] == {"extension": ".iso", "files": 1, "bytes": 1000}
+        assert {e["extension"] for e in extensions} == {".iso", ".txt", ""}
+    
+    def test_disk_usage_depth_and_callback(self):
+        """Test that depth-limited rollups are streamed to the callback."""
+        finalized = []
+        du = DiskUsage(max_depth=1, callback=lambda directory, usage: finalized.append((directory, usage["size"])))
+        
+        assert aggregate(ENTRIES, du) == ({},)
+        assert finalized == [("/a", 1010), ("/d", 1), ("/", 1011)]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
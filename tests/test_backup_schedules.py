@@ -0,0 +1,140 @@
+"""
+Unit tests for the Backup Schedules API helpers.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from py_zerobyte import NotFoundError
+from py_zerobyte.backup_schedules import BackupSchedulesAPI
+
+
+VOLUME = {
+    "/": [("data", None), ("cache", None), ("top.bin", 1000)],
+    "/data": [("a.txt", 10), ("b.tmp", 5), ("photos", None), ("skip", None), ("broken", None)],
+    "/data/photos": [("1.jpg", 100), ("2.jpg", 200)],
+    "/data/skip": [(".nobackup", 0), ("huge.bin", 10 ** 9)],
+    "/cache": [("x", 1)],
+}
+
+
+def make_api():
+    def list_files(volume, path=None):
+        if path == "/data/broken":
+            raise NotFoundError("gone", status_code=404)
+        base = path.rstrip("/")
+        return {"files": [
+            {"name": name, "path": f"{base}/{name}", "type": "file" if size is not None else "directory",
+             "size": size}
+            for name, size in VOLUME[path]
+        ]}
+    
+    client = Mock()
+    client.volumes.list_files.side_effect = list_files
+    return BackupSchedulesAPI(client), client
+
+
+class TestPreview:
+    """Tests for BackupSchedulesAPI.preview."""
+    
+    def test_applies_patterns_and_markers(self):
+        """Test that totals follow the schedule's patterns and excludeIfPresent markers."""
+        api, client = make_api()
+        events = []
+        schedule = {
+            "volume": {"name": "vol"},
+            "includePatterns": None,
+            "excludePatterns": ["*.tmp", "/cache"],
+            "excludeIfPresent": [".nobackup"],
+        }
+        
+        result = api.preview(schedule, max_workers=4, max_depth=1, progress=events.append)
+        
+        assert result["files"] == 4
+        assert result["bytes"] == 1310
+        assert result["excluded_files"] == 1
+        assert result["excluded_directories"] == 2
+        assert result["largest_directories"][:2] == [("/", 1310), ("/data", 310)]
+        assert [error["path"] for error in result["errors"]] == ["/data/broken"]
+        assert events[-1]["pending"] == 0
+        listed = {call.kwargs["path"] for call in client.volumes.list_files.call_args_list}
+        assert "/cache" not in listed
+        assert all(call.args[0] == "vol" for call in client.volumes.list_files.call_args_list)
+    
+    def test_marker_directory_counted_once(self):
+        """Test that a directory holding a marker is only counted as excluded."""
+        api, _ = make_api()
+        
+        result = api.preview({"volumeId": 1, "excludeIfPresent": [".nobackup"]})
+        
+        # /data, /data/photos and /cache; /data/broken could not be listed
+        assert result["directories"] == 3
+        # /data/skip
+        assert result["excluded_directories"] == 1
+    
+    def test_include_patterns_prune_walk(self):
+        """Test that directories outside the include patterns are not listed."""
+        api, client = make_api()
+        
+        result = api.preview({"volumeId": 1, "includePatterns": ["/data/photos"]})
+        
+        assert (result["files"], result["bytes"]) == (2, 300)
+        listed = sorted(call.kwargs["path"] for call in client.volumes.list_files.call_args_list)
+        assert listed == ["/", "/data", "/data/photos"]
+
+
+class TestFlatRoutes:
+    """Tests for the /api/v1/backups methods."""
+    
+    SCHEDULES = [
+        {"id": 1, "name": "nightly", "volumeId": 1, "volume": {"id": 1, "name": "data"},
+         "repositoryId": "r1", "repository": {"id": "r1", "name": "offsite"}},
+        {"id": 2, "name": "hourly", "volumeId": 2, "volume": {"id": 2, "name": "media"},
+         "repositoryId": "r1", "repository": {"id": "r1", "name": "offsite"}},
+    ]
+    
+    def test_list_all_is_one_request(self):
+        """Test that listing and filtering every schedule takes a single call."""
+        client = Mock()
+        client._make_request.return_value = self.SCHEDULES
+        api = BackupSchedulesAPI(client)
+        
+        assert len(api.list_all()) == 2
+        assert [s["name"] for s in api.list_all(volume_id="media")] == ["hourly"]
+        assert [s["name"] for s in api.list_all(volume_id=1, repository_id="offsite")] == ["nightly"]
+        assert {call.args for call in client._make_request.call_args_list} == {("GET", "/api/v1/backups")}
+    
+    def test_schedule_routes(self):
+        """Test the flat per-schedule routes."""
+        client = Mock()
+        api = BackupSchedulesAPI(client)
+        
+        api.get_schedule(1)
+        api.update_schedule(1, {"enabled": False})
+        api.run_schedule(1)
+        api.get_schedule_for_volume(2)
+        api.get_schedule_notifications(1)
+        api.update_schedule_notifications(1, {"assignments": []})
+        api.get_schedule_mirrors(1)
+        api.update_schedule_mirrors(1, {"mirrors": []})
+        api.get_schedule_mirror_compatibility(1)
+        api.reorder_schedules([2, 1])
+        
+        assert [call.args for call in client._make_request.call_args_list] == [
+            ("GET", "/api/v1/backups/1"),
+            ("PATCH", "/api/v1/backups/1"),
+            ("POST", "/api/v1/backups/1/run"),
+            ("GET", "/api/v1/backups/volume/2"),
+            ("GET", "/api/v1/backups/1/notifications"),
+            ("PUT", "/api/v1/backups/1/notifications"),
+            ("GET", "/api/v1/backups/1/mirrors"),
+            ("PUT", "/api/v1/backups/1/mirrors"),
+            ("GET", "/api/v1/backups/1/mirrors/compatibility"),
+            ("POST", "/api/v1/backups/reorder"),
+        ]
+        assert client._make_request.call_args.kwargs["data"] == {"scheduleIds": [2, 1]}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
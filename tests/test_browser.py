@@ -0,0 +1,124 @@
+"""
+Unit tests for the cached filesystem browser.
+"""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from py_zerobyte.browser import FilesystemBrowser
+from py_zerobyte.exceptions import NotFoundError
+
+
+TREE = {
+    "/": ["mnt", "srv"],
+    "/mnt": ["backup", "bar", "data"],
+    "/mnt/backup": [],
+    "/mnt/bar": [],
+    "/mnt/data": ["projects"],
+    "/mnt/data/projects": [],
+    "/srv": [],
+}
+
+
+def make_client(gate=None):
+    def browse(path=None):
+        if gate is not None:
+            gate.wait(5)
+        if path not in TREE:
+            raise NotFoundError("not found", status_code=404)
+        children = [
+            {"name": name, "path": (path.rstrip("/") + "/" + name), "type": "directory"}
+            for name in TREE[path]
+        ]
+        return {"path": path, "directories": children}
+    
+    client = Mock()
+    client.volumes.browse_filesystem.side_effect = browse
+    return client
+
+
+def called_paths(client):
+    return sorted(call.kwargs["path"] for call in client.volumes.browse_filesystem.call_args_list)
+
+
+class TestFilesystemBrowser:
+    """Tests for FilesystemBrowser."""
+    
+    def test_listings_are_cached_until_ttl(self):
+        """Test that a listing is fetched once and refreshed after the TTL."""
+        client = make_client()
+        browser = FilesystemBrowser(client, ttl=10, prefetch=0)
+        with patch("py_zerobyte.browser.time.monotonic", return_value=100.0):
+            assert [e["name"] for e in browser.list("/mnt")] == ["backup", "bar", "data"]
+            browser.list("/mnt/")
+        assert client.volumes.browse_filesystem.call_count == 1
+        with patch("py_zerobyte.browser.time.monotonic", return_value=111.0):
+            browser.list("/mnt")
+        assert client.volumes.browse_filesystem.call_count == 2
+        assert browser.hits == 1
+    
+    def test_results_are_copies(self):
+        """Test that mutating a listing leaves the cache intact."""
+        browser = FilesystemBrowser(make_client(), prefetch=0)
+        
+        first = browser.list("/mnt")
+        first.sort(key=lambda entry: entry["name"], reverse=True)
+        first.append({"name": "bogus", "path": "/mnt/bogus", "type": "directory"})
+        first[0]["name"] = "renamed"
+        
+        assert [e["name"] for e in browser.list("/mnt")] == ["backup", "bar", "data"]
+        assert [e["name"] for e in browser.complete("/mnt/b")] == ["backup", "bar"]
+    
+    def test_complete(self):
+        """Test completion of partial paths from the parent listing."""
+        browser = FilesystemBrowser(make_client(), prefetch=0)
+        assert [e["path"] for e in browser.complete("/mnt/ba")] == ["/mnt/backup", "/mnt/bar"]
+        assert [e["path"] for e in browser.complete("/mnt/")] == ["/mnt/backup", "/mnt/bar", "/mnt/data"]
+        assert [e["path"] for e in browser.complete("/")] == ["/mnt", "/srv"]
+        assert browser.complete("/missing/x") == []
+        assert len(browser.complete("/mnt/", limit=1)) == 1
+    
+    def test_concurrent_requests_share_one_fetch(self):
+        """Test that concurrent callers of an uncached directory trigger a single call."""
+        gate = threading.Event()
+        client = make_client(gate)
+        browser = FilesystemBrowser(client, prefetch=0)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(browser.list("/mnt"))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        gate.set()
+        for thread in threads:
+            thread.join(5)
+        assert len(results) == 5
+        assert client.volumes.browse_filesystem.call_count == 1
+    
+    def test_prefetches_narrowed_matches(self):
+        """Test that the directories of a narrow completion are fetched in the background."""
+        client = make_client()
+        with FilesystemBrowser(client, prefetch=2) as browser:
+            browser.complete("/mnt/d")
+            browser.close(wait=True)
+            assert called_paths(client) == ["/mnt", "/mnt/data"]
+            assert [e["path"] for e in browser.complete("/mnt/data/")] == ["/mnt/data/projects"]
+            browser.close(wait=True)
+        assert called_paths(client) == ["/mnt", "/mnt/data", "/mnt/data/projects"]
+    
+    def test_invalidate(self):
+        """Test that invalidating a directory drops its subtree."""
+        client = make_client()
+        browser = FilesystemBrowser(client, prefetch=0)
+        browser.list("/mnt")
+        browser.list("/mnt/data")
+        browser.invalidate("/mnt/data")
+        browser.list("/mnt")
+        browser.list("/mnt/data")
+        assert called_paths(client) == ["/mnt", "/mnt/data", "/mnt/data"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,58 @@
+"""
+Unit tests for capacity analytics.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+pytest.importorskip("numpy")
+
+from py_zerobyte import SnapshotSeries, capacity_report
+
+
+DAY = 86400
+
+
+def history(days, start_size, growth, start=1700000000):
+    # Newest first, like the API, with times in milliseconds
+    return [
+        {"short_id": f"s{day}", "time": (start + day * DAY) * 1000, "size": start_size + growth * day,
+         "duration": 60 + day, "paths": [], "tags": []}
+        for day in reversed(range(days))
+    ]
+
+
+class TestSnapshotSeries:
+    """Tests for SnapshotSeries."""
+    
+    def test_growth_and_forecast(self):
+        """Test the linear trend and the threshold crossing time."""
+        series = SnapshotSeries.from_snapshots(history(30, 1000, 100))
+        
+        assert series.growth_rate() == pytest.approx(100)
+        assert series.duration_trend() == pytest.approx(1)
+        # Size 1000 + 100 * day reaches 10000 on day 90
+        assert series.forecast(10000) == pytest.approx(1700000000 + 90 * DAY)
+        assert series.forecast(500) == pytest.approx(1700000000 + 29 * DAY)
+        assert SnapshotSeries.from_snapshots(history(30, 1000, 0)).forecast(10000) is None
+    
+    def test_moving_average(self):
+        """Test the trailing moving average."""
+        series = SnapshotSeries.from_snapshots(history(4, 0, 10))
+        assert series.moving_average("size", window=2).tolist() == [0, 5, 15, 25]
+    
+    def test_capacity_report(self):
+        """Test the per-repository report ordering."""
+        client = Mock()
+        client.repositories.list.return_value = [{"name": "slow"}, {"name": "fast"}]
+        client.snapshots.list.side_effect = lambda name: history(10, 0, 5 if name == "slow" else 50)
+        
+        report = capacity_report(client, threshold=1000, days=7)
+        
+        assert [row["repository"] for row in report] == ["fast", "slow"]
+        assert report[0]["threshold_time"] == pytest.approx(1700000000 + 20 * DAY)
+        assert report[1]["snapshots"] == 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,90 @@
+"""
+Unit tests for FileTable.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from py_zerobyte import FileTable, write_listing, ListingFile
+
+
+ENTRIES = [
+    {"name": "a", "path": "/data/a", "type": "dir", "mtime": "2024-01-01T00:00:00Z", "mode": 0o755},
+    {"name": "big.iso", "path": "/data/a/big.iso", "type": "file", "size": 3 * 2 ** 30,
+     "mtime": "2024-01-10T00:00:00Z", "atime": "2024-01-11T00:00:00Z", "uid": 1000},
+    {"name": "old.iso", "path": "/data/a/old.iso", "type": "file", "size": 2 * 2 ** 30,
+     "mtime": "2023-01-10T00:00:00Z"},
+    {"name": "small.txt", "path": "/data/small.txt", "type": "file", "size": 10,
+     "mtime": "2024-01-09T00:00:00Z"},
+]
+
+
+class TestFileTable:
+    """Tests for FileTable."""
+    
+    def test_vectorized_filter_and_sort(self):
+        """Test combining column predicates and sorting."""
+        table = FileTable.from_entries(ENTRIES)
+        cutoff = 1704067200.0  # 2024-01-01
+        
+        big_recent = table.filter((table.size > 2 ** 30) & (table.mtime > cutoff))
+        assert big_recent.paths() == ["/data/a/big.iso"]
+        assert big_recent.atime[0] == pytest.approx(1704931200.0)
+        
+        by_size = table[table.is_file].sort("size", descending=True)
+        assert by_size.paths() == ["/data/a/big.iso", "/data/a/old.iso", "/data/small.txt"]
+    
+    def test_sort_keeps_ties_in_order(self):
+        """Test that sorting is stable in both directions."""
+        entries = [
+            {"name": name, "path": f"/d/{name}", "type": "file", "size": size}
+            for name, size in [("a", 1), ("b", 2), ("c", 1), ("d", 2)]
+        ]
+        table = FileTable.from_entries(entries)
+        
+        assert table.sort("size").paths() == ["/d/a", "/d/c", "/d/b", "/d/d"]
+        assert table.sort("size", descending=True).paths() == ["/d/b", "/d/d", "/d/a", "/d/c"]
+        assert table.sort("path", descending=True).paths() == ["/d/d", "/d/c", "/d/b", "/d/a"]
+    
+    def test_sort_puts_missing_values_last(self):
+        """Test that entries without a time sort last in both directions."""
+        table = FileTable.from_entries([
+            {"name": "a", "path": "/a", "type": "file", "mtime": "2024-01-01T00:00:00Z"},
+            {"name": "b", "path": "/b", "type": "file"},
+            {"name": "c", "path": "/c", "type": "file", "mtime": "2025-01-01T00:00:00Z"},
+        ])
+        
+        assert table.sort("mtime").paths() == ["/a", "/c", "/b"]
+        assert table.sort("mtime", descending=True).paths() == ["/c", "/a", "/b"]
+    
+    def test_group_by_directory(self):
+        """Test per-directory counts and sizes."""
+        groups = FileTable.from_entries(ENTRIES).group_by_directory()
+        totals = dict(zip(groups["directory"], groups["size"].tolist()))
+        
+        assert totals == {"/data": 10, "/data/a": 5 * 2 ** 30}
+        assert dict(zip(groups["directory"], groups["count"].tolist())) == {"/data": 2, "/data/a": 2}
+    
+    def test_from_listing_file_and_records(self, tmp_path):
+        """Test loading from a listing file round-trips through records."""
+        path = str(tmp_path / "listing.zbl")
+        write_listing(path, ENTRIES)
+        with ListingFile(path) as listing:
+            table = FileTable.from_listing_file(listing)
+        
+        records = table.to_records()
+        assert [r["path"] for r in records] == [e["path"] for e in ENTRIES]
+        assert records[1]["size"] == 3 * 2 ** 30
+        assert records[0]["type"] == "dir"
+    
+    def test_to_pandas(self):
+        """Test conversion to a DataFrame."""
+        pytest.importorskip("pandas")
+        frame = FileTable.from_listing({"files": ENTRIES}).to_pandas()
+        assert list(frame["path"]) == [e["path"] for e in ENTRIES]
+        assert frame["type"].tolist() == ["dir", "file", "file", "file"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
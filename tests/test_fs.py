@@ -0,0 +1,94 @@
+"""
+Unit tests for the fsspec filesystems.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("fsspec")
+
+from py_zerobyte import NotFoundError
+from py_zerobyte.fs import ZerobyteFileSystem, ZerobyteVolumeFileSystem
+
+
+TREE = {
+    "/": [("data", "dir", None)],
+    "/data": [("a.pdf", "file", 10), ("sub", "dir", None)],
+    "/data/sub": [("b.pdf", "file", 20), ("c.txt", "file", 5)],
+}
+
+
+def listing(path):
+    if path not in TREE:
+        raise NotFoundError("not found", status_code=404)
+    base = path.rstrip("/")
+    return {"files": [{"name": path.rsplit("/", 1)[-1], "path": path, "type": "dir"}] + [
+        {"name": name, "path": f"{base}/{name}", "type": kind, "size": size, "mode": 420}
+        for name, kind, size in TREE[path]
+    ]}
+
+
+def make_client():
+    client = Mock()
+    client.repositories.list.return_value = [{"name": "repo"}]
+    client.snapshots.list.return_value = [{"short_id": "s1", "time": 1}]
+    client.snapshots.list_files.side_effect = lambda repo, snap, path=None: listing(path)
+    client.volumes.list.return_value = [{"name": "vol"}]
+    client.volumes.list_files.side_effect = lambda volume, path=None: listing(path)
+    return client
+
+
+class TestZerobyteFileSystem:
+    """Tests for ZerobyteFileSystem."""
+    
+    def test_ls_info_and_cache(self):
+        """Test listing repositories, snapshots and files, served from the cache."""
+        client = make_client()
+        fs = ZerobyteFileSystem(client, skip_instance_cache=True)
+        
+        assert fs.ls("", detail=False) == ["repo"]
+        assert fs.ls("zerobyte://repo", detail=False) == ["repo/s1"]
+        assert fs.ls("repo/s1/data", detail=False) == ["repo/s1/data/a.pdf", "repo/s1/data/sub"]
+        assert fs.info("repo/s1/data/a.pdf")["size"] == 10
+        assert fs.info("repo/s1/data/a.pdf")["mode"] == 420
+        assert fs.isdir("repo/s1/data/sub")
+        assert client.snapshots.list_files.call_count == 1
+        fs.ls("repo/s1/data", refresh=True)
+        assert client.snapshots.list_files.call_count == 2
+        
+        with pytest.raises(FileNotFoundError):
+            fs.ls("repo/s1/missing")
+        with pytest.raises(NotImplementedError):
+            fs.open("repo/s1/data/a.pdf")
+    
+    def test_find_glob_du(self):
+        """Test recursive queries, which list each directory once."""
+        client = make_client()
+        fs = ZerobyteFileSystem(client, skip_instance_cache=True, max_workers=4)
+        
+        assert fs.find("repo/s1/data") == [
+            "repo/s1/data/a.pdf", "repo/s1/data/sub/b.pdf", "repo/s1/data/sub/c.txt",
+        ]
+        assert fs.glob("repo/s1/**/*.pdf") == ["repo/s1/data/a.pdf", "repo/s1/data/sub/b.pdf"]
+        assert fs.du("repo/s1/data") == 35
+        assert fs.find("repo/s1/data", maxdepth=1) == ["repo/s1/data/a.pdf"]
+        listed = [call.kwargs["path"] for call in client.snapshots.list_files.call_args_list]
+        assert sorted(listed) == ["/", "/data", "/data/sub"]
+
+
+class TestZerobyteVolumeFileSystem:
+    """Tests for ZerobyteVolumeFileSystem."""
+    
+    def test_lists_volumes_and_files(self):
+        """Test listing volumes and their files."""
+        fs = ZerobyteVolumeFileSystem(make_client(), skip_instance_cache=True)
+        
+        assert fs.ls("", detail=False) == ["vol"]
+        assert fs.find("zerobyte-volume://vol") == [
+            "vol/data/a.pdf", "vol/data/sub/b.pdf", "vol/data/sub/c.txt",
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+"""
+Unit tests for the on-disk listing format.
+"""
+
+import pytest
+from py_zerobyte import ListingFile, ListingFileWriter, write_listing
+
+
+PATHS = [
+    "/data",
+    "/data/a.txt",
+    "/data/logs",
+    "/data/logs/app.log",
+    "/data/logs/old",
+    "/data/logs/old/app.1.log",
+    "/data-archive",
+    "/data-archive/x.tar",
+    "/etc",
+    "/etc/hosts",
+]
+
+
+def make_entries():
+    return [
+        {
+            "path": path,
+            "type": "file" if "." in path.rsplit("/", 1)[-1] else "dir",
+            "size": index * 100,
+            "mtime": "2024-05-01T12:00:00.250000000+02:00",
+            "mode": 0o644,
+            "uid": 1000,
+            "gid": 100,
+        }
+        for index, path in enumerate(PATHS)
+    ]
+
+
+@pytest.fixture
+def listing(tmp_path):
+    path = str(tmp_path / "listing.zbl")
+    assert write_listing(path, make_entries(), block_size=3) == len(PATHS)
+    with ListingFile(path) as listing:
+        yield listing
+
+
+class TestListingFile:
+    """Tests for ListingFile and ListingFileWriter."""
+    
+    def test_get(self, listing):
+        """Test binary-search lookups of present and missing paths."""
+        entry = listing.get("/data/logs/old/app.1.log")
+        assert entry["size"] == 500
+        assert entry["type"] == "file"
+        assert entry["uid"] == 1000
+        assert entry["mtime"] == pytest.approx(1714557600.25)
+        assert listing.get("/etc")["type"] == "dir"
+        assert listing.get("/data/logs/missing") is None
+        assert listing.get("/zzz") is None
+        assert len(listing) == len(PATHS)
+    
+    def test_scan_prefix(self, listing):
+        """Test that a scan covers a directory subtree and nothing else."""
+        assert [e["path"] for e in listing.scan("/data/logs")] == PATHS[2:6]
+        assert [e["path"] for e in listing.scan("/data", recursive=False)] == [
+            "/data", "/data/a.txt", "/data/logs"
+        ]
+        assert [e["path"] for e in listing] == PATHS
+    
+    def test_column_view(self, listing):
+        """Test zero-copy access to fixed-width columns."""
+        sizes = listing.column("size")
+        assert list(sizes) == [index * 100 for index in range(len(PATHS))]
+        sizes.release()
+    
+    def test_rejects_unsorted_entries(self, tmp_path):
+        """Test that entries out of walker order are rejected and nothing is left behind."""
+        path = tmp_path / "bad.zbl"
+        with pytest.raises(ValueError):
+            with ListingFileWriter(str(path)) as writer:
+                writer.add({"path": "/b", "type": "file"})
+                writer.add({"path": "/a", "type": "file"})
+        assert list(tmp_path.iterdir()) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
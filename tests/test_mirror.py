@@ -0,0 +1,106 @@
+"""
+Unit tests for the mirror verifier.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from py_zerobyte.mirror import MirrorVerifier, build_tree, compare_trees
+from py_zerobyte.resolver import Resolver
+from py_zerobyte.snapshots import SnapshotsAPI
+
+
+def entry(path, kind="file", size=1, mtime="2024-01-01T00:00:00Z"):
+    return {"name": path.rsplit("/", 1)[-1], "path": path, "type": kind, "size": size, "mtime": mtime, "mode": 420}
+
+
+PRIMARY = [
+    entry("/data", "dir"),
+    entry("/data/a", "dir"),
+    entry("/data/a/1"),
+    entry("/data/a/2"),
+    entry("/data/b", "dir"),
+    entry("/data/b/1"),
+    entry("/etc", "dir"),
+    entry("/etc/hosts"),
+]
+
+
+class TestMerkleTrees:
+    """Tests for build_tree and compare_trees."""
+    
+    def test_identical_trees(self):
+        """Test that identical listings produce identical trees."""
+        assert compare_trees(build_tree(PRIMARY), build_tree(list(PRIMARY))) == []
+        assert set(build_tree(PRIMARY)) == {"/", "/data", "/data/a", "/data/b", "/etc"}
+    
+    def test_reports_differences(self):
+        """Test that changed, missing and extra entries are found."""
+        mirror = [e for e in PRIMARY if e["path"] != "/data/a/2"]
+        mirror[mirror.index(entry("/data/b/1"))] = entry("/data/b/1", size=2)
+        mirror.append(entry("/etc/passwd"))
+        
+        assert compare_trees(build_tree(PRIMARY), build_tree(mirror)) == [
+            {"path": "data/a/2", "reason": "missing"},
+            {"path": "data/b/1", "reason": "changed"},
+            {"path": "etc/passwd", "reason": "extra"},
+        ]
+
+
+class TestMirrorVerifier:
+    """Tests for MirrorVerifier."""
+    
+    def make_client(self, mirror_entries):
+        listings = {"primary": PRIMARY, "mirror": mirror_entries}
+        snapshots = {
+            "primary": [{"short_id": "p1", "time": 100, "paths": ["/data"]},
+                        {"short_id": "p2", "time": 200, "paths": ["/data"]}],
+            "mirror": [{"short_id": "m1", "time": 100, "paths": ["/data"]}],
+        }
+        
+        def make_request(method, endpoint, params=None, **kwargs):
+            repository = endpoint.split("/")[4]
+            if endpoint.endswith("/snapshots"):
+                return snapshots[repository]
+            path = params["path"]
+            return {"files": [e for e in listings[repository] if e["path"].rsplit("/", 1)[0] == path.rstrip("/")]}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        client.resolver = Resolver(client)
+        client.snapshots = SnapshotsAPI(client)
+        return client
+    
+    def test_verify_and_cache(self, tmp_path):
+        """Test that snapshots are paired, compared and trees persisted."""
+        client = self.make_client(PRIMARY[:-1])
+        verifier = MirrorVerifier(client, cache_dir=str(tmp_path))
+        
+        report = verifier.verify("primary", "mirror")
+        assert not report["ok"]
+        assert report["matched"] == 1
+        assert [s["short_id"] for s in report["missing"]] == ["p2"]
+        assert report["differences"][0]["changes"] == [{"path": "etc/hosts", "reason": "missing"}]
+        
+        requests = client._make_request.call_count
+        fresh = MirrorVerifier(client, cache_dir=str(tmp_path))
+        assert fresh.compare_snapshots("primary", "p1", "mirror", "m1") == [{"path": "etc/hosts", "reason": "missing"}]
+        assert client._make_request.call_count == requests
+    
+    def test_verify_schedule(self):
+        """Test that enabled mirrors of a schedule are verified."""
+        client = self.make_client(PRIMARY)
+        client.backup_schedules.get_mirrors.return_value = [
+            {"enabled": True, "repository": {"name": "mirror"}},
+            {"enabled": False, "repository": {"name": "disabled"}},
+        ]
+        
+        results = MirrorVerifier(client).verify_schedule(1, 1, 1, "primary", limit=1)
+        assert list(results) == ["mirror"]
+        assert results["mirror"]["missing"][0]["short_id"] == "p2"
+        assert results["mirror"]["matched"] == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,68 @@
+"""
+Unit tests for the snapshot path index.
+"""
+
+import pytest
+from unittest.mock import Mock
+from py_zerobyte import BloomFilter, SnapshotPathIndex
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter."""
+    
+    def test_no_false_negatives_and_round_trip(self):
+        """Test membership survives serialization."""
+        bloom = BloomFilter.for_capacity(500, false_positive_rate=0.01)
+        paths = [f"/data/file{i}.txt" for i in range(500)]
+        for path in paths:
+            bloom.add(path)
+        
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+        assert all(path in restored for path in paths)
+        assert len(restored) == 500
+        
+        false_positives = sum(f"/other/file{i}.txt" in restored for i in range(2000))
+        assert false_positives < 100
+    
+    def test_rejects_invalid_data(self):
+        """Test that garbage data raises ValueError."""
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(b"not a filter")
+
+
+class TestSnapshotPathIndex:
+    """Tests for SnapshotPathIndex."""
+    
+    def make_client(self):
+        client = Mock()
+        client.snapshots.list.return_value = [{"short_id": "s1"}, {"short_id": "s2"}]
+        client.snapshots.walk.side_effect = lambda repo, snapshot_id: iter([
+            {"path": "/data", "type": "dir"},
+            {"path": f"/data/{snapshot_id}.txt", "type": "file"},
+        ])
+        client.snapshots.find_entry.side_effect = lambda repo, snapshot_id, path: (
+            {"path": path} if path in ("/data", f"/data/{snapshot_id}.txt") else None
+        )
+        return client
+    
+    def test_build_persist_and_find(self, tmp_path):
+        """Test that filters are persisted and queried without walking again."""
+        client = self.make_client()
+        index = SnapshotPathIndex(client, str(tmp_path))
+        assert index.build_repository("repo/one") == 2
+        
+        fresh_client = self.make_client()
+        fresh = SnapshotPathIndex(fresh_client, str(tmp_path))
+        results = fresh.find(["/data/s2.txt", "data/", "/missing.txt"])
+        
+        assert [r["snapshot_id"] for r in results["/data/s2.txt"]] == ["s2"]
+        assert [r["snapshot_id"] for r in results["/data"]] == ["s1", "s2"]
+        assert results["/missing.txt"] == []
+        assert results["/data"][0]["repository"] == "repo/one"
+        fresh_client.snapshots.walk.assert_not_called()
+        
+        assert fresh.build_repository("repo/one") == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
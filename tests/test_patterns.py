@@ -0,0 +1,88 @@
+"""
+Unit tests for the compiled pattern matcher.
+"""
+
+import pytest
+
+from py_zerobyte.patterns import PathFilter, PatternSet
+
+
+@pytest.mark.parametrize("pattern,path,expected", [
+    ("foo", "/a/foo/bar", True),
+    ("foo", "/a/foobar", False),
+    ("/foo", "/a/foo", False),
+    ("/foo", "/foo/x", True),
+    ("foo/bar", "/x/foo/bar/z", True),
+    ("/a/*/c", "/a/b/c/d", True),
+    ("*.go", "/x/y.go", True),
+    ("a?c", "/a/c", False),
+    ("**/b", "/b", True),
+    ("/a/**/d", "/a/d", True),
+    ("/a/**/d", "/a/b/c/d", True),
+    ("[a-c]x", "/bx", True),
+    ("[^a-c]x", "/bx", False),
+    ("\\*", "/*", True),
+])
+def test_restic_semantics(pattern, path, expected):
+    """Test single patterns against restic's matching rules."""
+    assert PatternSet([pattern]).matches(path) is expected
+
+
+class TestPatternSet:
+    """Tests for PatternSet."""
+    
+    def test_combined_set(self):
+        """Test that trie, name set and regex parts combine."""
+        patterns = PatternSet(["/data/cache", "node_modules", "*.tmp", "/home/*/Downloads"])
+        assert patterns.matches("/data/cache/x")
+        assert not patterns.matches("/data/cached")
+        assert patterns.matches("/src/node_modules/pkg/index.js")
+        assert patterns.matches("/a/b.tmp")
+        assert patterns.matches("/home/alice/Downloads/file")
+        assert not patterns.matches("/home/alice/Documents/file")
+        assert not patterns.matches("/")
+    
+    def test_negation_and_case(self):
+        """Test that the last matching pattern wins and case folding."""
+        patterns = PatternSet(["*.log", "!keep.log"])
+        assert patterns.matches("/a/x.log")
+        assert not patterns.matches("/a/keep.log")
+        assert PatternSet(["*.TXT", "/Data"], case_sensitive=False).matches("/a.txt")
+        assert PatternSet(["/Data"], case_sensitive=False).matches("/data/x")
+    
+    def test_may_match_below(self):
+        """Test pruning of directories that cannot contain matches."""
+        patterns = PatternSet(["/data/*/reports"])
+        assert patterns.may_match_below("/data")
+        assert patterns.may_match_below("/data/2024")
+        assert not patterns.may_match_below("/etc")
+        assert PatternSet(["*.pdf"]).may_match_below("/anything")
+
+
+class TestPathFilter:
+    """Tests for PathFilter."""
+    
+    def test_from_schedule_and_filter(self):
+        """Test selecting walk entries with a schedule's patterns."""
+        selection = PathFilter.from_schedule({
+            "includePatterns": ["/data"],
+            "excludePatterns": ["*.tmp", "/data/cache"],
+            "excludeIfPresent": [".nobackup", "CACHEDIR.TAG:Signature: 8a477f597d28d172789f06886806bc55"],
+        })
+        entries = [
+            {"path": "/data", "type": "dir"},
+            {"path": "/data/a.txt", "type": "file"},
+            {"path": "/data/b.tmp", "type": "file"},
+            {"path": "/data/cache", "type": "dir"},
+            {"path": "/data/cache/x", "type": "file"},
+            {"path": "/etc", "type": "dir"},
+            {"path": "/etc/hosts", "type": "file"},
+        ]
+        assert [e["path"] for e in selection.filter(entries)] == ["/data", "/data/a.txt"]
+        assert selection.has_marker(["x", "CACHEDIR.TAG"])
+        assert not selection.has_marker(["x"])
+        assert PathFilter.from_schedule({"includePatterns": None}).selects("/anything")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""
+Unit tests for the repository registry.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from py_zerobyte.repositories import RepositoriesAPI
+from py_zerobyte.resolver import Resolver
+
+
+REPOSITORIES = [
+    {"id": "r1", "shortId": "a1", "name": "local-1", "type": "local", "volumeId": 1},
+    {"id": "r2", "shortId": "a2", "name": "s3-1", "type": "s3", "volumeId": 1},
+    {"id": "r3", "shortId": "a3", "name": "s3-2", "type": "s3", "volumeId": 2},
+]
+
+
+def make_api(repositories):
+    calls = []
+    
+    def make_request(method, endpoint, data=None, **kwargs):
+        calls.append((method, endpoint))
+        if method == "GET":
+            return [dict(repository) for repository in repositories]
+        if method == "POST":
+            return {"message": "created", "repository": {"id": "r9", "name": data["name"]}}
+        if method == "PUT":
+            return dict(REPOSITORIES[0], **data)
+        return {"message": "deleted"}
+    
+    client = Mock()
+    client._make_request.side_effect = make_request
+    client.resolver = Resolver(client)
+    api = RepositoriesAPI(client)
+    client.repositories = api
+    return api, calls
+
+
+class TestRepositoryRegistry:
+    """Tests for RepositoryRegistry and RepositoriesAPI.use_registry."""
+    
+    def test_indexes_and_single_fetch(self):
+        """Test that lookups by volume, backend, name and ID share one list call."""
+        api, calls = make_api(REPOSITORIES)
+        registry = api.use_registry()
+        
+        assert [r["name"] for r in api.list(volume_id=1)] == ["local-1", "s3-1"]
+        assert [r["name"] for r in api.list(volume_id=2)] == ["s3-2"]
+        assert [r["name"] for r in registry.by_backend("s3")] == ["s3-1", "s3-2"]
+        assert [r["name"] for r in registry.list(volume_id=1, backend="s3")] == ["s3-1"]
+        assert registry.get("s3-2")["id"] == "r3"
+        assert registry.get_by_id("a1")["name"] == "local-1"
+        assert "missing" not in registry
+        assert calls == [("GET", "/api/v1/repositories")]
+    
+    def test_results_are_copies(self):
+        """Test that mutating a returned repository leaves the indexes intact."""
+        api, _ = make_api(REPOSITORIES)
+        registry = api.use_registry()
+        
+        registry.get("s3-1")["type"] = "local"
+        registry.get_by_id("r3")["volumeId"] = 1
+        for repository in registry.list():
+            repository["name"] = "renamed"
+        
+        assert [r["name"] for r in registry.by_backend("s3")] == ["s3-1", "s3-2"]
+        assert [r["name"] for r in registry.by_volume(1)] == ["local-1", "s3-1"]
+        assert registry.refresh(force=True) == (0, 0, 0)
+    
+    def test_ttl_refresh_applies_differences(self):
+        """Test that an expired registry re-lists and applies only the changes."""
+        repositories = [dict(r) for r in REPOSITORIES]
+        api, calls = make_api(repositories)
+        with patch("py_zerobyte.registry.time.monotonic", return_value=100.0):
+            registry = api.use_registry(ttl=60)
+            assert len(registry) == 3
+        
+        repositories[1]["type"] = "r2"
+        del repositories[2]
+        repositories.append({"id": "r4", "name": "new", "type": "local", "volumeId": 2})
+        with patch("py_zerobyte.registry.time.monotonic", return_value=200.0):
+            assert registry.refresh() == (1, 1, 1)
+            assert [r["name"] for r in registry.by_backend("s3")] == []
+            assert [r["name"] for r in registry.by_volume(2)] == ["new"]
+        assert len(calls) == 2
+    
+    def test_mutations_update_in_place(self):
+        """Test that create, update and delete keep the registry current without re-listing."""
+        api, calls = make_api(REPOSITORIES)
+        registry = api.use_registry()
+        registry.refresh()
+        
+        api.create({"name": "added", "config": {"backend": "sftp"}})
+        api.update("local-1", {"name": "renamed"})
+        api.delete("s3-2")
+        
+        assert registry.get("added")["id"] == "r9"
+        assert [r["name"] for r in registry.by_backend("sftp")] == ["added"]
+        assert registry.get("local-1") is None
+        assert registry.get("renamed")["id"] == "r1"
+        assert registry.get("s3-2") is None
+        assert [method for method, _ in calls].count("GET") == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,104 @@
+"""
+Unit tests for the Repositories API helpers.
+"""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from py_zerobyte import APIError
+from py_zerobyte.repositories import RepositoriesAPI, storage_target
+from py_zerobyte.resolver import Resolver
+
+
+def s3(name, bucket):
+    return {"name": name, "config": {"backend": "s3", "endpoint": "https://s3.example.com", "bucket": bucket}}
+
+
+REPOSITORIES = [
+    s3("a1", "alpha"),
+    s3("a2", "alpha"),
+    s3("b1", "beta"),
+    {"name": "nas", "config": {"backend": "sftp", "host": "nas.local", "path": "/repo"}},
+    {"name": "broken", "config": {"backend": "local", "path": "/srv/broken"}},
+]
+
+
+class TestBulkDoctor:
+    """Tests for RepositoriesAPI.bulk_doctor."""
+    
+    def make_api(self, fail=()):
+        running = {}
+        peak = {}
+        lock = threading.Lock()
+        calls = []
+        
+        def make_request(method, endpoint, timeout=None, **kwargs):
+            if method == "GET":
+                return REPOSITORIES
+            name = endpoint.split("/")[-2]
+            repository = next(r for r in REPOSITORIES if r["name"] == name)
+            key = storage_target(repository)
+            with lock:
+                calls.append((name, timeout))
+                running[key] = running.get(key, 0) + 1
+                peak[key] = max(peak.get(key, 0), running[key])
+            time.sleep(0.02)
+            with lock:
+                running[key] -= 1
+            if name in fail:
+                raise APIError("Request failed", status_code=502)
+            if name == "broken":
+                return {"success": False, "steps": [
+                    {"step": "unlock", "success": True, "error": None, "output": ""},
+                    {"step": "check", "success": False, "error": "pack missing", "output": ""},
+                ]}
+            return {"success": True, "steps": []}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        client.resolver = Resolver(client)
+        return RepositoriesAPI(client), calls, peak
+    
+    def test_storage_target(self):
+        """Test that repositories are keyed by the storage they live on."""
+        assert storage_target(REPOSITORIES[0]) == storage_target(REPOSITORIES[1])
+        assert storage_target(REPOSITORIES[0]) != storage_target(REPOSITORIES[2])
+        assert storage_target(REPOSITORIES[3]) == "sftp:nas.local"
+        assert storage_target({"config": {"backend": "rest", "url": "https://rest:8000/x"}}) == "rest:rest:8000"
+    
+    def test_report_and_limits(self):
+        """Test per-target limits, long timeouts and the aggregate report."""
+        api, calls, peak = self.make_api(fail={"nas"})
+        updates = []
+        
+        report = api.bulk_doctor(max_workers=8, progress=updates.append)
+        
+        assert peak[storage_target(REPOSITORIES[0])] == 1
+        assert {timeout for _, timeout in calls} == {3600.0}
+        assert sorted(report["healthy"]) == ["a1", "a2", "b1"]
+        assert report["unhealthy"] == [{"repository": "broken", "errors": [{"step": "check", "error": "pack missing"}]}]
+        assert [f["repository"] for f in report["failed"]] == ["nas"]
+        assert report["targets"]["s3:https://s3.example.com:alpha"] == {"healthy": 2, "unhealthy": 0, "failed": 0}
+        assert report["targets"]["sftp:nas.local"]["failed"] == 1
+        assert sorted(u["done"] for u in updates) == [1, 2, 3, 4, 5]
+    
+    def test_resumes_from_journal(self, tmp_path):
+        """Test that recorded runs are skipped and request errors retried."""
+        journal = str(tmp_path / "doctor.journal")
+        api, calls, _ = self.make_api(fail={"nas"})
+        api.bulk_doctor(["a1", "broken", "nas"], state_file=journal)
+        
+        api, calls, _ = self.make_api()
+        report = api.bulk_doctor(["a1", "broken", "nas"], state_file=journal)
+        
+        assert [name for name, _ in calls] == ["nas"]
+        assert sorted(report["skipped"]) == ["a1", "broken"]
+        assert sorted(report["healthy"]) == ["a1", "nas"]
+        assert report["unhealthy"][0]["repository"] == "broken"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
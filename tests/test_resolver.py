@@ -0,0 +1,139 @@
+"""
+Unit tests for name/ID resolution.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from py_zerobyte import NotFoundError, ValidationError, ZerobyteClient
+
+
+LISTS = {
+    "/api/v1/volumes": [{"id": 1, "name": "data", "shortId": "v1"}, {"id": 2, "name": "media"}],
+    "/api/v1/repositories": [{"id": "rp-1", "shortId": "ab12", "name": "offsite"}],
+    "/api/v1/backups": [
+        {"id": 7, "name": "nightly", "volumeId": 1, "repositoryId": "rp-1"},
+        {"id": 9, "name": "nightly", "volumeId": 2, "repositoryId": "rp-1"},
+        {"id": 8, "name": "weekly", "volumeId": 1, "repositoryId": "rp-1"},
+    ],
+    "/api/v1/notification-destinations": [{"id": 3, "name": "ops-email"}],
+}
+
+
+def make_request(method, endpoint, **kwargs):
+    parts = endpoint.split("/")
+    if parts[3] == "repositories" and len(parts) > 4 and parts[4] != "offsite":
+        raise NotFoundError("Repository not found", status_code=404)
+    if "backup-schedules" in parts and parts[6] != "rp-1":
+        raise NotFoundError("Repository not found", status_code=404)
+    return LISTS.get(endpoint, {})
+
+
+def make_client():
+    client = ZerobyteClient("http://localhost:4096", "admin", "secret", auto_login=False)
+    client._make_request = Mock(side_effect=make_request)
+    return client
+
+
+def endpoints(client):
+    return [call.args[1] for call in client._make_request.call_args_list]
+
+
+class TestResolver:
+    """Tests for Resolver and its use by the API modules."""
+    
+    def test_methods_accept_names_or_ids(self):
+        """Test that each API addresses resources in the form its routes expect."""
+        client = make_client()
+        
+        client.volumes.get(1)
+        client.volumes.mount("media")
+        client.snapshots.list("rp-1")
+        client.repositories.doctor("offsite")
+        client.backup_schedules.get("data", "offsite", "nightly")
+        client.notifications.test_destination("ops-email")
+        
+        requests = [e for e in endpoints(client) if e not in LISTS]
+        assert requests == [
+            "/api/v1/volumes/data",
+            "/api/v1/volumes/media/mount",
+            # Repository references are tried as names before a lookup
+            "/api/v1/repositories/rp-1/snapshots",
+            "/api/v1/repositories/offsite/snapshots",
+            "/api/v1/repositories/offsite/doctor",
+            "/api/v1/volumes/1/repositories/rp-1/backup-schedules/7",
+            "/api/v1/notification-destinations/3/test",
+        ]
+        # Each list endpoint was fetched once
+        assert sorted(e for e in endpoints(client) if e in LISTS) == sorted(LISTS)
+    
+    def test_canonical_forms_need_no_lookup(self):
+        """Test that volume names and numeric IDs are passed through without list calls."""
+        client = make_client()
+        client.volumes.health_check("data")
+        client.notifications.get_destination(3)
+        client.repositories.get("offsite")
+        assert endpoints(client) == [
+            "/api/v1/volumes/data/health-check",
+            "/api/v1/notification-destinations/3",
+            "/api/v1/repositories/offsite",
+        ]
+    
+    def test_schedule_routes_with_ids_need_no_lookup(self):
+        """Test that nested schedule routes given IDs are sent without list calls."""
+        client = make_client()
+        client.backup_schedules.get(1, "rp-1", 7)
+        assert endpoints(client) == ["/api/v1/volumes/1/repositories/rp-1/backup-schedules/7"]
+        
+        client.backup_schedules.run_now(1, "offsite", 7)
+        assert endpoints(client)[1:] == [
+            "/api/v1/volumes/1/repositories/offsite/backup-schedules/7/run-now",
+            "/api/v1/repositories",
+            "/api/v1/volumes/1/repositories/rp-1/backup-schedules/7/run-now",
+        ]
+    
+    def test_duplicate_names(self):
+        """Test that schedule names resolve within their volume and repository, and are otherwise ambiguous."""
+        client = make_client()
+        client.backup_schedules.run_now("data", "offsite", "nightly")
+        client.backup_schedules.run_now("media", "rp-1", "nightly")
+        client.backup_schedules.get_schedule("weekly")
+        
+        requests = [e for e in endpoints(client) if e not in LISTS]
+        assert requests == [
+            "/api/v1/volumes/1/repositories/rp-1/backup-schedules/7/run-now",
+            "/api/v1/volumes/2/repositories/rp-1/backup-schedules/9/run-now",
+            "/api/v1/backups/8",
+        ]
+        sent = client._make_request.call_count
+        with pytest.raises(ValidationError):
+            client.backup_schedules.delete_schedule("nightly")
+        assert client._make_request.call_count == sent
+    
+    def test_registry_answers_repository_lookups(self):
+        """Test that an attached registry translates repository IDs without a 404 retry."""
+        client = make_client()
+        client.repositories.use_registry()
+        client.snapshots.list("ab12")
+        client.snapshots.list("rp-1")
+        assert endpoints(client) == [
+            "/api/v1/repositories",
+            "/api/v1/repositories/offsite/snapshots",
+            "/api/v1/repositories/offsite/snapshots",
+        ]
+    
+    def test_mutations_invalidate(self):
+        """Test that a mutation rebuilds the affected map on next use."""
+        client = make_client()
+        client.volumes.get(1)
+        client.volumes.get(2)
+        client.volumes.update("data", {"name": "renamed"})
+        client.volumes.get(1)
+        assert endpoints(client).count("/api/v1/volumes") == 2
+        assert client.resolver.name_of("volumes", "v1") == "data"
+        assert client.resolver.id_of("volumes", "unknown") == "unknown"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,188 @@
+"""
+Unit tests for the restore planner.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from py_zerobyte.exceptions import APIError
+from py_zerobyte.files import merge_walks
+from py_zerobyte.restore import RestorePlanner, batch_paths, collapse_paths, verify_restore
+from py_zerobyte.snapshots import SnapshotsAPI
+from py_zerobyte.volumes import VolumesAPI
+
+
+TREE = {
+    "/": ["/data", "/etc"],
+    "/data": ["/data/a", "/data/b"],
+    "/data/a": ["/data/a/1", "/data/a/2"],
+    "/data/b": ["/data/b/1", "/data/b/2", "/data/b/3"],
+    "/etc": ["/etc/hosts", "/etc/passwd"],
+}
+
+
+def make_client(fail_includes=()):
+    client = Mock()
+    
+    def list_files(repository_name, snapshot_id, path=None):
+        children = TREE.get(path, [])
+        return {"files": [{"path": path}] + [{"path": child} for child in children]}
+    
+    def restore(repository_name, data):
+        if any(path in fail_includes for path in data["include"]):
+            raise APIError("restore failed", status_code=500)
+        return {"success": True, "filesRestored": len(data["include"])}
+    
+    client.snapshots.list_files.side_effect = list_files
+    client.snapshots.restore.side_effect = restore
+    return client
+
+
+class TestCollapsePaths:
+    """Tests for the path helpers."""
+    
+    def test_drops_duplicates_and_covered_paths(self):
+        """Test that descendants of listed directories are dropped."""
+        paths = ["/data/a/1", "/data/a/", "data/a", "/data/ab", "/etc/hosts"]
+        assert collapse_paths(paths) == ["/data/a", "/data/ab", "/etc/hosts"]
+        assert collapse_paths(["/x", "/"]) == ["/"]
+    
+    def test_batches(self):
+        """Test splitting into bounded batches."""
+        assert batch_paths(["a", "b", "c"], 2) == [["a", "b"], ["c"]]
+
+
+class TestRestorePlanner:
+    """Tests for RestorePlanner."""
+    
+    def test_collapses_complete_directories_bottom_up(self):
+        """Test that fully selected directories replace their children."""
+        client = make_client()
+        planner = RestorePlanner(client, "repo", "snap")
+        
+        include = planner.cover(["/data/a/1", "/data/a/2", "/data/b/1", "/data/b/2", "/data/b/3", "/etc/hosts"])
+        assert include == ["/data", "/etc/hosts"]
+        
+        client = make_client()
+        include = RestorePlanner(client, "repo", "snap").cover(["/data/a/1", "/data/b/1", "/data/b/2"])
+        assert include == ["/data/a/1", "/data/b/1", "/data/b/2"]
+        listed = sorted(call.kwargs["path"] for call in client.snapshots.list_files.call_args_list)
+        assert listed == ["/data/a", "/data/b"]
+    
+    def test_execute_batches_and_reports_failures(self):
+        """Test that batches are restored and failures reported."""
+        client = make_client(fail_includes={"/etc/passwd"})
+        planner = RestorePlanner(client, "repo", "snap")
+        events = []
+        
+        plan = planner.plan(["/data/a/1", "/data/b/1", "/etc/passwd"], max_batch_size=2)
+        assert plan["batches"] == [["/data/a/1", "/data/b/1"], ["/etc/passwd"]]
+        
+        result = planner.execute(plan, {"targetPath": "/restore"}, progress=events.append)
+        assert [entry["include"] for entry in result["succeeded"]] == [["/data/a/1", "/data/b/1"]]
+        assert [entry["include"] for entry in result["failed"]] == [["/etc/passwd"]]
+        assert result["files_restored"] == 2
+        assert len(events) == 2 and events[-1]["done"] == 2
+        
+        data = client.snapshots.restore.call_args_list[0].args[1]
+        assert data["snapshotId"] == "snap"
+        assert data["targetPath"] == "/restore"
+    
+    def test_differential_restore(self):
+        """Test that only missing or changed entries are restored."""
+        client = make_client()
+        sizes = {"/data/a/1": 10, "/data/a/2": 20, "/data/b/1": 30, "/data/b/2": 40, "/data/b/3": 50}
+        
+        def list_files(repository_name, snapshot_id, path=None):
+            entries = [{"path": path, "name": path.rsplit("/", 1)[-1], "type": "dir"}]
+            for child in TREE.get(path, []):
+                entries.append({
+                    "path": child,
+                    "name": child.rsplit("/", 1)[-1],
+                    "type": "dir" if child in TREE else "file",
+                    "size": sizes.get(child),
+                    "mtime": "2024-01-01T00:00:00.123456789Z",
+                })
+            return {"files": entries}
+        
+        volume = {
+            "/restored": [("a", "directory", None), ("b", "directory", None)],
+            "/restored/a": [("1", "file", 10), ("2", "file", 21)],
+            "/restored/b": [("1", "file", 30)],
+        }
+        
+        def volume_files(volume_id, path=None):
+            return {"files": [
+                {"path": f"{path}/{name}", "name": name, "type": kind, "size": size,
+                 "modifiedAt": 1704067200000}
+                for name, kind, size in volume.get(path, [])
+            ]}
+        
+        client.snapshots.list_files.side_effect = list_files
+        client.volumes.list_files.side_effect = volume_files
+        planner = RestorePlanner(client, "repo", "snap")
+        
+        report = planner.restore_differences(1, "/data", volume_path="/restored", dry_run=True)
+        assert [(c["path"], c["reason"]) for c in report["changed"]] == [
+            ("/data/a/2", "changed"), ("/data/b/2", "missing"), ("/data/b/3", "missing"),
+        ]
+        assert report["include"] == ["/data/a/2", "/data/b/2", "/data/b/3"]
+        assert report["bytes_saved"] == 40
+        assert report["bytes_to_restore"] == 110
+        client.snapshots.restore.assert_not_called()
+        
+        report = planner.restore_differences(1, "/data", volume_path="/restored", restore_data={"targetPath": "/"})
+        assert report["files_restored"] == 3
+        assert client.snapshots.restore.call_args.args[1]["include"] == report["include"]
+
+
+class TestVerifyRestore:
+    """Tests for verify_restore."""
+    
+    def test_merge_walks_pairs_relative_paths(self):
+        """Test that entries are paired by path relative to each root."""
+        source = [{"path": "/data/a"}, {"path": "/data/a/x"}, {"path": "/data/a.txt"}]
+        target = [{"path": "/r/a"}, {"path": "/r/a.txt"}, {"path": "/r/b"}]
+        pairs = [(rel, s is not None, t is not None) for rel, s, t in merge_walks(source, target, "/data", "/r")]
+        assert pairs == [("a", True, True), ("a/x", True, False), ("a.txt", True, True), ("b", False, True)]
+    
+    def test_reports_mismatches(self):
+        """Test that missing, extra and changed entries are reported."""
+        snapshot_tree = {
+            "/data": [("a", "dir", None), ("f.txt", "file", 5)],
+            "/data/a": [("1", "file", 1), ("2", "file", 2)],
+        }
+        volume_tree = {
+            "/restored": [("a", "directory", None), ("f.txt", "file", 6), ("new", "file", 1)],
+            "/restored/a": [("1", "file", 1)],
+        }
+        
+        def listing(tree, path):
+            return {"files": [
+                {"name": name, "path": f"{path}/{name}", "type": kind, "size": size,
+                 "mtime": "2024-01-01T00:00:00Z", "modifiedAt": 1704067200}
+                for name, kind, size in tree.get(path, [])
+            ]}
+        
+        client = Mock()
+        client._make_request.side_effect = lambda method, endpoint, params=None, **kwargs: listing(
+            volume_tree if endpoint.startswith("/api/v1/volumes") else snapshot_tree, params["path"]
+        )
+        client.snapshots = SnapshotsAPI(client)
+        client.volumes = VolumesAPI(client)
+        
+        report = verify_restore(client, "repo", "snap", 1, "/data", volume_path="/restored", max_workers=4)
+        assert not report["ok"]
+        assert report["matched"] == 2
+        assert [(m["path"], m["reason"]) for m in report["mismatches"]] == [
+            ("a/2", "missing"), ("f.txt", "changed"), ("new", "extra"),
+        ]
+        
+        report = verify_restore(client, "repo", "snap", 1, "/data", volume_path="/restored",
+                                ignore_extra=True, max_mismatches=1)
+        assert [m["path"] for m in report["mismatches"]] == ["a/2"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,74 @@
+"""
+Unit tests for the retention policy simulator.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from py_zerobyte import RetentionSimulator, simulate_forget
+
+
+def snapshot(short_id, when, size=100, paths=("/data",)):
+    moment = datetime.strptime(when, "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+    return {"short_id": short_id, "time": moment.timestamp() * 1000, "size": size,
+            "paths": list(paths), "tags": [], "duration": 1}
+
+
+SNAPSHOTS = [
+    snapshot("s1", "2023-12-25 10:00"),
+    snapshot("s2", "2024-01-01 10:00"),
+    snapshot("s3", "2024-01-01 20:00"),
+    snapshot("s4", "2024-01-02 10:00"),
+    snapshot("s5", "2024-01-03 10:00"),
+    snapshot("s6", "2024-01-03 11:00"),
+]
+
+
+def kept(result):
+    return sorted(s["short_id"] for s in result["keep"])
+
+
+class TestRetentionSimulator:
+    """Tests for RetentionSimulator."""
+    
+    def test_restic_bucketing(self):
+        """Test that each bucket keeps the newest snapshot of the newest periods."""
+        simulator = RetentionSimulator(SNAPSHOTS, tz=timezone.utc)
+        
+        assert kept(simulator.simulate({"keepLast": 2})) == ["s5", "s6"]
+        assert kept(simulator.simulate({"keepDaily": 3})) == ["s3", "s4", "s6"]
+        assert kept(simulator.simulate({"keepLast": 1, "keepMonthly": 2})) == ["s1", "s6"]
+        assert kept(simulator.simulate({"keepWeekly": -1})) == ["s1", "s6"]
+        assert kept(simulator.simulate({"keepWithinDuration": "1d2h"})) == ["s4", "s5", "s6"]
+        assert kept(simulator.simulate({})) == ["s1", "s2", "s3", "s4", "s5", "s6"]
+    
+    def test_reclaimed_size_and_compare(self):
+        """Test size reporting and comparing candidate policies."""
+        result = simulate_forget(SNAPSHOTS, {"keepLast": 4}, tz=timezone.utc)
+        assert [s["short_id"] for s in result["remove"]] == ["s2", "s1"]
+        assert result["reclaimed_size"] == 200
+        assert result["kept_size"] == 400
+        
+        summaries = RetentionSimulator(SNAPSHOTS, tz=timezone.utc).compare(
+            [{"keepLast": 1}, {"keepDaily": 7}]
+        )
+        assert [(s["kept"], s["removed"]) for s in summaries] == [(1, 5), (4, 2)]
+    
+    def test_groups_by_paths(self):
+        """Test that each set of paths is retained independently."""
+        snapshots = SNAPSHOTS + [snapshot("e1", "2023-06-01 10:00", paths=["/etc"])]
+        
+        assert kept(RetentionSimulator(snapshots).simulate({"keepLast": 1})) == ["e1", "s6"]
+        assert kept(RetentionSimulator(snapshots, group_by_paths=False).simulate({"keepLast": 1})) == ["s6"]
+    
+    def test_invalid_duration(self):
+        """Test that malformed durations are rejected."""
+        with pytest.raises(ValueError):
+            RetentionSimulator(SNAPSHOTS).simulate({"keepWithinDuration": "2 weeks"})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
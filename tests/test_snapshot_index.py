@@ -0,0 +1,95 @@
+"""
+Unit tests for SnapshotIndex.
+"""
+
+import pytest
+from unittest.mock import Mock
+from py_zerobyte import SnapshotIndex
+
+
+def snapshot(short_id, time, tags=(), paths=("/data",)):
+    return {"short_id": short_id, "time": time, "tags": list(tags), "paths": list(paths), "size": 1, "duration": 1}
+
+
+class ScanCounter(list):
+    """List counting how often it is indexed or sliced."""
+    
+    scans = 0
+    
+    def __getitem__(self, item):
+        self.scans += 1
+        return super().__getitem__(item)
+
+
+@pytest.fixture
+def client():
+    client = Mock()
+    client.repositories.list.return_value = [{"name": "repo-a"}, {"name": "repo-b"}]
+    client.snapshots.list.side_effect = lambda name: {
+        "repo-a": [
+            snapshot("a1", 1000, ["daily"]),
+            snapshot("a2", 2000, ["pre-upgrade", "daily"]),
+            snapshot("a3", 3000, ["pre-upgrade"], ["/etc"]),
+        ],
+        "repo-b": [snapshot("b1", 2500, ["pre-upgrade"], ["/srv/app"])],
+    }[name]
+    return client
+
+
+class TestSnapshotIndex:
+    """Tests for SnapshotIndex."""
+    
+    def test_combined_query(self, client):
+        """Test tag, time and path conditions together."""
+        index = SnapshotIndex(client)
+        index.refresh()
+        
+        def ids(**conditions):
+            return [hit["snapshot"]["short_id"] for hit in index.query(**conditions)]
+        
+        assert ids(tags=["pre-upgrade"]) == ["a2", "b1", "a3"]
+        assert ids(tags=["pre-upgrade"], since=2100, until=3000) == ["b1", "a3"]
+        assert ids(tags=["pre-upgrade", "daily"]) == ["a2"]
+        assert ids(any_tags=["daily", "missing"], until=1500) == ["a1"]
+        assert ids(path_prefix="/srv") == ["b1"]
+        assert ids(path_prefix="/data/sub", repository_name="repo-a") == ["a1", "a2"]
+        assert index.tags() == {"daily": 2, "pre-upgrade": 3}
+    
+    def test_tag_query_visits_only_matches(self):
+        """Test that a selective tag query does not scan the whole time range."""
+        client = Mock()
+        client.repositories.list.return_value = [{"name": "repo"}]
+        client.snapshots.list.return_value = [snapshot("t", 1500, ["release"])] + [
+            snapshot(f"s{i}", 1000 + i, ["release"] if i in (10, 500) else ["hourly"]) for i in range(1000)
+        ]
+        index = SnapshotIndex(client)
+        index.refresh()
+        
+        index._time_keys = ScanCounter(index._time_keys)
+        
+        hits = index.query(tags=["release"], since=1100)
+        
+        assert [hit["snapshot"]["short_id"] for hit in hits] == ["s500", "t"]
+        assert index._time_keys.scans == 0
+        # Ties in time are ordered by key whichever way the query is answered
+        assert [hit["snapshot"]["short_id"] for hit in index.query(tags=["release"], since=1500, until=1500)] == ["s500", "t"]
+        assert [hit["snapshot"]["short_id"] for hit in index.query(since=1500, until=1500)] == ["s500", "t"]
+    
+    def test_incremental_refresh_and_persistence(self, client, tmp_path):
+        """Test that refresh applies only differences and the index round-trips."""
+        index = SnapshotIndex(client)
+        index.refresh()
+        
+        client.snapshots.list.side_effect = lambda name: [snapshot("a3", 3000, ["pre-upgrade"]), snapshot("a4", 4000)]
+        assert index.refresh(["repo-a"]) == {"repo-a": (1, 2)}
+        assert [hit["snapshot"]["short_id"] for hit in index.query(since=0)] == ["b1", "a3", "a4"]
+        
+        path = str(tmp_path / "index.json")
+        index.save(path)
+        restored = SnapshotIndex.load(client, path)
+        assert len(restored) == 3
+        assert restored.query(tags=["pre-upgrade"]) == index.query(tags=["pre-upgrade"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
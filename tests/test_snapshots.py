@@ -0,0 +1,225 @@
+"""
+Unit tests for the Snapshots API helpers.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from unittest.mock import Mock
+from py_zerobyte import APIError, NotFoundError, ZerobyteClient
+from py_zerobyte.resolver import Resolver
+from py_zerobyte.snapshots import SnapshotsAPI
+
+
+def make_snapshots_api(versions):
+    """Build a SnapshotsAPI whose snapshots hold the given /data/file.txt versions."""
+    snapshots = [
+        {"short_id": f"s{i}", "time": 1000 + i, "size": 0, "tags": [], "paths": ["/data"], "duration": 1}
+        for i in range(len(versions))
+    ]
+    
+    def make_request(method, endpoint, data=None, params=None, **kwargs):
+        if endpoint.endswith("/snapshots"):
+            # Return out of order to check sorting by time
+            return list(reversed(snapshots))
+        snapshot_id = endpoint.split("/")[-2]
+        size = versions[int(snapshot_id[1:])]
+        files = [{"name": "other.txt", "path": "/data/other.txt", "type": "file", "size": 1}]
+        if size is not None:
+            files.append({"name": "file.txt", "path": "/data/file.txt", "type": "file", "size": size})
+        return {"files": files, "snapshot": {"short_id": snapshot_id}}
+    
+    client = Mock()
+    client._make_request.side_effect = make_request
+    client.resolver = Resolver(client)
+    return SnapshotsAPI(client), client
+
+
+class TestPathHistory:
+    """Tests for SnapshotsAPI.path_history."""
+    
+    def test_finds_transitions(self):
+        """Test that additions, modifications and removals are located."""
+        versions = [None, None, 10, 10, 10, 20, 20, None, None, 30, 30, 30]
+        api, client = make_snapshots_api(versions)
+        
+        history = api.path_history("repo", "/data/file.txt")
+        
+        assert [(h['change'], h['snapshot']['short_id']) for h in history] == [
+            ('added', 's2'),
+            ('modified', 's5'),
+            ('removed', 's7'),
+            ('added', 's9'),
+        ]
+        assert history[1]['entry']['size'] == 20
+        assert history[2]['entry'] is None
+        
+        lookups = client._make_request.call_count - 1
+        assert lookups < len(versions)
+    
+    def test_unchanged_path_costs_two_lookups(self):
+        """Test that an unchanged path only probes the first and last snapshot."""
+        api, client = make_snapshots_api([5] * 50)
+        
+        history = api.path_history("repo", "/data/file.txt")
+        
+        assert [h['change'] for h in history] == ['added']
+        assert client._make_request.call_count == 3
+    
+    def test_empty_repository(self):
+        """Test that a repository without snapshots has no history."""
+        client = Mock()
+        client._make_request.return_value = []
+        
+        assert SnapshotsAPI(client).path_history("repo", "/data/file.txt") == []
+
+
+class TestWalk:
+    """Tests for SnapshotsAPI.walk."""
+    
+    def test_walks_depth_first_in_name_order(self):
+        """Test that the walk descends into directories and skips the listed directory itself."""
+        tree = {
+            "/": [{"name": "b", "path": "/b", "type": "dir"}, {"name": "a.txt", "path": "/a.txt", "type": "file"}],
+            "/b": [
+                {"name": "b", "path": "/b", "type": "dir"},
+                {"name": "c.txt", "path": "/b/c.txt", "type": "file"},
+            ],
+        }
+        client = Mock()
+        client._make_request.side_effect = lambda method, endpoint, params=None, **kwargs: {
+            "files": tree[params["path"]]
+        }
+        
+        paths = [entry["path"] for entry in SnapshotsAPI(client).walk("repo", "s1")]
+        
+        assert paths == ["/a.txt", "/b", "/b/c.txt"]
+    
+    def test_prefetching_walk_keeps_order(self):
+        """Test that fetching listings ahead yields the same entries in the same order."""
+        tree = {"/": [{"name": f"d{i}", "path": f"/d{i}", "type": "dir"} for i in range(5)]}
+        for i in range(5):
+            tree[f"/d{i}"] = [{"name": "f", "path": f"/d{i}/f", "type": "file"}]
+        client = Mock()
+        client._make_request.side_effect = lambda method, endpoint, params=None, **kwargs: {
+            "files": tree[params["path"]]
+        }
+        api = SnapshotsAPI(client)
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            prefetched = [entry["path"] for entry in api.walk("repo", "s1", executor=executor)]
+        
+        assert prefetched == [entry["path"] for entry in api.walk("repo", "s1")]
+        assert len(prefetched) == 10
+
+
+class TestBulkDelete:
+    """Tests for SnapshotsAPI.bulk_delete."""
+    
+    def make_api(self, fail=()):
+        active = {}
+        overlaps = []
+        lock = threading.Lock()
+        
+        def make_request(method, endpoint, **kwargs):
+            repository_name, snapshot_id = endpoint.split("/")[4], endpoint.split("/")[6]
+            with lock:
+                if active.get(repository_name):
+                    overlaps.append(repository_name)
+                active[repository_name] = True
+            time.sleep(0.01)
+            with lock:
+                active[repository_name] = False
+            if snapshot_id in fail:
+                raise APIError("repository is locked", status_code=500)
+            if snapshot_id == "gone":
+                raise NotFoundError("not found", status_code=404)
+            return {"success": True}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        client.resolver = Resolver(client)
+        client.repositories.list.return_value = [{"id": "ra", "name": "repo-a"}, {"id": "rb", "name": "repo-b"}]
+        return SnapshotsAPI(client), client, overlaps
+    
+    def test_serializes_per_repository_and_reports_failures(self):
+        """Test per-repository serialization, failures and progress."""
+        api, client, overlaps = self.make_api(fail=("b2",))
+        events = []
+        
+        result = api.bulk_delete(
+            {"repo-a": ["a1", "a2", "gone"], "repo-b": ["b1", "b2", "b3"]},
+            progress=events.append
+        )
+        
+        assert overlaps == []
+        assert sorted(result["deleted"]) == [
+            ("repo-a", "a1"), ("repo-a", "a2"), ("repo-a", "gone"), ("repo-b", "b1"), ("repo-b", "b3")
+        ]
+        assert [(f["repository"], f["snapshot_id"]) for f in result["failed"]] == [("repo-b", "b2")]
+        assert [e["done"] for e in events] == [1, 2, 3, 4, 5, 6]
+        assert {e["total"] for e in events} == {6}
+    
+    def test_resumes_from_state_file(self, tmp_path):
+        """Test that journaled deletions are skipped on the next run."""
+        state_file = str(tmp_path / "journal")
+        api, client, _ = self.make_api(fail=("b2",))
+        selection = [("repo-a", "a1"), ("repo-b", "b2"), ("repo-a", "a1")]
+        
+        first = api.bulk_delete(selection, state_file=state_file)
+        assert first["deleted"] == [("repo-a", "a1")]
+        
+        api, client, _ = self.make_api()
+        second = api.bulk_delete(selection, state_file=state_file)
+        assert second["skipped"] == [("repo-a", "a1")]
+        assert second["deleted"] == [("repo-b", "b2")]
+        assert client._make_request.call_count == 1
+
+
+
+class TestNameResolution:
+    """Tests for the requests made to address repositories by name or ID."""
+    
+    def make_client(self):
+        def make_request(method, endpoint, **kwargs):
+            if endpoint == "/api/v1/repositories":
+                return [{"id": "rp-1", "shortId": "ab12", "name": "offsite"}]
+            if endpoint.split("/")[4] != "offsite":
+                raise NotFoundError("Repository not found", status_code=404)
+            return []
+        
+        client = ZerobyteClient("http://localhost:4096", "admin", "secret", auto_login=False)
+        client._make_request = Mock(side_effect=make_request)
+        return client
+    
+    def test_names_cost_no_lookup(self):
+        """Test that a name is sent as is on a cold cache."""
+        client = self.make_client()
+        client.snapshots.list("offsite")
+        client.snapshots.get_details("offsite", "s1")
+        assert client._make_request.call_count == 2
+    
+    def test_ids_are_resolved_once(self):
+        """Test that an ID costs one 404, one list request and a retry, then comes from the cache."""
+        client = self.make_client()
+        client.snapshots.list("rp-1")
+        assert [call.args[1] for call in client._make_request.call_args_list] == [
+            "/api/v1/repositories/rp-1/snapshots",
+            "/api/v1/repositories",
+            "/api/v1/repositories/offsite/snapshots",
+        ]
+        client.snapshots.list("ab12")
+        assert client._make_request.call_count == 4
+    
+    def test_unknown_repository_raises(self):
+        """Test that a 404 for an unknown reference is raised after one lookup."""
+        client = self.make_client()
+        with pytest.raises(NotFoundError):
+            client.snapshots.list("missing")
+        assert client._make_request.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,222 @@
+"""
+Unit tests for the Volumes API helpers.
+"""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+import requests
+
+from py_zerobyte import APIError, ValidationError, ZerobyteClient, ZerobyteError
+from py_zerobyte.volumes import VolumesAPI
+
+
+def timed_out():
+    try:
+        raise requests.Timeout("read timed out")
+    except requests.Timeout:
+        raise ZerobyteError("Request failed: read timed out")
+
+
+def timed_out_error():
+    try:
+        timed_out()
+    except ZerobyteError as e:
+        return e
+
+
+class TestHealthSweep:
+    """Tests for VolumesAPI.health_sweep."""
+    
+    def test_reports_and_remounts(self):
+        """Test per-volume results, timeouts and remounting autoRemount volumes."""
+        volumes = [
+            {"name": "ok", "autoRemount": True},
+            {"name": "broken", "autoRemount": True},
+            {"name": "hung", "autoRemount": False},
+        ]
+        timeouts = []
+        
+        def make_request(method, endpoint, timeout=None, **kwargs):
+            timeouts.append(timeout)
+            if endpoint == "/api/v1/volumes":
+                return volumes
+            name, action = endpoint.split("/")[-2:]
+            if action == "mount":
+                return {"status": "mounted"}
+            if name == "hung":
+                timed_out()
+            return {"status": "mounted" if name == "ok" else "error", "error": None}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        
+        results = {r["volume"]["name"]: r for r in VolumesAPI(client).health_sweep(timeout=5, remount=True)}
+        
+        assert results["ok"]["healthy"] and results["ok"]["remount"] is None
+        assert results["broken"]["status"] == "error"
+        assert results["broken"]["remount"]["status"] == "mounted"
+        assert results["hung"]["status"] == "timeout"
+        assert results["hung"]["remount"] is None
+        assert set(timeouts) == {None, 5}
+    
+    def test_checks_run_concurrently(self):
+        """Test that checks overlap instead of running one after another."""
+        barrier = threading.Barrier(3, timeout=5)
+        
+        def make_request(method, endpoint, timeout=None, **kwargs):
+            barrier.wait()
+            return {"status": "mounted"}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        volumes = [{"name": f"v{i}"} for i in range(3)]
+        
+        results = list(VolumesAPI(client).health_sweep(volumes, max_workers=3))
+        
+        assert all(result["healthy"] for result in results)
+
+
+class TestBulkMount:
+    """Tests for VolumesAPI.bulk_mount and bulk_unmount."""
+    
+    def make_api(self, failures=None):
+        """Build a VolumesAPI whose mount calls fail a given number of times per volume."""
+        failures = dict(failures or {})
+        calls = []
+        lock = threading.Lock()
+        
+        def make_request(method, endpoint, timeout=None, **kwargs):
+            if endpoint == "/api/v1/volumes":
+                return [{"name": "nas", "type": "nfs"}, {"name": "bind", "type": "directory"}]
+            name, action = endpoint.split("/")[-2:]
+            with lock:
+                calls.append((name, action))
+                remaining = failures.get(name, 0)
+                if remaining == "fatal":
+                    raise ValidationError("bad config", status_code=400)
+                failures[name] = remaining - 1
+            if remaining > 0:
+                return {"status": "error", "error": "busy"}
+            return {"status": "mounted" if action == "mount" else "unmounted"}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        return VolumesAPI(client), calls
+    
+    def test_ordering_and_retries(self):
+        """Test that constraints are respected and transient failures retried."""
+        api, calls = self.make_api({"nas": 1})
+        events = []
+        
+        result = api.bulk_mount(["bind", "nas"], after={"bind": ["nas"]}, backoff=0, progress=events.append)
+        
+        assert result == {"succeeded": ["nas", "bind"], "failed": [], "skipped": []}
+        assert calls == [("nas", "mount"), ("nas", "mount"), ("bind", "mount")]
+        assert [(e["volume"], e["attempts"]) for e in events] == [("nas", 2), ("bind", 1)]
+        
+        api, calls = self.make_api()
+        api.bulk_unmount(["bind", "nas"], after={"bind": ["nas"]})
+        assert calls == [("bind", "unmount"), ("nas", "unmount")]
+    
+    def test_failures_skip_dependents(self):
+        """Test that permanent failures are not retried and dependents are skipped."""
+        api, calls = self.make_api({"nas": "fatal"})
+        
+        result = api.bulk_mount(
+            [{"name": "nas", "type": "nfs"}, {"name": "bind", "type": "directory"}],
+            after={"bind": ["nas"]}
+        )
+        
+        assert result["failed"][0]["volume"] == "nas"
+        assert result["failed"][0]["attempts"] == 1
+        assert result["skipped"] == ["bind"]
+        assert calls == [("nas", "mount")]
+    
+    def test_only_transient_errors_are_retried(self):
+        """Test that programming errors are not retried and attempts are reported per volume."""
+        api, calls = self.make_api()
+        api.mount = Mock(side_effect=[KeyError("status"), timed_out_error(), {"status": "mounted"}])
+        
+        result = api.bulk_mount(["nas", "bind"], after={"bind": ["nas"]}, backoff=0)
+        
+        failure = result["failed"][0]
+        assert (failure["volume"], failure["attempts"]) == ("nas", 1)
+        assert isinstance(failure["error"], KeyError)
+        assert not hasattr(failure["error"], "attempts")
+        
+        api.mount = Mock(side_effect=[timed_out_error(), APIError("busy", status_code=503), {"status": "mounted"}])
+        result = api.bulk_mount([{"name": "nas", "type": "nfs"}], backoff=0)
+        assert result["succeeded"] == ["nas"]
+        assert api.mount.call_count == 3
+    
+    def test_rejects_cycles(self):
+        """Test that cyclic constraints are rejected before any request."""
+        api, calls = self.make_api()
+        with pytest.raises(ValueError):
+            api.bulk_mount(["nas", "bind"], after={"nas": ["bind"], "bind": ["nas"]})
+        assert calls == []
+
+
+class TestPreflight:
+    """Tests for VolumesAPI.preflight."""
+    
+    def test_report(self):
+        """Test deduplication, per-item timeouts and the pass/fail report."""
+        tested = []
+        lock = threading.Lock()
+        
+        def make_request(method, endpoint, data=None, timeout=None, **kwargs):
+            with lock:
+                tested.append(data["name"])
+            assert timeout == 5
+            if data["name"] == "hung":
+                timed_out()
+            return {"success": data["name"] == "good", "message": "checked " + data["name"]}
+        
+        client = Mock()
+        client._make_request.side_effect = make_request
+        good = {"name": "good", "config": {"backend": "nfs", "server": "nas", "path": "/a"}}
+        configs = [
+            good,
+            {"name": "bad", "config": {"backend": "smb"}},
+            {"config": {"path": "/a", "server": "nas", "backend": "nfs"}, "name": "good"},
+            {"name": "hung", "config": {"backend": "webdav"}},
+        ]
+        updates = []
+        
+        report = VolumesAPI(client).preflight(configs, timeout=5, progress=updates.append)
+        
+        assert sorted(tested) == ["bad", "good", "hung"]
+        assert report["tested"] == 3
+        assert not report["ok"]
+        assert [r["config"]["name"] for r in report["passed"]] == ["good"]
+        assert [r["status"] for r in report["failed"]] == ["failed", "timeout"]
+        assert report["results"][0] is report["results"][2]
+        assert report["results"][1]["message"] == "checked bad"
+        assert [u["done"] for u in updates] == [1, 2, 3]
+
+
+class TestNameResolution:
+    """Tests for the requests made to address volumes by name or ID."""
+    
+    def test_cold_cache_request_count(self):
+        """Test that names cost no lookup and IDs one list request per TTL."""
+        client = ZerobyteClient("http://localhost:4096", "admin", "secret", auto_login=False)
+        client._make_request = Mock(
+            side_effect=lambda method, endpoint, **kwargs:
+                [{"id": 1, "name": "data"}, {"id": 2, "name": "media"}] if endpoint == "/api/v1/volumes" else {}
+        )
+        
+        client.volumes.get("data")
+        assert client._make_request.call_count == 1
+        
+        client.volumes.get(1)
+        client.volumes.mount(2)
+        endpoints = [call.args[1] for call in client._make_request.call_args_list]
+        assert endpoints == ["/api/v1/volumes/data", "/api/v1/volumes", "/api/v1/volumes/data", "/api/v1/volumes/media/mount"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,138 @@
+"""
+Unit tests for the backup schedule watcher.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from py_zerobyte import NotFoundError
+from py_zerobyte.watcher import ScheduleWatcher
+
+
+def schedule(schedule_id, status="success", next_at=None, **extra):
+    item = {"id": schedule_id, "name": f"s{schedule_id}", "lastBackupStatus": status,
+            "nextBackupAt": next_at, "enabled": True}
+    item.update(extra)
+    return item
+
+
+class Clock:
+    def __init__(self, now):
+        self.now = now
+    
+    def __call__(self):
+        return self.now
+
+
+class TestScheduleWatcher:
+    """Tests for ScheduleWatcher."""
+    
+    def test_poll_intervals(self):
+        """Test that running backups are polled often and idle ones near nextBackupAt."""
+        watcher = ScheduleWatcher(Mock(), active_interval=5, idle_interval=300, grace=2)
+        now = 1_700_000_000
+        assert watcher.next_poll_at(schedule(1, "in_progress"), now) == now + 5
+        # nextBackupAt in milliseconds, as the API reports it
+        assert watcher.next_poll_at(schedule(1, next_at=(now + 60) * 1000), now) == now + 62
+        assert watcher.next_poll_at(schedule(1, next_at=now + 5000), now) == now + 300
+        assert watcher.next_poll_at(schedule(1, next_at=now - 10), now) == now + 5
+        assert watcher.next_poll_at(schedule(1, next_at=None), now) == now + 300
+        assert watcher.next_poll_at(schedule(1, next_at=now + 60, enabled=False), now) == now + 300
+    
+    def test_watch_all_uses_bulk_listing(self):
+        """Test change, added and removed events from a single listing per poll."""
+        listings = [
+            [schedule(1, "in_progress"), schedule(2, next_at=10_000)],
+            [schedule(1, "success", lastBackupAt=1004), schedule(3)],
+        ]
+        client = Mock()
+        client.backup_schedules.list_all.side_effect = listings
+        clock = Clock(1000.0)
+        watcher = ScheduleWatcher(client, active_interval=5)
+        received = []
+        watcher.add_listener(received.append)
+        
+        with patch("py_zerobyte.watcher.time.time", clock):
+            assert watcher.poll() == []
+            assert watcher.seconds_until_next_poll() == 5
+            clock.now = 1003.0
+            assert watcher.poll() == []
+            clock.now = 1005.0
+            events = watcher.poll()
+        
+        assert client.backup_schedules.list_all.call_count == 2
+        by_type = {event["type"]: event for event in events}
+        assert by_type["changed"]["changes"] == {
+            "lastBackupStatus": ("in_progress", "success"),
+            "lastBackupAt": (None, 1004),
+        }
+        assert by_type["added"]["schedule_id"] == 3
+        assert by_type["removed"]["schedule_id"] == 2
+        assert received == events
+    
+    def test_explicit_schedules_polled_individually(self):
+        """Test that a few due schedules are fetched one by one, by name or ID."""
+        client = Mock()
+        state = {1: schedule(1, "in_progress"), 2: schedule(2, next_at=1_000_000)}
+        
+        def get_schedule(reference):
+            schedule_id = 1 if reference in (1, "s1") else reference
+            if schedule_id not in state:
+                raise NotFoundError("gone", status_code=404)
+            return dict(state[schedule_id])
+        
+        client.backup_schedules.get_schedule.side_effect = get_schedule
+        clock = Clock(1000.0)
+        watcher = ScheduleWatcher(client, schedules=["s1", 2], active_interval=5)
+        
+        with patch("py_zerobyte.watcher.time.time", clock):
+            watcher.poll()
+            state[1]["lastBackupStatus"] = "error"
+            clock.now = 1006.0
+            events = watcher.poll()
+            del state[1]
+            clock.now = 2000.0
+            removed = watcher.poll()
+        
+        assert client.backup_schedules.list_all.call_count == 0
+        assert [call.args[0] for call in client.backup_schedules.get_schedule.call_args_list][:3] == ["s1", 2, 1]
+        assert events[0]["changes"] == {"lastBackupStatus": ("in_progress", "error")}
+        assert [event["type"] for event in removed] == ["removed"]
+        assert set(watcher.schedules) == {2}
+    
+    def test_unresolved_references_are_reported(self):
+        """Test that names and IDs missing from a bulk listing are reported and matched later by name."""
+        listings = [
+            [schedule(2), schedule(3)],
+            [schedule(1), schedule(2), schedule(3)],
+        ]
+        client = Mock()
+        client.backup_schedules.list_all.side_effect = listings
+        clock = Clock(1000.0)
+        watcher = ScheduleWatcher(client, schedules=["s1", 2, 3, "missing"], idle_interval=300, bulk_threshold=3)
+        
+        with patch("py_zerobyte.watcher.time.time", clock):
+            first = watcher.poll()
+            clock.now = 1300.0
+            second = watcher.poll()
+        
+        assert [(event["type"], event["schedule_id"]) for event in first] == [("error", "s1"), ("error", "missing")]
+        assert isinstance(first[0]["error"], NotFoundError)
+        assert [(event["type"], event["schedule_id"]) for event in second] == [("error", "missing"), ("added", 1)]
+        assert set(watcher.schedules) == {1, 2, 3}
+    
+    def test_unresolved_reference_polled_individually(self):
+        """Test that a name that was never resolved reports an error instead of being dropped."""
+        client = Mock()
+        client.backup_schedules.get_schedule.side_effect = NotFoundError("gone", status_code=404)
+        watcher = ScheduleWatcher(client, schedules=["nope"], bulk_threshold=3)
+        
+        events = watcher.poll()
+        
+        assert [(event["type"], event["schedule_id"]) for event in events] == [("error", "nope")]
+        assert watcher.seconds_until_next_poll() > 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])